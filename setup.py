@@ -24,6 +24,9 @@ setup(
     python_requires=">=3.8.0, < 4",
     install_requires=['aiohttp', 'asyncstdlib', 'yarl'],
     extras_require={
+        "arrow": ['pyarrow'],
+        "numpy": ['numpy'],
         "pil": ['pillow'],
+        "speed": ['orjson'],
     },
 )
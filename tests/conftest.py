@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from voyager import decorators
+
+
+@pytest.fixture
+def run():
+    """Runs a coroutine on a private event loop. Unlike ``asyncio.run`` it
+    leaves the current event loop alone, which resources created outside
+    of a coroutine fall back to
+    """
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+class _Clock(object):
+    """Stands in for the time module of voyager.decorators"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+        self._sleep = asyncio.sleep
+
+    def monotonic(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+    async def sleep(self, delay, *args, **kwargs):
+        """Replaces ``asyncio.sleep`` in tests that wait on the clock, by
+        advancing it instead of waiting in real time
+        """
+        if delay:
+            self.sleeps.append(delay)
+            self.advance(delay)
+        await self._sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(decorators, "time", clock)
+    return clock
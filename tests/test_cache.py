@@ -0,0 +1,232 @@
+import threading
+import time
+
+import pytest
+
+from voyager.cache import BaseCache, DiskCache, MemoryCache
+
+
+def test_empty_cache():
+    cache = MemoryCache(max_size=2)
+    assert len(cache) == 0
+    assert cache.get("missing") is None
+    assert "missing" not in cache
+    assert cache.stats.misses == 1
+
+
+
+def test_incomplete_backends_cannot_be_created():
+    class NoDelete(BaseCache):
+        def __len__(self):
+            return 0
+
+        def clear(self):
+            pass
+
+        def _get(self, key):
+            return None
+
+        def _set(self, key, entry):
+            pass
+
+    with pytest.raises(TypeError):
+        NoDelete()
+
+
+def test_get_returns_fresh_entries():
+    cache = MemoryCache()
+    cache.set("a", {"x": 1}, ttl=60)
+    assert cache.get("a") == {"x": 1}
+    assert "a" in cache
+    assert cache.stats.hits == 1
+
+
+def test_entries_without_ttl_never_expire():
+    cache = MemoryCache()
+    cache.set("a", 1, ttl=None)
+    assert cache.get("a") == 1
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    cache = MemoryCache()
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache.set("a", 1, ttl=10)
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_zero_ttl_is_expired_at_once():
+    cache = MemoryCache()
+    cache.set("a", 1, ttl=0)
+    assert cache.get("a") is None
+
+
+def test_expired_entries_with_validators_can_be_revalidated(monkeypatch):
+    cache = MemoryCache()
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache.set("a", 1, ttl=10, etag='"v1"')
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert cache.get("a") is None
+    stale = cache.get_stale("a")
+    assert stale.etag == '"v1"'
+    assert cache.revalidate("a", stale, ttl=10) == 1
+    assert cache.get("a") == 1
+    assert cache.stats.revalidated == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = MemoryCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_unbounded_cache_keeps_every_entry():
+    cache = MemoryCache(max_size=None)
+    for index in range(500):
+        cache.set(str(index), index)
+    assert len(cache) == 500
+
+
+@pytest.mark.parametrize("route, ttl", [
+    ("notifications", 0),
+    ("neo-lookup", 86400),
+])
+def test_ttl_for_routes(route, ttl):
+    assert MemoryCache().ttl_for(route, {}) == ttl
+
+
+def test_ttl_overrides():
+    assert MemoryCache(ttls={"apod": 5}).ttl_for("apod", {}) == 5
+
+
+@pytest.fixture
+def disk_path(tmp_path):
+    return str(tmp_path / "voyager.cache")
+
+
+def test_disk_cache_empty(disk_path):
+    cache = DiskCache(disk_path)
+    assert len(cache) == 0
+    assert cache.get("missing") is None
+    assert cache.get_stale("missing") is None
+    cache.close()
+
+
+def test_disk_cache_persists_entries(disk_path):
+    cache = DiskCache(disk_path)
+    cache.set("a", {"x": [1, 2]}, ttl=60, etag='"v1"')
+    cache.set("b", "forever", ttl=None)
+    cache.close()
+    cache = DiskCache(disk_path)
+    assert len(cache) == 2
+    assert cache.get("a") == {"x": [1, 2]}
+    assert cache.get_stale("a").etag == '"v1"'
+    assert cache.get("b") == "forever"
+    cache.close()
+
+
+def test_disk_cache_expiry(disk_path, monkeypatch):
+    cache = DiskCache(disk_path)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache.set("plain", 1, ttl=10)
+    cache.set("validated", 2, ttl=10, last_modified="Wed, 01 Jan 2020 00:00:00 GMT")
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert cache.get("plain") is None
+    assert cache.get("validated") is None
+    # Expired entries without validators are dropped, the others kept
+    assert len(cache) == 1
+    assert cache.get_stale("validated").data == 2
+    cache.close()
+
+
+def test_disk_cache_evicts_least_recently_used(disk_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    cache = DiskCache(disk_path, max_size=2)
+
+    def tick():
+        clock[0] += 1
+
+    cache.set("a", 1)
+    tick()
+    cache.set("b", 2)
+    tick()
+    assert cache.get("a") == 1
+    tick()
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    cache.close()
+
+
+def test_disk_cache_reads_do_not_write(disk_path):
+    cache = DiskCache(disk_path)
+    cache.set("a", 1)
+    changes = cache._db.total_changes
+    for _ in range(10):
+        cache.get("a")
+    assert cache._db.total_changes == changes
+    cache.close()
+
+
+def test_disk_cache_access_times_survive_close(disk_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    cache = DiskCache(disk_path, max_size=2)
+    cache.set("a", 1)
+    clock[0] += 1
+    cache.set("b", 2)
+    clock[0] += 1
+    cache.get("a")
+    cache.close()
+    cache = DiskCache(disk_path, max_size=2)
+    clock[0] += 1
+    cache.set("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    cache.close()
+
+
+def test_disk_cache_runs_calls_off_the_event_loop(disk_path, run):
+    cache = DiskCache(disk_path)
+
+    async def main():
+        await cache.call(cache.set, "a", 1, ttl=60)
+        thread = await cache.call(lambda: threading.current_thread())
+        assert thread is not threading.main_thread()
+        return await cache.call(cache.get, "a")
+
+    assert run(main()) == 1
+    cache.close()
+
+
+def test_memory_cache_calls_inline(run):
+    cache = MemoryCache()
+
+    async def main():
+        return await cache.call(lambda: threading.current_thread())
+
+    assert run(main()) is threading.main_thread()
+
+
+def test_disk_cache_clear(disk_path):
+    cache = DiskCache(disk_path)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert len(cache) == 0
+    cache.set("b", 2)
+    assert len(cache) == 1
+    cache.close()
@@ -0,0 +1,79 @@
+import pytest
+
+from voyager.exceptions import VoyagerException
+from voyager.resources import CMEAnalysisIndex
+
+
+def _analysis(id, speed, half_angle, time):
+    return {
+        "associatedCMEID": id,
+        "speed": speed,
+        "halfAngle": half_angle,
+        "time21_5": time,
+    }
+
+
+ANALYSES = [
+    _analysis("a", 500.0, 30.0, "2020-01-01T00:00Z"),
+    _analysis("b", 1600.0, 45.0, "2020-06-01T12:00Z"),
+    _analysis("c", None, 20.0, "2021-01-01T00:00Z"),
+    _analysis("d", 2000.0, None, None),
+    _analysis("e", 900.0, 60.0, "2020-06-01T12:00:00"),
+]
+
+
+def _ids(analyses):
+    return [analysis.to_dict["associatedCMEID"] for analysis in analyses]
+
+
+@pytest.fixture
+def index():
+    return CMEAnalysisIndex(ANALYSES)
+
+
+def test_empty_index():
+    index = CMEAnalysisIndex([])
+    assert len(index) == 0
+    assert index.query() == []
+    assert index.query(speed=(0, None)) == []
+    assert index.range("time21_5", "2020-01-01") == []
+
+
+def test_query_without_ranges_returns_everything(index):
+    assert _ids(index.query()) == ["a", "b", "c", "d", "e"]
+
+
+def test_range_is_sorted_by_field(index):
+    assert _ids(index.range("speed")) == ["a", "e", "b", "d"]
+    assert _ids(index.range("speed", 900, 1600)) == ["e", "b"]
+    assert _ids(index.range("speed", 900, 1600, inclusive=False)) == []
+
+
+def test_query_skips_missing_values(index):
+    assert _ids(index.query(speed=(None, None))) == ["a", "b", "d", "e"]
+    assert _ids(index.query(half_angle=(None, None))) == ["a", "b", "c", "e"]
+
+
+def test_query_combines_ranges_in_index_order(index):
+    assert _ids(index.query(speed=(800, None), half_angle=(None, 50))) == ["b"]
+    assert _ids(index.query(speed=(400, None), half_angle=(20, 60))) == ["a", "b", "e"]
+    assert _ids(index.query(speed=(400, None), half_angle=(20, 60),
+                            inclusive=False)) == ["a", "b"]
+
+
+def test_query_compares_times_in_utc(index):
+    assert _ids(index.query(time21_5=("2020-06-01T12:00Z", "2020-06-01T12:00"))) == ["b", "e"]
+    assert _ids(index.query(time21_5=("2020-03-01", None),
+                            speed=(1000, None))) == ["b"]
+
+
+def test_query_with_no_matches(index):
+    assert index.query(speed=(5000, None)) == []
+    assert index.query(speed=(0, None), half_angle=(90, None)) == []
+
+
+def test_unknown_field(index):
+    with pytest.raises(VoyagerException):
+        index.query(latitude=(0, 10))
+    with pytest.raises(VoyagerException):
+        index.range("latitude")
@@ -0,0 +1,126 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from voyager.resources import CADResource, FireballResource  # noqa: E402
+
+CAD_FIELDS = ["des", "orbit_id", "jd", "cd", "dist", "dist_min", "dist_max",
+              "v_rel", "v_inf", "t_sigma_f", "h", "diameter", "diameter_sigma"]
+CAD_ROWS = [
+    ["2020 AB", "3", "2458849.5", "2020-Jan-01 00:00", "0.01", "0.009", "0.011",
+     "5.1", "5.0", "< 00:01", "25.1", "0.05", "0.01"],
+    ["2020 AC", "2", "2458850.5", "2020-Jan-02 12:34", "", "0.009", "0.011",
+     "5.1", "5.0", "00:01", "null", None, "null"],
+    ["2020 AD", "1", "", "not a date", "0.02", "0.019", "0.021",
+     "6.2", "6.0", "00:02", "24.0", "0.1", ""],
+]
+
+
+@pytest.fixture
+def cad():
+    return CADResource({"signature": {}, "count": str(len(CAD_ROWS)),
+                        "fields": CAD_FIELDS, "data": CAD_ROWS})
+
+
+def test_cad_column_dtypes(cad):
+    columns = cad.to_columns()
+    assert list(columns) == CAD_FIELDS
+    for field in ["jd", "dist", "dist_min", "dist_max", "v_rel", "v_inf",
+                  "h", "diameter", "diameter_sigma"]:
+        assert columns[field].dtype == np.float64
+    assert columns["cd"].dtype == np.dtype("datetime64[m]")
+    assert columns["des"].dtype.kind == "U"
+    assert list(columns["t_sigma_f"]) == ["< 00:01", "00:01", "00:02"]
+    assert list(columns["dist"][[0, 2]]) == [0.01, 0.02]
+
+
+def test_cad_missing_numbers_are_nan(cad):
+    columns = cad.to_columns()
+    # Blank, "null" and None cells
+    assert np.isnan(columns["dist"]).tolist() == [False, True, False]
+    assert np.isnan(columns["h"]).tolist() == [False, True, False]
+    assert np.isnan(columns["diameter"]).tolist() == [False, True, False]
+    assert np.isnan(columns["diameter_sigma"]).tolist() == [False, True, True]
+    assert np.isnan(columns["jd"]).tolist() == [False, False, True]
+
+
+def test_cad_unparseable_dates_are_nat(cad):
+    dates = cad.to_columns()["cd"]
+    assert list(dates[:2]) == [np.datetime64("2020-01-01T00:00"),
+                               np.datetime64("2020-01-02T12:34")]
+    assert np.isnat(dates[2])
+
+
+def test_cad_arrow_matches_the_columns(cad):
+    pytest.importorskip("pyarrow")
+    table, columns = cad.to_arrow(), cad.to_columns()
+    assert table.column("cd").to_pylist()[2] is None
+    for field in ["jd", "dist", "h", "diameter", "diameter_sigma"]:
+        values = table.column(field).to_pylist()
+        assert [value is None for value in values] == np.isnan(columns[field]).tolist()
+
+
+def test_cad_without_rows():
+    columns = CADResource({"signature": {}, "count": "0", "fields": CAD_FIELDS,
+                           "data": []}).to_columns()
+    assert all(len(column) == 0 for column in columns.values())
+    assert columns["dist"].dtype == np.float64
+
+
+FIREBALL_FIELDS = ["date", "energy", "impact-e", "lat", "lat-dir", "lon",
+                   "lon-dir", "alt", "vel"]
+FIREBALL_ROWS = [
+    ["2020-01-01 00:00:00", "2.1", "0.08", "10.5", "S", "20.1", "E", "30.2", "15"],
+    ["2020-01-02 03:04:05", "1.0", "", "4.0", "N", "5.0", "W", "", None],
+    ["2020-01-03 00:00:00", None, "null", None, None, "7.5", "W", "20", ""],
+]
+
+
+@pytest.fixture
+def fireball():
+    return FireballResource({"signature": {}, "count": str(len(FIREBALL_ROWS)),
+                             "fields": FIREBALL_FIELDS, "data": FIREBALL_ROWS})
+
+
+def test_fireball_column_dtypes(fireball):
+    columns = fireball.to_columns()
+    assert list(columns) == FIREBALL_FIELDS
+    for field in ["energy", "impact-e", "lat", "lon", "alt", "vel"]:
+        assert columns[field].dtype == np.float64
+    assert columns["date"].dtype == np.dtype("datetime64[s]")
+    assert columns["date"][1] == np.datetime64("2020-01-02T03:04:05")
+    assert list(columns["lon-dir"]) == ["E", "W", "W"]
+
+
+def test_fireball_coordinates_are_signed(fireball):
+    columns = fireball.to_columns()
+    # South and west are negative
+    assert columns["lat"][:2].tolist() == [-10.5, 4.0]
+    assert np.isnan(columns["lat"][2])
+    assert columns["lon"].tolist() == [20.1, -5.0, -7.5]
+
+
+def test_fireball_missing_values_are_nan(fireball):
+    columns = fireball.to_columns()
+    assert np.isnan(columns["energy"]).tolist() == [False, False, True]
+    assert np.isnan(columns["impact-e"]).tolist() == [False, True, True]
+    assert np.isnan(columns["vel"]).tolist() == [False, True, True]
+    assert np.isnan(columns["alt"]).tolist() == [False, True, False]
+
+
+def test_fireball_coordinates_without_directions():
+    fields = ["date", "lat", "lon"]
+    columns = FireballResource({"signature": {}, "count": "1", "fields": fields,
+                                "data": [["2020-01-01 00:00:00", "1.5", "2.5"]]}).to_columns()
+    assert columns["lat"].tolist() == [1.5]
+    assert columns["lon"].tolist() == [2.5]
+
+
+def test_fireball_arrow_matches_the_columns(fireball):
+    pytest.importorskip("pyarrow")
+    table, columns = fireball.to_arrow(), fireball.to_columns()
+    for field in ["lat", "lon", "energy", "vel"]:
+        values = table.column(field).to_pylist()
+        assert [value is None for value in values] == np.isnan(columns[field]).tolist()
+        assert [value for value in values if value is not None] == \
+            columns[field][~np.isnan(columns[field])].tolist()
@@ -0,0 +1,96 @@
+import datetime
+
+import pytest
+
+from voyager.dates import from_julian, parse_datetime, parse_datetimes
+from voyager.exceptions import VoyagerException
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2020-01-02", datetime.datetime(2020, 1, 2)),
+    ("2020-01-02T03:04Z", datetime.datetime(2020, 1, 2, 3, 4)),
+    ("2020-01-02T03:04:05+02:00", datetime.datetime(2020, 1, 2, 1, 4, 5)),
+    ("2020-01-02 03:04:05", datetime.datetime(2020, 1, 2, 3, 4, 5)),
+    ("2020-Jan-02 03:04", datetime.datetime(2020, 1, 2, 3, 4)),
+    ("Jan 2020", datetime.datetime(2020, 1, 1)),
+    ("2451545.0", datetime.datetime(2000, 1, 1, 12)),
+    (2451545.0, datetime.datetime(2000, 1, 1, 12)),
+    (datetime.date(2020, 1, 2), datetime.datetime(2020, 1, 2)),
+])
+def test_parse_datetime(value, expected):
+    assert parse_datetime(value) == expected
+
+
+@pytest.mark.parametrize("value", [None, ""])
+def test_parse_datetime_empty(value):
+    assert parse_datetime(value) is None
+
+
+def test_parse_datetime_is_always_naive():
+    aware = datetime.datetime(2020, 1, 2, 3, tzinfo=datetime.timezone(datetime.timedelta(hours=1)))
+    assert parse_datetime(aware) == datetime.datetime(2020, 1, 2, 2)
+    assert parse_datetime("2020-01-02T03:04Z").tzinfo is None
+    assert parse_datetime("2020-01-02T03:04Z") < parse_datetime("2020-01-02T03:05")
+
+
+def test_parse_datetime_rejects_unknown_formats():
+    with pytest.raises(VoyagerException):
+        parse_datetime("next tuesday")
+
+
+def test_from_julian():
+    assert from_julian(2440587.5) == datetime.datetime(1970, 1, 1)
+
+
+@pytest.mark.parametrize("values", [[], np.array([], dtype=str), np.array([])])
+def test_parse_datetimes_empty(values):
+    column = parse_datetimes(values, unit="m")
+    assert column.dtype == np.dtype("datetime64[m]")
+    assert column.size == 0
+
+
+def test_parse_datetimes_strings():
+    column = parse_datetimes([
+        "2020-01-02T03:04Z",
+        "2020-01-02T03:04:05+00:00",
+        "2020-Jan-02 03:04",
+        "2020-01-02 03:04:05",
+        None,
+        "",
+        "null",
+    ])
+    assert column.dtype == np.dtype("datetime64[s]")
+    assert list(column[:4]) == [
+        np.datetime64("2020-01-02T03:04:00"),
+        np.datetime64("2020-01-02T03:04:05"),
+        np.datetime64("2020-01-02T03:04:00"),
+        np.datetime64("2020-01-02T03:04:05"),
+    ]
+    assert np.isnat(column[4:]).all()
+
+
+def test_parse_datetimes_julian():
+    column = parse_datetimes(np.array([2440587.5, np.nan]), unit="D")
+    assert column[0] == np.datetime64("1970-01-01")
+    assert np.isnat(column[1])
+
+
+def test_parse_datetimes_matches_parse_datetime():
+    values = ["2021-Mar-04 05:06", "2021-03-04T05:06Z"]
+    expected = [np.datetime64(parse_datetime(value), "m") for value in values]
+    assert list(parse_datetimes(values, unit="m")) == expected
+
+
+def test_sentry_removed_is_parsed_on_access():
+    from voyager.resources import SentryResource
+
+    resource = SentryResource({"removed": "2021-03-04 05:06:07"})
+    assert resource.removed == "2021-03-04 05:06:07"
+    assert resource.removed_datetime == datetime.datetime(2021, 3, 4, 5, 6, 7)
+    assert SentryResource({}).removed_datetime is None
+    unknown = SentryResource({"removed": "sometime"})
+    assert unknown.removed == "sometime"
+    with pytest.raises(VoyagerException):
+        unknown.removed_datetime
@@ -0,0 +1,145 @@
+import pytest
+
+from voyager.exceptions import VoyagerException
+from voyager.resources import (CMEResource, DonkiGraph, FLRResource,
+                               GSTResource, WSAResource)
+from voyager.voyager import Client
+
+
+def _linked(*ids):
+    return [{"activityID": id} for id in ids]
+
+
+FLARES = [
+    FLRResource({"flrID": "F1", "beginTime": "2020-01-01T00:00Z",
+                 "linkedEvents": _linked("C1")}),
+]
+CMES = [
+    CMEResource({"activityID": "C0", "startTime": "2019-12-31T00:00Z",
+                 "linkedEvents": _linked("C1")}),
+    # X9 is linked but was not returned in this window
+    CMEResource({"activityID": "C1", "startTime": "2020-01-01T01:00Z",
+                 "linkedEvents": _linked("F1", "G1", "X9")}),
+]
+STORMS = [
+    GSTResource({"gstID": "G1", "startTime": "2020-01-03T00:00Z",
+                 "linkedEvents": _linked("C1", "G2")}),
+    GSTResource({"gstID": "G2", "startTime": "2020-01-10T00:00Z",
+                 "linkedEvents": None}),
+]
+SIMULATIONS = [
+    WSAResource({"simulationID": "W1", "modelCompletionTime": "2020-01-01T05:00Z",
+                 "cmeInputs": [{"cmeid": "C1"}]}),
+]
+
+
+def _ids(events):
+    return [event.to_dict.get("activityID") or event.to_dict.get("flrID")
+            or event.to_dict.get("gstID") or event.to_dict.get("simulationID")
+            for event in events]
+
+
+@pytest.fixture
+def graph():
+    return DonkiGraph({"flr": FLARES, "cme": CMES, "gst": STORMS, "wsa-enlil": SIMULATIONS})
+
+
+def test_add_indexes_events_by_id(graph):
+    assert len(graph) == 6
+    assert "C1" in graph and "X9" not in graph
+    assert graph["G1"] is STORMS[0]
+    assert graph.get("X9") is None
+    assert graph.type_of("W1") == "wsa-enlil"
+    assert _ids(graph.events("cme")) == ["C0", "C1"]
+    with pytest.raises(VoyagerException):
+        graph["X9"]
+
+
+def test_add_rejects_unknown_routes():
+    with pytest.raises(VoyagerException):
+        DonkiGraph({"apod": []})
+
+
+def test_events_without_an_id_are_skipped():
+    graph = DonkiGraph({"cme": [CMEResource({"startTime": "2020-01-01T00:00Z"})]})
+    assert len(graph) == 0
+
+
+def test_linked_is_symmetric(graph):
+    assert _ids(graph.linked("C1")) == ["C0", "F1", "G1", "W1"]
+    assert _ids(graph.linked("W1")) == ["C1"]
+    assert _ids(graph.linked("G2")) == ["G1"]
+
+
+def test_missing_events_are_never_returned(graph):
+    assert "X9" not in _ids(graph.linked("C1"))
+    assert "X9" not in _ids(graph.traverse("F1"))
+    # The events that link to a missing event can still be looked up
+    assert _ids(graph.linked("X9")) == ["C1"]
+    assert graph.linked("Z0") == []
+
+
+def test_links_to_missing_events_resolve_once_added(graph):
+    assert _ids(graph.linked("C1")) == ["C0", "F1", "G1", "W1"]
+    graph.add("cme", [CMEResource({"activityID": "X9", "startTime": "2020-01-02T00:00Z"})])
+    assert _ids(graph.linked("C1")) == ["C0", "F1", "G1", "W1", "X9"]
+    assert _ids(graph.linked("X9")) == ["C1"]
+
+
+def test_traverse_is_breadth_first(graph):
+    assert _ids(graph.traverse("F1")) == ["C1", "C0", "G1", "W1", "G2"]
+
+
+def test_traverse_filters_types(graph):
+    assert _ids(graph.traverse("F1", types=["gst"])) == ["G1", "G2"]
+    assert _ids(graph.traverse("F1", types=["wsa-enlil", "cme"])) == ["C1", "C0", "W1"]
+
+
+def test_traverse_max_depth(graph):
+    assert _ids(graph.traverse("F1", max_depth=1)) == ["C1"]
+    assert _ids(graph.traverse("F1", max_depth=2)) == ["C1", "C0", "G1", "W1"]
+    assert graph.traverse("F1", max_depth=0) == []
+
+
+def test_traverse_downstream(graph):
+    assert _ids(graph.traverse("C1", downstream=True)) == ["G1", "W1", "G2"]
+    assert _ids(graph.traverse("C1", types=["gst"], downstream=True)) == ["G1", "G2"]
+    assert graph.traverse("G2", downstream=True) == []
+
+
+def test_traverse_from_a_missing_event(graph):
+    assert _ids(graph.traverse("X9", max_depth=1)) == ["C1"]
+    assert _ids(graph.traverse("X9", types=["gst"])) == ["G1", "G2"]
+    assert graph.traverse("Z0") == []
+
+
+def test_time_of(graph):
+    assert graph.time_of("G1").day == 3
+    assert graph.time_of("X9") is None
+
+
+class _Client(Client):
+    def __init__(self, events):
+        super(_Client, self).__init__(cache_size=0)
+        self.events = events
+        self.fetched = []
+
+    async def _donki(self, route, start_date=None, end_date=None, **options):
+        self.fetched.append((route, start_date, end_date))
+        return self.events.get(route, [])
+
+
+def test_donki_graph_fetches_every_route(run):
+    async def main():
+        client = _Client({"cme": CMES, "gst": STORMS})
+        graph = await client.donki_graph("2020-01-01", "2020-01-31", types=["cme", "gst"])
+        assert sorted(client.fetched) == [("cme", "2020-01-01", "2020-01-31"),
+                                          ("gst", "2020-01-01", "2020-01-31")]
+        assert _ids(graph.traverse("C0", types=["gst"])) == ["G1", "G2"]
+        everything = _Client({})
+        await everything.donki_graph()
+        assert len(everything.fetched) == 9
+        with pytest.raises(VoyagerException):
+            await client.donki_graph(types=["apod"])
+
+    run(main())
@@ -0,0 +1,186 @@
+import asyncio
+import io
+import os
+
+import pytest
+
+from voyager.cache import FileStore
+from voyager.exceptions import HTTPException, VoyagerException
+from voyager.resources import EPICResource
+from voyager.voyager import Client
+
+
+def _image(identifier, stream=None):
+    return EPICResource({"identifier": identifier, "date": "2020-01-01 00:00:00"},
+                        stream=stream)
+
+
+class _FakeHTTP(object):
+    """Stands in for HTTPClient, streaming a few chunks per URL and failing
+    the URLs of the identifiers in ``failing``
+    """
+
+    def __init__(self, failing=(), blocked=()):
+        self.failing = failing
+        self.blocked = blocked
+        self.started = []
+        self.cancelled = []
+        self.finished = []
+
+    async def stream(self, url, chunk_size=65536):
+        self.started.append(url)
+        try:
+            for index in range(3):
+                if any(name in url for name in self.blocked):
+                    # Waits until the download is cancelled
+                    await asyncio.Event().wait()
+                await asyncio.sleep(0)
+                if any(name in url for name in self.failing):
+                    raise HTTPException(404)
+                yield f"{url}:{index};".encode()
+        except asyncio.CancelledError:
+            self.cancelled.append(url)
+            raise
+        self.finished.append(url)
+
+
+def _client(http):
+    client = Client()
+    client._http_client = http
+    return client
+
+
+def test_download_stores_each_variant(tmp_path, run):
+    async def main():
+        http = _FakeHTTP()
+        paths = await _client(http).epic_download(
+            [_image("a"), _image("b")], store=str(tmp_path),
+            formats=["png", "JPG"], modes=["natural"],
+        )
+        assert sorted(paths) == [
+            ("a", "natural", "jpg"), ("a", "natural", "png"),
+            ("b", "natural", "jpg"), ("b", "natural", "png"),
+        ]
+        for path in paths.values():
+            assert os.path.exists(path)
+        again = await _client(http).epic_download([_image("a")], store=str(tmp_path))
+        assert again[("a", "natural", "png")] == paths[("a", "natural", "png")]
+        assert len(http.started) == 4
+    run(main())
+
+
+def test_download_nothing(tmp_path, run):
+    async def main():
+        assert await _client(_FakeHTTP()).epic_download([], store=str(tmp_path)) == {}
+    run(main())
+
+
+def test_failed_download_cancels_the_others(tmp_path, run):
+    async def main():
+        http = _FakeHTTP(failing=["bad"], blocked=["blocked"])
+        store = FileStore(str(tmp_path))
+        with pytest.raises(HTTPException):
+            await _client(http).epic_download(
+                [_image("blocked1"), _image("bad"), _image("blocked2")], store=store,
+            )
+        assert len(http.cancelled) == 2
+        assert http.finished == []
+        # Nothing is left half written once the error has been raised
+        assert [name for name in os.listdir(str(tmp_path)) if name.endswith(".part")] == []
+        assert os.listdir(os.path.join(str(tmp_path), "urls")) == []
+    run(main())
+
+
+def test_cancelled_store_leaves_no_temporary_file(tmp_path, run):
+    async def main():
+        http = _FakeHTTP(blocked=["blocked"])
+        store = FileStore(str(tmp_path))
+        task = asyncio.ensure_future(store.store("blocked", http.stream("blocked")))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert http.cancelled == ["blocked"]
+        assert [name for name in os.listdir(str(tmp_path)) if name.endswith(".part")] == []
+    run(main())
+
+
+
+@pytest.mark.parametrize("format, mode, url", [
+    ("png", "natural", "natural/2020/01/01/png/epic_1b_a.png"),
+    ("jpg", "enhanced", "enhanced/2020/01/01/jpg/epic_RGB_a.jpg"),
+    ("thumb", "natural", "natural/2020/01/01/thumbs/epic_1b_a.jpg"),
+    ("THUMB", "Enhanced", "enhanced/2020/01/01/thumbs/epic_RGB_a.jpg"),
+])
+def test_archive_urls(format, mode, url):
+    assert _image("a").image.url(format=format, mode=mode) == \
+        "https://epic.gsfc.nasa.gov/archive/" + url
+
+
+@pytest.mark.parametrize("options", [{"formats": ["gif"]}, {"modes": ["raw"]}])
+def test_download_rejects_unknown_variants(tmp_path, options, run):
+    async def main():
+        http = _FakeHTTP()
+        with pytest.raises(VoyagerException):
+            await _client(http).epic_download([_image("a")], store=str(tmp_path), **options)
+        assert http.started == []
+    run(main())
+
+
+def test_image_reads_through_the_client_stream(run):
+    async def main():
+        http = _FakeHTTP()
+        image = _image("a", stream=http.stream).image
+        data = await image._read(image.url())
+        assert data.startswith(image.url().encode())
+        assert http.started == [image.url()]
+    run(main())
+
+
+def test_image_without_a_client_stream(run):
+    async def main():
+        image = _image("a").image
+        with pytest.raises(VoyagerException):
+            await image._read(image.url())
+    run(main())
+
+
+def _png():
+    Image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    Image.new("RGB", (2, 3)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_images_are_decoded_on_demand(run):
+    png, urls = _png(), []
+
+    async def stream(url):
+        urls.append(url)
+        yield png
+
+    async def main():
+        image = _image("a", stream=stream).image
+        assert (await image.get_image()).size == (2, 3)
+        assert (await image.get_image()).size == (2, 3)
+        # Nothing decoded is kept, so the image is downloaded again
+        assert len(urls) == 2
+        assert not hasattr(image, "_images")
+    run(main())
+
+
+def test_images_are_decoded_from_the_store(tmp_path, run):
+    png, urls = _png(), []
+
+    async def stream(url):
+        urls.append(url)
+        yield png
+
+    async def main():
+        image = _image("a", stream=stream).image
+        first = await image.get_image(store=str(tmp_path))
+        second = await image.get_image(store=FileStore(str(tmp_path)))
+        assert first.size == second.size == (2, 3)
+        assert urls == [image.url()]
+        assert first.filename == FileStore(str(tmp_path)).lookup(image.url())
+    run(main())
@@ -0,0 +1,184 @@
+import math
+import warnings
+from typing import Optional
+
+import pytest
+
+from voyager.exceptions import VoyagerException
+
+np = pytest.importorskip("numpy")
+
+from voyager.resources.exoplanet import ExoplanetTable  # noqa: E402
+
+
+def _planet(name, method, period, count, distance):
+    return {
+        "pl_name": name,
+        "pl_discmethod": method,
+        "pl_orbper": period,
+        "pl_pnum": count,
+        "st_dist": distance,
+    }
+
+
+PLANETS = [
+    _planet("a", "Transit", 3.0, 1, 10.0),
+    _planet("b", "Transit", 12.0, 2, None),
+    _planet("c", "Radial Velocity", None, 1, 5.0),
+    _planet("d", "Radial Velocity", 7.5, 3, 20.0),
+    _planet("e", None, 1.0, 1, 15.0),
+    _planet("f", "Imaging", None, 2, None),
+]
+
+TYPES = {
+    "pl_name": Optional[str],
+    "pl_discmethod": Optional[str],
+    "pl_orbper": Optional[float],
+    "pl_pnum": Optional[int],
+    "st_dist": Optional[float],
+}
+
+
+@pytest.fixture
+def table():
+    return ExoplanetTable.from_rows(PLANETS, TYPES)
+
+
+def _names(table):
+    return list(table.column("pl_name"))
+
+
+def test_columns_are_typed(table):
+    assert len(table) == 6
+    assert table.columns == list(TYPES)
+    assert table["pl_pnum"].dtype == np.int64
+    assert table["pl_orbper"].dtype == np.float64
+    assert np.isnan(table["pl_orbper"][2])
+    assert table["pl_name"].dtype == object
+    assert table["pl_discmethod"][4] is None
+
+
+def test_int_columns_with_missing_values_are_float():
+    table = ExoplanetTable.from_rows([{"pl_pnum": 1}, {"pl_pnum": None}], TYPES)
+    assert table["pl_pnum"].dtype == np.float64
+    assert np.isnan(table["pl_pnum"][1])
+
+
+def test_empty_table_takes_its_columns_from_the_types():
+    table = ExoplanetTable.from_rows([], TYPES)
+    assert len(table) == 0
+    assert table.columns == list(TYPES)
+    assert table.aggregate(n=("pl_name", "count")) == {"n": 0}
+
+
+def test_unknown_column(table):
+    with pytest.raises(VoyagerException):
+        table.column("pl_mass")
+    with pytest.raises(VoyagerException):
+        table.select("pl_name", "pl_mass")
+
+
+@pytest.mark.parametrize("op, value, expected", [
+    ("==", 3.0, ["a"]),
+    ("!=", 3.0, ["b", "d", "e"]),
+    ("<", 7.5, ["a", "e"]),
+    ("<=", 7.5, ["a", "d", "e"]),
+    (">", 3.0, ["b", "d"]),
+    (">=", 3.0, ["a", "b", "d"]),
+])
+def test_comparisons_skip_missing_values(table, op, value, expected):
+    assert _names(table.where("pl_orbper", op, value)) == expected
+
+
+def test_between_is_inclusive(table):
+    assert _names(table.where("pl_orbper", "between", 3.0, 7.5)) == ["a", "d"]
+    with pytest.raises(VoyagerException):
+        table.where("pl_orbper", "between", 3.0)
+
+
+def test_in(table):
+    assert _names(table.where("pl_discmethod", "in", "Transit", "Imaging")) == ["a", "b", "f"]
+    assert _names(table.where("pl_pnum", "in", 2, 3)) == ["b", "d", "f"]
+
+
+def test_null_and_notnull(table):
+    assert _names(table.where("pl_orbper", "null")) == ["c", "f"]
+    assert _names(table.where("pl_discmethod", "null")) == ["e"]
+    assert _names(table.where("st_dist", "notnull")) == ["a", "c", "d", "e"]
+
+
+def test_invalid_conditions(table):
+    with pytest.raises(VoyagerException):
+        table.where("pl_orbper", "~", 1.0)
+    with pytest.raises(VoyagerException):
+        table.where("pl_orbper", "==", 1.0, 2.0)
+
+
+def test_queries_chain(table):
+    result = table.where("pl_discmethod", "notnull").where("pl_pnum", ">=", 2)
+    assert _names(result) == ["b", "d", "f"]
+    assert _names(table) == ["a", "b", "c", "d", "e", "f"]
+
+
+def test_select(table):
+    result = table.where("pl_name", "==", "d").select("st_dist", "pl_name")
+    assert result.columns == ["st_dist", "pl_name"]
+    assert list(result) == [{"st_dist": 20.0, "pl_name": "d"}]
+    assert list(result.to_dict()) == ["st_dist", "pl_name"]
+
+
+def test_order_by_puts_missing_values_last(table):
+    assert _names(table.order_by("st_dist")) == ["c", "a", "e", "d", "b", "f"]
+    assert _names(table.order_by("st_dist", descending=True)) == ["d", "e", "a", "c", "b", "f"]
+
+
+def test_order_by_text_columns(table):
+    assert _names(table.order_by("pl_discmethod")) == ["f", "c", "d", "a", "b", "e"]
+
+
+def test_order_by_several_columns(table):
+    result = table.order_by("pl_discmethod", "pl_orbper")
+    assert _names(result) == ["f", "d", "c", "a", "b", "e"]
+
+
+def test_limit(table):
+    assert _names(table.order_by("pl_orbper").limit(2)) == ["e", "a"]
+    assert len(table.limit(0)) == 0
+
+
+def test_aggregate_ignores_missing_values(table):
+    result = table.aggregate(
+        n=("pl_orbper", "count"),
+        total=("pl_orbper", "sum"),
+        mean=("pl_orbper", "mean"),
+        median=("pl_orbper", "median"),
+        low=("pl_orbper", "min"),
+        high=("pl_orbper", "max"),
+        spread=("pl_orbper", "std"),
+    )
+    assert result["n"] == 4
+    assert result["total"] == 23.5
+    assert result["mean"] == 5.875
+    assert result["median"] == 5.25
+    assert (result["low"], result["high"]) == (1.0, 12.0)
+    assert result["spread"] == pytest.approx(np.std([3.0, 12.0, 7.5, 1.0]))
+
+
+def test_grouped_aggregate(table):
+    with warnings.catch_warnings():
+        # The Imaging group has no periods, which must not warn
+        warnings.simplefilter("error")
+        result = table.aggregate(by="pl_discmethod",
+                                 n=("pl_name", "count"),
+                                 period=("pl_orbper", "median"),
+                                 mean=("pl_orbper", "mean"))
+    assert list(result["pl_discmethod"]) == ["Imaging", "Radial Velocity", "Transit"]
+    assert list(result["n"]) == [1, 2, 2]
+    assert math.isnan(result["period"][0])
+    assert list(result["period"][1:]) == [7.5, 7.5]
+    assert math.isnan(result["mean"][0])
+
+
+def test_unsupported_aggregate(table):
+    with pytest.raises(VoyagerException):
+        table.aggregate(mode=("pl_orbper", "mode"))
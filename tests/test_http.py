@@ -0,0 +1,313 @@
+import asyncio
+
+import pytest
+
+from voyager.cache import DiskCache, MemoryCache
+from voyager.exceptions import HTTPException
+from voyager.http import HTTPClient
+from voyager.retry import RetryPolicy
+
+
+class _Response(object):
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+
+
+class _FakeClient(HTTPClient):
+    """HTTPClient whose network layer answers from a list of
+    ``(status, headers, data)`` replies, recording the request headers
+    """
+
+    def __init__(self, replies, delay=0, **kwargs):
+        super(_FakeClient, self).__init__(
+            retry_policy=RetryPolicy(max_attempts=1), **kwargs
+        )
+        self.replies = list(replies)
+        self.delay = delay
+        self.sent = []
+
+    async def _fetch(self, url, method=None, headers=None):
+        self.sent.append(dict(headers or {}))
+        await asyncio.sleep(self.delay)
+        status, headers, data = self.replies.pop(0)
+        if isinstance(data, Exception):
+            raise data
+        return _Response(status, headers), data
+
+
+_CME = [{"activityID": "2020-01-01-CME-001", "startTime": "2020-01-01T00:00Z"}]
+
+
+@pytest.fixture(params=["memory", "disk"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryCache()
+    else:
+        cache = DiskCache(str(tmp_path / "voyager.cache"))
+        yield cache
+        cache.close()
+
+
+def _ids(resources):
+    return [resource.to_dict["activityID"] for resource in resources]
+
+
+def test_fresh_responses_are_served_from_the_cache(cache, run):
+    async def main():
+        client = _FakeClient([(200, {"ETag": '"v1"'}, _CME)], cache=cache)
+        first = await client.request("cme", "GET", startDate="2020-01-01")
+        second = await client.request("cme", "GET", startDate="2020-01-01")
+        assert _ids(first) == _ids(second) == ["2020-01-01-CME-001"]
+        assert len(client.sent) == 1
+    run(main())
+
+
+def test_not_modified_revalidates_the_stale_entry(cache, run):
+    async def main():
+        client = _FakeClient([
+            (200, {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2020 00:00:00 GMT"}, _CME),
+            (304, {}, None),
+        ], cache=cache)
+        await client.request("notifications", "GET", type="all")
+        # Notifications have a zero TTL, so the second request is conditional
+        result = await client.request("notifications", "GET", type="all")
+        assert client.sent[1] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 01 Jan 2020 00:00:00 GMT",
+        }
+        assert [resource.code for resource in result] == [200]
+        assert cache.stats.revalidated == 1
+    run(main())
+
+
+def test_revalidate_skips_fresh_entries(cache, run):
+    async def main():
+        client = _FakeClient([(200, {"ETag": '"v1"'}, _CME), (304, {}, None)], cache=cache)
+        await client.request("cme", "GET", startDate="2020-01-01")
+        result = await client.request("cme", "GET", revalidate=True, startDate="2020-01-01")
+        assert client.sent == [{}, {"If-None-Match": '"v1"'}]
+        assert _ids(result) == ["2020-01-01-CME-001"]
+    run(main())
+
+
+def test_errors_are_not_cached(cache, run):
+    async def main():
+        client = _FakeClient([(400, {}, {"error": "bad"}), (200, {}, _CME)], cache=cache)
+        with pytest.raises(HTTPException):
+            await client.request("cme", "GET", startDate="2020-01-01")
+        assert _ids(await client.request("cme", "GET", startDate="2020-01-01")) == [
+            "2020-01-01-CME-001"
+        ]
+    run(main())
+
+
+def test_identical_concurrent_requests_share_one_fetch(run):
+    async def main():
+        client = _FakeClient([(200, {}, _CME)], delay=0.01, cache_size=0)
+        results = await asyncio.gather(*[
+            client.request("cme", "GET", startDate="2020-01-01") for _ in range(10)
+        ])
+        assert len(client.sent) == 1
+        assert all(_ids(result) == ["2020-01-01-CME-001"] for result in results)
+        assert client._inflight == {}
+    run(main())
+
+
+
+def test_clients_built_outside_a_loop_share_fetches(run):
+    # The client saves a loop that isn't the one the requests run on
+    client = _FakeClient([(200, {}, _CME)], delay=0.01, cache_size=0)
+
+    async def main():
+        results = await asyncio.gather(*[
+            client.request("cme", "GET", startDate="2020-01-01") for _ in range(2)
+        ])
+        assert len(client.sent) == 1
+        assert _ids(results[1]) == ["2020-01-01-CME-001"]
+    run(main())
+
+
+def test_different_requests_are_not_shared(run):
+    async def main():
+        client = _FakeClient([(200, {}, _CME), (200, {}, [])], delay=0.01, cache_size=0)
+        await asyncio.gather(
+            client.request("cme", "GET", startDate="2020-01-01"),
+            client.request("cme", "GET", startDate="2020-01-02"),
+        )
+        assert len(client.sent) == 2
+    run(main())
+
+
+def test_an_error_reaches_every_waiter(run):
+    async def main():
+        client = _FakeClient([(200, {}, ConnectionResetError())], delay=0.01, cache_size=0)
+        results = await asyncio.gather(*[
+            client.request("cme", "GET", startDate="2020-01-01") for _ in range(5)
+        ], return_exceptions=True)
+        assert len(client.sent) == 1
+        assert all(isinstance(result, ConnectionResetError) for result in results)
+        assert client._inflight == {}
+    run(main())
+
+
+def test_cancelling_the_leader_does_not_strand_the_followers(run):
+    async def main():
+        client = _FakeClient([(200, {}, _CME), (200, {}, _CME)], delay=0.02, cache_size=0)
+        leader = asyncio.ensure_future(client.request("cme", "GET", startDate="2020-01-01"))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.ensure_future(client.request("cme", "GET", startDate="2020-01-01"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.005)
+        leader.cancel()
+        results = await asyncio.wait_for(asyncio.gather(*followers), timeout=1)
+        assert leader.cancelled()
+        assert all(_ids(result) == ["2020-01-01-CME-001"] for result in results)
+        # The followers retried together, with a single new fetch
+        assert len(client.sent) == 2
+        assert client._inflight == {}
+    run(main())
+
+
+def test_cancelling_a_follower_leaves_the_others(run):
+    async def main():
+        client = _FakeClient([(200, {}, _CME)], delay=0.02, cache_size=0)
+        leader = asyncio.ensure_future(client.request("cme", "GET", startDate="2020-01-01"))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(client.request("cme", "GET", startDate="2020-01-01"))
+        await asyncio.sleep(0.005)
+        follower.cancel()
+        assert _ids(await leader) == ["2020-01-01-CME-001"]
+        assert follower.cancelled()
+        assert len(client.sent) == 1
+    run(main())
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_loads(request):
+    if request.param == "orjson":
+        return pytest.importorskip("orjson").loads
+    import json
+    return json.loads
+
+
+def _serve(run, handler):
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    server = TestServer(app)
+    run(server.start_server())
+    return server
+
+
+def test_non_json_error_pages_raise_http_errors(run, json_loads):
+    from aiohttp import web
+
+    async def handler(request):
+        return web.Response(status=403, text="<html>API_KEY_INVALID</html>",
+                            content_type="text/html")
+
+    server = _serve(run, handler)
+
+    async def main():
+        client = HTTPClient(cache_size=0, json_loads=json_loads)
+        try:
+            with pytest.raises(HTTPException) as error:
+                await client.request("neo-browse", "GET", url=str(server.make_url("/browse")))
+            assert "403" in str(error.value)
+        finally:
+            await client.close()
+
+    try:
+        run(main())
+    finally:
+        run(server.close())
+
+
+def test_json_error_bodies_are_still_decoded(run, json_loads):
+    from aiohttp import web
+
+    async def handler(request):
+        return web.json_response({"error": "bad page"}, status=400)
+
+    server = _serve(run, handler)
+
+    async def main():
+        client = HTTPClient(cache_size=0, json_loads=json_loads)
+        try:
+            result = await client.request("neo-browse", "GET", url=str(server.make_url("/browse")))
+            assert result.code == 400
+            assert result.to_dict["error"] == "bad page"
+        finally:
+            await client.close()
+
+    try:
+        run(main())
+    finally:
+        run(server.close())
+
+
+def test_empty_bodies_are_no_data(run, json_loads):
+    from aiohttp import web
+
+    async def handler(request):
+        return web.Response(status=200, body=b"")
+
+    server = _serve(run, handler)
+
+    async def main():
+        client = HTTPClient(json_loads=json_loads)
+        try:
+            url = str(server.make_url("/CME"))
+            assert await client.request("cme", "GET", url=url) == []
+            assert await client.request("cme", "GET", url=url) == []
+            assert client.cache.stats.hits == 1
+        finally:
+            await client.close()
+
+    try:
+        run(main())
+    finally:
+        run(server.close())
+
+
+def test_the_owned_session_is_built_from_the_options(run):
+    async def main():
+        client = HTTPClient(connections=5, connections_per_host=2, dns_ttl=7,
+                            keepalive_timeout=3.0, timeout=20.0, connect_timeout=4.0)
+        try:
+            session = client.session
+            assert client.session is session
+            connector = session.connector
+            assert (connector.limit, connector.limit_per_host) == (5, 2)
+            assert connector._cached_hosts._ttl == 7
+            assert connector._keepalive_timeout == 3.0
+            assert (session.timeout.total, session.timeout.connect) == (20.0, 4.0)
+        finally:
+            await client.close()
+        assert session.closed
+        # A closed owned session is replaced on the next use
+        assert client.session is not session
+        await client.close()
+    run(main())
+
+
+def test_a_given_session_is_used_as_is(run):
+    import aiohttp
+
+    async def main():
+        session = aiohttp.ClientSession()
+        try:
+            client = HTTPClient(session=session, connections=5, timeout=20.0)
+            assert client.session is session
+            assert session.connector.limit == 100
+            assert session.timeout.total != 20.0
+            await client.close()
+            assert not session.closed
+        finally:
+            await session.close()
+    run(main())
@@ -0,0 +1,104 @@
+import gc
+import weakref
+
+import pytest
+
+from voyager import decorators
+from voyager.decorators import lazy_property, set_lazy_limit
+
+
+class _Value(object):
+    pass
+
+
+class _Resource(object):
+    __slots__ = [
+        'calls',
+        '_lazy',
+        '__weakref__',
+    ]
+
+    def __init__(self):
+        self.calls = 0
+
+    @lazy_property
+    def value(self):
+        self.calls += 1
+        return _Value()
+
+    @lazy_property
+    def other(self):
+        self.calls += 1
+        return _Value()
+
+
+@pytest.fixture
+def limit():
+    yield set_lazy_limit
+    set_lazy_limit(None)
+
+
+def test_values_are_computed_once_per_instance():
+    first, second = _Resource(), _Resource()
+    assert first.value is first.value
+    assert first.value is not second.value
+    assert (first.calls, second.calls) == (1, 1)
+    assert _Resource.value.__get__(None, _Resource) is _Resource.value
+
+
+def test_least_recently_used_values_are_evicted_first(limit):
+    limit(2)
+    first, second, third = _Resource(), _Resource(), _Resource()
+    first.value
+    second.value
+    first.value
+    third.value
+    # second was used least recently, so only it was dropped
+    assert (first.calls, second.calls, third.calls) == (1, 1, 1)
+    first.value
+    third.value
+    assert (first.calls, third.calls) == (1, 1)
+    second.value
+    assert second.calls == 2
+    # Values of one instance are evicted separately
+    third.other
+    assert len(decorators._lazy_entries) == 2
+    second.value
+    assert second.calls == 2
+    third.value
+    assert third.calls == 3
+
+
+def test_lowering_the_limit_evicts_at_once(limit):
+    limit(3)
+    resource = _Resource()
+    resource.value
+    resource.other
+    limit(1)
+    resource.other
+    resource.value
+    assert resource.calls == 3
+
+
+@pytest.mark.parametrize("bound", [None, 2])
+def test_values_are_released_with_their_instance(limit, bound):
+    limit(bound)
+    resource = _Resource()
+    value = weakref.ref(resource.value)
+    resource.other
+    del resource
+    gc.collect()
+    assert value() is None
+    assert len(decorators._lazy_entries) == 0
+    assert decorators._lazy_names == {}
+
+
+def test_collected_instances_leave_the_budget_to_live_ones(limit):
+    limit(2)
+    live = _Resource()
+    live.value
+    for _ in range(5):
+        _Resource().value
+        gc.collect()
+    live.value
+    assert live.calls == 1
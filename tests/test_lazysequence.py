@@ -0,0 +1,99 @@
+import pytest
+
+from voyager.resources import MarsRoverResource
+from voyager.resources.base import LazySequence, _as_sequence
+
+
+class _Factory(object):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, raw):
+        self.calls.append(raw)
+        return {"value": raw}
+
+
+def test_empty_sequence():
+    sequence = LazySequence([], _Factory())
+    assert len(sequence) == 0
+    assert list(sequence) == []
+    assert sequence[:] == []
+    with pytest.raises(IndexError):
+        sequence[0]
+
+
+def test_records_are_built_on_first_access_only():
+    factory = _Factory()
+    sequence = LazySequence([1, 2, 3], factory)
+    assert factory.calls == []
+    first = sequence[0]
+    assert first == {"value": 1}
+    assert sequence[0] is first
+    assert factory.calls == [1]
+
+
+def test_negative_indexing():
+    sequence = LazySequence([1, 2, 3], _Factory())
+    assert sequence[-1] == {"value": 3}
+    assert sequence[-1] is sequence[2]
+    with pytest.raises(IndexError):
+        sequence[3]
+    with pytest.raises(IndexError):
+        sequence[-4]
+
+
+@pytest.mark.parametrize("index", [
+    slice(None),
+    slice(1, None),
+    slice(None, -1),
+    slice(None, None, 2),
+    slice(None, None, -1),
+    slice(5, 10),
+])
+def test_slicing_matches_list(index):
+    raw = [1, 2, 3, 4]
+    sequence = LazySequence(raw, _Factory())
+    assert sequence[index] == [{"value": value} for value in raw[index]]
+
+
+def test_slices_share_built_records():
+    factory = _Factory()
+    sequence = LazySequence([1, 2, 3], factory)
+    assert sequence[1:][0] is sequence[1]
+    assert factory.calls == [2, 3]
+
+
+def test_iterating_twice_builds_once():
+    factory = _Factory()
+    sequence = LazySequence([1, 2], factory)
+    assert list(sequence) == list(sequence)
+    assert factory.calls == [1, 2]
+    assert "built=2" in repr(sequence)
+
+
+def test_sequence_protocol():
+    sequence = LazySequence([1, 2, 1], _Factory())
+    assert {"value": 2} in sequence
+    assert sequence.index({"value": 2}) == 1
+    assert sequence.count({"value": 1}) == 2
+    assert list(reversed(sequence))[0] == {"value": 1}
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, ()),
+    ([], []),
+    ("record", ("record",)),
+])
+def test_as_sequence(value, expected):
+    assert _as_sequence(value) == expected
+
+
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_all_photos_is_a_list_of_the_built_photos(count):
+    resource = MarsRoverResource({"photos": [{"id": index} for index in range(count)]})
+    photos = resource.all_photos
+    assert isinstance(photos, list)
+    assert [photo.id for photo in photos] == list(range(count))
+    assert photos == list(resource)
+    if count:
+        assert photos[0] is next(iter(resource))
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from voyager.decorators import AdaptiveLimiter
+
+
+def test_limiter_blocks_past_its_limit(clock, run):
+    limiter = AdaptiveLimiter(initial=2)
+    order = []
+
+    async def worker(name):
+        await limiter.acquire()
+        order.append(name)
+
+    async def main():
+        await limiter.acquire()
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(worker("third"))
+        await asyncio.sleep(0)
+        assert order == []
+        assert limiter.inflight == 2
+        limiter.release(0.1)
+        await waiter
+        assert order == ["third"]
+
+    run(main())
+
+
+def test_limiter_increases_additively(clock):
+    limiter = AdaptiveLimiter(initial=4, max_limit=6)
+    for _ in range(4):
+        limiter._inflight += 1
+        limiter.release(0.1)
+    # About one slot per round trip's worth of successes
+    assert limiter.limit == 4
+    assert limiter._limit == pytest.approx(4.921, abs=1e-3)
+    for _ in range(100):
+        limiter._inflight += 1
+        limiter.release(0.1)
+    assert limiter.limit == 6
+
+
+def test_limiter_decreases_once_per_round_trip(clock):
+    limiter = AdaptiveLimiter(initial=16, decrease=0.5)
+    limiter._inflight = 3
+    limiter.release(0.5, overloaded=True)
+    assert limiter.limit == 8
+    # A second failure within the same round trip doesn't cut again
+    clock.advance(0.1)
+    limiter.release(0.5, overloaded=True)
+    assert limiter.limit == 8
+    clock.advance(1.0)
+    limiter.release(0.5, overloaded=True)
+    assert limiter.limit == 4
+
+
+def test_limiter_respects_its_floor(clock):
+    limiter = AdaptiveLimiter(initial=2, min_limit=1)
+    for _ in range(5):
+        clock.advance(10)
+        limiter._inflight += 1
+        limiter.release(0.1, overloaded=True)
+    assert limiter.limit == 1
+
+
+def test_limiter_decreases_on_rising_latency(clock):
+    limiter = AdaptiveLimiter(initial=8, tolerance=2.0, smoothing=0.5)
+    for _ in range(5):
+        limiter._inflight += 1
+        limiter.release(0.1)
+    grown = limiter._limit
+    for _ in range(5):
+        clock.advance(10)
+        limiter._inflight += 1
+        limiter.release(2.0)
+    assert limiter._limit < grown / 2
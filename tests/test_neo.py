@@ -0,0 +1,195 @@
+import asyncio
+import datetime
+
+import pytest
+
+from voyager.exceptions import HTTPException
+from voyager.resources import NEOResource
+from voyager.voyager import Client
+
+
+class _FakeHTTP(object):
+    """Stands in for HTTPClient, answering neo-browse pages from a table of
+    page number to ``(code, delay)``
+    """
+
+    def __init__(self, pages, total_pages, size=2):
+        self.pages = pages
+        self.total_pages = total_pages
+        self.size = size
+        self.requested = []
+        self.cancelled = []
+
+    async def request(self, route, method=None, **options):
+        page = options["page"]
+        self.requested.append(page)
+        code, delay = self.pages.get(page, (200, 0))
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(page)
+            raise
+        objects = [{"id": str(page * self.size + index)} for index in range(self.size)]
+        return NEOResource({
+            "page": {"number": page, "total_pages": self.total_pages},
+            "near_earth_objects": objects if code == 200 else None,
+            "search_type": "browse",
+            "code": code,
+        })
+
+
+def _client(http):
+    client = Client()
+    client._http_client = http
+    return client
+
+
+async def _browse(client, **kwargs):
+    return [neo.id for neo in [neo async for neo in client.neo_browse_all(**kwargs)]]
+
+
+def test_browse_all_yields_every_page(run):
+    async def main():
+        http = _FakeHTTP({1: (200, 0.02), 2: (200, 0.01)}, total_pages=4)
+        ids = await _browse(_client(http), concurrency=2)
+        assert sorted(ids) == list(range(8))
+        assert sorted(http.requested) == [0, 1, 2, 3]
+    run(main())
+
+
+def test_browse_all_single_page(run):
+    async def main():
+        http = _FakeHTTP({}, total_pages=1)
+        assert await _browse(_client(http)) == [0, 1]
+        assert http.requested == [0]
+    run(main())
+
+
+def test_browse_all_raises_on_a_failed_page(run):
+    async def main():
+        http = _FakeHTTP({2: (400, 0.01), 3: (200, 0.01)}, total_pages=5)
+        client, ids = _client(http), []
+        with pytest.raises(HTTPException):
+            async for neo in client.neo_browse_all(concurrency=4):
+                ids.append(neo.id)
+        # Pages finished with the failed one are yielded before it raises
+        assert {6, 7} <= set(ids)
+        assert not {4, 5} & set(ids)
+    run(main())
+
+
+def test_browse_all_raises_on_a_failed_first_page(run):
+    async def main():
+        http = _FakeHTTP({0: (403, 0)}, total_pages=3)
+        with pytest.raises(HTTPException):
+            await _browse(_client(http))
+        assert http.requested == [0]
+    run(main())
+
+
+def test_closing_browse_all_cancels_pending_pages(run):
+    async def main():
+        http = _FakeHTTP({1: (200, 0), 2: (200, 10), 3: (200, 10)}, total_pages=6)
+        iterator = _client(http).neo_browse_all(concurrency=3)
+        async for neo in iterator:
+            if neo.id == 2:
+                break
+        await iterator.aclose()
+        await asyncio.sleep(0)
+        assert sorted(http.cancelled) == [2, 3]
+        assert 4 not in http.requested
+    run(main())
+
+
+class _FakeFeed(object):
+    """Stands in for HTTPClient, answering neo-feed windows with one object
+    per day, or with an error code for the windows starting on ``failing``
+    """
+
+    def __init__(self, failing=(), delays=None):
+        self.failing = set(failing)
+        self.delays = delays or {}
+        self.windows = []
+        self.cancelled = []
+
+    async def request(self, route, method=None, **options):
+        start, end = options["start_date"], options["end_date"]
+        self.windows.append((start.isoformat(), end.isoformat()))
+        try:
+            await asyncio.sleep(self.delays.get(start.isoformat(), 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(start.isoformat())
+            raise
+        if start.isoformat() in self.failing:
+            return NEOResource({"search_type": "feed-query", "code": 400})
+        days = (end - start).days + 1
+        dates = [(start + datetime.timedelta(days=day)).isoformat() for day in range(days)]
+        return NEOResource({
+            "links": {"self": f"feed?start_date={start}&end_date={end}"},
+            "element_count": days,
+            "near_earth_objects": {date: [{"id": date.replace("-", "")}] for date in dates},
+            "search_type": "feed-query",
+            "query_url": f"feed?start_date={start}&end_date={end}",
+            "code": 200,
+        })
+
+
+def test_feed_merges_windows(run):
+    async def main():
+        http = _FakeFeed()
+        result = await _client(http).neo_feed("2020-01-01", "2020-01-20")
+        assert sorted(http.windows) == [
+            ("2020-01-01", "2020-01-07"),
+            ("2020-01-08", "2020-01-14"),
+            ("2020-01-15", "2020-01-20"),
+        ]
+        assert result.element_count == 20
+        assert len(result.to_dict["near_earth_objects"]) == 20
+        assert result.query_url is None
+        assert "links" not in result.to_dict
+        assert result.code == 200
+    run(main())
+
+
+def test_feed_raises_on_a_failed_window(run):
+    async def main():
+        with pytest.raises(HTTPException):
+            await _client(_FakeFeed(failing=["2020-01-08"])).neo_feed("2020-01-01", "2020-01-20")
+    run(main())
+
+
+def test_feed_cancels_the_other_windows_on_a_failure(run):
+    async def main():
+        http = _FakeFeed(failing=["2020-01-08"],
+                         delays={"2020-01-01": 60, "2020-01-15": 60})
+        with pytest.raises(HTTPException):
+            await _client(http).neo_feed("2020-01-01", "2020-01-20")
+        assert sorted(http.cancelled) == ["2020-01-01", "2020-01-15"]
+    run(main())
+
+
+def test_feed_iter_yields_windows_as_they_arrive(run):
+    async def main():
+        http = _FakeFeed(delays={"2020-01-01": 0.02})
+        client = _client(http)
+        counts = [window.element_count
+                  async for window in client.neo_feed_iter("2020-01-01", "2020-01-10")]
+        assert counts == [3, 7]
+    run(main())
+
+
+def test_feed_iter_single_day(run):
+    async def main():
+        http = _FakeFeed()
+        windows = [window async for window in _client(http).neo_feed_iter("2020-01-01", "2020-01-01")]
+        assert [window.element_count for window in windows] == [1]
+    run(main())
+
+
+def test_feed_iter_raises_on_a_failed_window(run):
+    async def main():
+        client = _client(_FakeFeed(failing=["2020-01-08"]))
+        with pytest.raises(HTTPException):
+            async for _ in client.neo_feed_iter("2020-01-01", "2020-01-14"):
+                pass
+    run(main())
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from voyager.decorators import RateLimit
+
+
+@pytest.fixture(autouse=True)
+def sleep(clock, monkeypatch):
+    # Waiting for tokens advances the fake clock instead of real time
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+
+
+def test_bucket_starts_full(clock):
+    bucket = RateLimit(max_calls=10, period=10)
+    assert bucket.limit == 10
+    assert bucket.remaining == 10
+    assert bucket.rate == 1.0
+
+
+def test_bucket_spends_then_waits_for_refill(clock, run):
+    bucket = RateLimit(max_calls=3, period=30)
+
+    async def main():
+        for _ in range(3):
+            await bucket.acquire()
+        assert clock.sleeps == []
+        assert bucket.remaining == 0
+        await bucket.acquire()
+
+    run(main())
+    # One token refills every 10 seconds
+    assert clock.sleeps == [pytest.approx(10.0)]
+    assert bucket.remaining == 0
+
+
+def test_bucket_refills_up_to_its_size(clock, run):
+    bucket = RateLimit(max_calls=4, period=4)
+    run(bucket.acquire())
+    run(bucket.acquire())
+    assert bucket.remaining == 2
+    clock.advance(1)
+    assert bucket.remaining == 3
+    clock.advance(100)
+    assert bucket.remaining == 4
+
+
+def test_concurrent_waiters_are_paced(clock, run):
+    bucket = RateLimit(max_calls=2, period=2)
+
+    async def main():
+        await asyncio.gather(*[bucket.acquire() for _ in range(5)])
+
+    start = clock.now
+    run(main())
+    assert clock.now - start == pytest.approx(3.0)
+    assert len(clock.sleeps) == 3
+
+
+def test_drain_empties_the_bucket(clock, run):
+    bucket = RateLimit(max_calls=100, period=100)
+    bucket.drain()
+    assert bucket.remaining == 0
+    run(bucket.acquire())
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_update_from_headers(clock):
+    bucket = RateLimit(max_calls=1000, period=3600)
+    bucket.update(limit=40, remaining=None)
+    assert bucket.limit == 40
+    assert bucket.remaining == 40
+    bucket.update(limit=None, remaining=5)
+    assert bucket.remaining == 5
+    # The server never raises the local count
+    bucket.update(remaining=30)
+    assert bucket.remaining == 5
+
+
+def test_http_client_drains_on_429(clock):
+    from voyager.http import HTTPClient
+
+    class Response(object):
+        status = 429
+        headers = {"X-RateLimit-Limit": "1000"}
+
+    client = HTTPClient()
+    client._update_ratelimit(Response())
+    assert client.ratelimit.remaining == 0
+    assert client.ratelimit.limit == 1000
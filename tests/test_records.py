@@ -0,0 +1,66 @@
+from typing import Union
+
+import pytest
+
+from voyager.resources.records import coercer, record_class
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, None),
+    (3, 3),
+    ("3", 3),
+    (" -4 ", -4),
+    (3.0, 3),
+    ("2.7", "2.7"),
+    ("1e30", "1e30"),
+    (2.5, 2.5),
+    (float("nan"), "nan"),
+    ("", ""),
+    ("n/a", "n/a"),
+])
+def test_int_coercion_is_exact(value, expected):
+    result = coercer(int)(value)
+    if expected == "nan":
+        assert result != result
+    else:
+        assert result == expected
+        assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, None),
+    ("2.5", 2.5),
+    (2, 2.0),
+    ("n/a", "n/a"),
+])
+def test_float_coercion(value, expected):
+    assert coercer(float)(value) == expected
+
+
+def test_unions_coerce_to_their_single_type():
+    assert coercer(Union[int, None])("7") == 7
+    assert coercer(Union[float, str]) is None
+
+
+Record = record_class("Record", {
+    "name": Union[str, None],
+    "count": Union[int, None],
+    "period": Union[float, None],
+}, __name__)
+
+
+def test_record_fields():
+    record = Record({"name": "a", "count": "2", "period": "1.5"})
+    assert (record.name, record.count, record.period) == ("a", 2, 1.5)
+    assert record.to_dict == {"name": "a", "count": 2, "period": 1.5}
+
+
+def test_record_keeps_inexact_values():
+    record = Record({"count": "2.7"})
+    assert record.count == "2.7"
+    assert record.name is None
+
+
+def test_record_keeps_raw_data_on_request():
+    data = {"name": "a", "count": "2"}
+    assert Record(data, raw=True).to_dict is data
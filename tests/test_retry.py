@@ -0,0 +1,70 @@
+import datetime
+import email.utils
+
+from voyager.retry import RetryPolicy
+
+
+def test_parse_retry_after_seconds():
+    assert RetryPolicy.parse_retry_after("3") == 3.0
+    assert RetryPolicy.parse_retry_after("1.5") == 1.5
+    assert RetryPolicy.parse_retry_after("-2") == 0.0
+
+
+def test_parse_retry_after_http_date():
+    when = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=60)
+    delay = RetryPolicy.parse_retry_after(email.utils.format_datetime(when, usegmt=True))
+    assert 50 < delay <= 60
+    past = email.utils.format_datetime(
+        datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc), usegmt=True
+    )
+    assert RetryPolicy.parse_retry_after(past) == 0.0
+
+
+def test_parse_retry_after_empty_or_invalid():
+    assert RetryPolicy.parse_retry_after(None) is None
+    assert RetryPolicy.parse_retry_after("") is None
+    assert RetryPolicy.parse_retry_after("soon") is None
+
+
+def test_next_delay_is_bounded_by_backoff():
+    policy = RetryPolicy(base=0.5, cap=2.0, budget_min=100)
+    for attempt in range(1, 4):
+        delay = policy.next_delay(attempt, 0.0)
+        assert 0 <= delay <= min(2.0, 0.5 * 2 ** attempt)
+
+
+def test_next_delay_prefers_retry_after():
+    policy = RetryPolicy()
+    assert policy.next_delay(1, 0.0, retry_after="7") == 7.0
+
+
+def test_next_delay_stops_after_max_attempts():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.next_delay(2, 0.0) is not None
+    assert policy.next_delay(3, 0.0) is None
+
+
+def test_next_delay_respects_deadline():
+    policy = RetryPolicy(deadline=10.0)
+    assert policy.next_delay(1, 5.0, retry_after="6") is None
+    assert policy.next_delay(1, 5.0, retry_after="4") == 4.0
+    assert RetryPolicy(deadline=None).next_delay(1, 1e6, retry_after="4") == 4.0
+
+
+def test_next_delay_spends_the_retry_budget():
+    policy = RetryPolicy(budget_ratio=0.5, budget_min=2)
+    assert policy.next_delay(1, 0.0) is not None
+    assert policy.next_delay(1, 0.0) is not None
+    assert policy.next_delay(1, 0.0) is None
+    policy.record_request()
+    policy.record_request()
+    assert policy.budget == 1.0
+    assert policy.next_delay(1, 0.0) is not None
+    assert policy.next_delay(1, 0.0) is None
+
+
+def test_budget_is_capped():
+    policy = RetryPolicy(budget_ratio=1.0, budget_min=0, budget_max=3)
+    for _ in range(10):
+        policy.record_request()
+    assert policy.budget == 3.0
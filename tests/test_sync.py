@@ -0,0 +1,93 @@
+import datetime
+import json
+
+import pytest
+
+from voyager.exceptions import VoyagerException
+from voyager.resources import CMEResource
+from voyager.sync import DonkiSync
+
+
+def _cme(id, start, note=""):
+    return CMEResource({"activityID": id, "startTime": start, "note": note,
+                        "query_url": "https://example.com", "code": 200})
+
+
+@pytest.fixture
+def sync(tmp_path):
+    return DonkiSync(str(tmp_path / "sync.json"), overlap=datetime.timedelta(days=2))
+
+
+def test_new_state(sync):
+    assert sync.mark("cme") is None
+    assert sync.window("cme") is None
+
+
+def test_update_with_no_events(sync):
+    assert sync.update("cme", []) == []
+    assert sync.mark("cme") is None
+    assert sync.window("cme") is None
+
+
+def test_first_update_reports_everything(sync):
+    events = [_cme("a", "2020-01-01T00:00Z"), _cme("b", "2020-01-05T00:00Z")]
+    assert sync.update("cme", events) == events
+    assert sync.mark("cme") == datetime.datetime(2020, 1, 5)
+    assert sync.window("cme") == datetime.date(2020, 1, 3)
+
+
+def test_only_new_or_changed_events_are_reported(sync):
+    sync.update("cme", [_cme("a", "2020-01-04T00:00Z"), _cme("b", "2020-01-05T00:00Z")])
+    changed = _cme("a", "2020-01-04T00:00Z", note="revised")
+    new = _cme("c", "2020-01-06T00:00Z")
+    assert sync.update("cme", [changed, _cme("b", "2020-01-05T00:00Z"), new]) == [changed, new]
+    assert sync.mark("cme") == datetime.datetime(2020, 1, 6)
+
+
+def test_client_metadata_is_not_a_change(sync):
+    sync.update("cme", [_cme("a", "2020-01-04T00:00Z")])
+    again = CMEResource({"activityID": "a", "startTime": "2020-01-04T00:00Z",
+                         "note": "", "query_url": "https://other.com", "code": 200})
+    assert sync.update("cme", [again]) == []
+
+
+def test_events_before_the_window_are_forgotten(sync):
+    sync.update("cme", [_cme("a", "2020-01-01T00:00Z")])
+    sync.update("cme", [_cme("b", "2020-01-10T00:00Z")])
+    old = _cme("a", "2020-01-01T00:00Z")
+    assert sync.update("cme", [old]) == [old]
+
+
+def test_mark_never_moves_back(sync):
+    sync.update("cme", [_cme("a", "2020-01-05T00:00Z")])
+    sync.update("cme", [_cme("b", "2020-01-04T00:00Z")])
+    assert sync.mark("cme") == datetime.datetime(2020, 1, 5)
+
+
+def test_events_without_id_are_ignored(sync):
+    assert sync.update("cme", [CMEResource({"startTime": "2020-01-01T00:00Z"})]) == []
+    assert sync.mark("cme") is None
+
+
+def test_unknown_route(sync):
+    with pytest.raises(VoyagerException):
+        sync.update("apod", [])
+
+
+def test_save_and_reload(sync):
+    sync.update("cme", [_cme("a", "2020-01-05T00:00Z")])
+    sync.save()
+    with open(sync.path) as fp:
+        assert "cme" in json.load(fp)
+    reloaded = DonkiSync(sync.path)
+    assert reloaded.mark("cme") == datetime.datetime(2020, 1, 5)
+    assert reloaded.update("cme", [_cme("a", "2020-01-05T00:00Z")]) == []
+
+
+def test_reset(sync):
+    sync.update("cme", [_cme("a", "2020-01-05T00:00Z")])
+    sync.update("gst", [])
+    sync.reset("cme")
+    assert sync.mark("cme") is None
+    sync.reset()
+    assert sync.update("cme", [_cme("a", "2020-01-05T00:00Z")]) != []
@@ -0,0 +1,139 @@
+import pytest
+
+from voyager.exceptions import VoyagerException
+
+pa = pytest.importorskip("pyarrow")
+
+from voyager.resources import (CADResource, ExoplanetResource,  # noqa: E402
+                               FireballResource, NHATSResource)
+from voyager.resources.tables import (ArrowExport, from_matrix,  # noqa: E402
+                                      from_rows)
+
+
+def _schema(table):
+    return {field.name: str(field.type) for field in table.schema}
+
+
+CAD_FIELDS = ["des", "orbit_id", "jd", "cd", "dist", "dist_min", "dist_max",
+              "v_rel", "v_inf", "t_sigma_f", "h", "diameter", "diameter_sigma"]
+CAD_ROWS = [
+    ["2020 AB", "3", "2458849.5", "2020-Jan-01 00:00", "0.01", "0.009", "0.011",
+     "5.1", "5.0", "< 00:01", "25.1", "0.05", "0.01"],
+    ["2020 AC", "2", "2458850.5", "2020-Jan-02 00:00", "", "0.009", "0.011",
+     "5.1", "5.0", "00:01", "", None, "null"],
+]
+CAD_SCHEMA = {
+    "des": "string",
+    "orbit_id": "string",
+    "jd": "double",
+    "cd": "timestamp[s]",
+    "dist": "double",
+    "dist_min": "double",
+    "dist_max": "double",
+    "v_rel": "double",
+    "v_inf": "double",
+    "t_sigma_f": "string",
+    "h": "double",
+    "diameter": "double",
+    "diameter_sigma": "double",
+}
+
+
+@pytest.mark.parametrize("rows", [CAD_ROWS, CAD_ROWS[1:], []])
+def test_cad_schema(rows):
+    resource = CADResource({"signature": {}, "count": str(len(rows)),
+                            "fields": CAD_FIELDS, "data": rows})
+    assert _schema(resource.to_arrow()) == CAD_SCHEMA
+
+
+def test_cad_blanks_match_the_numpy_view():
+    resource = CADResource({"signature": {}, "count": "2",
+                            "fields": CAD_FIELDS, "data": CAD_ROWS})
+    table, columns = resource.to_arrow(), resource.to_columns()
+    for field in ["dist", "h", "diameter", "diameter_sigma"]:
+        assert table.column(field).null_count == 1
+        assert table.column(field).to_pylist()[0] == pytest.approx(columns[field][0])
+
+
+FIREBALL_FIELDS = ["date", "energy", "impact-e", "lat", "lat-dir", "lon",
+                   "lon-dir", "alt", "vel"]
+FIREBALL_SCHEMA = {
+    "date": "timestamp[s]",
+    "energy": "double",
+    "impact-e": "double",
+    "lat": "double",
+    "lat-dir": "string",
+    "lon": "double",
+    "lon-dir": "string",
+    "alt": "double",
+    "vel": "double",
+}
+
+
+def test_fireball_schema():
+    resource = FireballResource({"signature": {}, "count": "2", "fields": FIREBALL_FIELDS, "data": [
+        ["2020-01-01 00:00:00", "2.1", "0.08", "10.5", "S", "20.1", "E", "30.2", "15"],
+        ["2020-01-02 00:00:00", "1.0", "", None, None, "5.0", "W", "", None],
+    ]})
+    table = resource.to_arrow()
+    assert _schema(table) == FIREBALL_SCHEMA
+    assert table.column("lat").to_pylist() == [-10.5, None]
+    assert table.column("lon").to_pylist() == [20.1, -5.0]
+    assert table.column("alt").to_pylist() == [30.2, None]
+
+
+def test_nhats_schema():
+    resource = NHATSResource({"signature": {}, "count": "2", "data": [
+        {"des": "2000 SG344", "fullname": "(2000 SG344)", "h": "24.7",
+         "min_size": "20", "max_size": "89", "occ": "3", "n_via_traj": "1234",
+         "obs_mag": "22", "orbit_id": "17"},
+        {"des": "2020 CD3", "fullname": "(2020 CD3)", "h": "",
+         "min_size": "1", "max_size": "null", "occ": "None", "n_via_traj": "5",
+         "obs_mag": None, "orbit_id": "2"},
+    ]})
+    assert _schema(resource.to_arrow()) == {
+        "des": "string",
+        "fullname": "string",
+        "h": "double",
+        "min_size": "int64",
+        "max_size": "int64",
+        "occ": "int64",
+        "n_via_traj": "int64",
+        "obs_mag": "double",
+        "orbit_id": "int64",
+    }
+
+
+def test_exoplanet_schema():
+    resource = ExoplanetResource({"table_name": "exoplanets", "raw": [
+        {"pl_name": "a b", "pl_pnum": 1, "pl_orbper": 3.5, "pl_discmethod": "Transit"},
+        {"pl_name": "c d", "pl_pnum": None, "pl_orbper": None, "pl_discmethod": None},
+    ]})
+    assert _schema(resource.to_arrow()) == {
+        "pl_name": "string",
+        "pl_pnum": "int64",
+        "pl_orbper": "double",
+        "pl_discmethod": "string",
+    }
+
+
+def test_exoplanet_all_blank_column_keeps_its_type():
+    resource = ExoplanetResource({"table_name": "exoplanets", "raw": [
+        {"pl_name": "a b", "pl_orbper": None},
+    ]})
+    assert _schema(resource.to_arrow())["pl_orbper"] == "double"
+
+
+def test_unconvertible_values_raise():
+    with pytest.raises(VoyagerException):
+        from_matrix(["dist"], [["far"]], types={"dist": float})
+    with pytest.raises(VoyagerException):
+        from_rows([{"occ": "2.5"}], {"occ": int})
+
+
+def test_exports_must_build_a_table():
+    class NoTable(ArrowExport):
+        pass
+
+    with pytest.raises(TypeError):
+        NoTable()
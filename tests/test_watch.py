@@ -0,0 +1,140 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from voyager.exceptions import HTTPException, VoyagerException
+from voyager.resources import NotificationResource
+from voyager.voyager import Client
+
+
+class _Done(Exception):
+    """Raised once every scripted poll has been answered"""
+
+
+def _note(id, type="CME", time=None):
+    return NotificationResource({"messageID": id, "messageType": type,
+                                 "messageIssueTime": time or f"2020-01-01T{id}Z"})
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay, *args, **kwargs):
+        # Polls are spaced out in the recorded delays, not in real time
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return sleeps
+
+
+class _Client(Client):
+    """Answers each poll with the next scripted one, a list of
+    notifications or an exception
+    """
+
+    def __init__(self, polls):
+        super(_Client, self).__init__(cache_size=0)
+        self.polls = list(polls)
+        self.queried = []
+
+    async def notifications(self, start_date=None, end_date=None, type="all"):
+        self.queried.append(type)
+        if not self.polls:
+            raise _Done()
+        poll = self.polls.pop(0)
+        if isinstance(poll, Exception):
+            raise poll
+        return poll
+
+
+def _watch(run, polls, **options):
+    """Runs a watcher until the polls run out and returns the IDs it
+    yielded and the types it queried
+    """
+    ids = []
+
+    async def main():
+        client = _Client(polls)
+        with pytest.raises(_Done):
+            async for notification in client.watch_notifications(**options):
+                ids.append(notification.id)
+        return client.queried
+
+    return ids, run(main())
+
+
+def test_first_poll_is_skipped_without_backlog(run, sleeps):
+    ids, _ = _watch(run, [[_note("01")], [_note("01"), _note("02")]])
+    assert ids == ["02"]
+
+
+def test_backlog_yields_the_first_poll_oldest_first(run, sleeps):
+    ids, _ = _watch(run, [[_note("02"), _note("01")]], backlog=True)
+    assert ids == ["01", "02"]
+
+
+def test_duplicates_across_polls_are_dropped(run, sleeps):
+    polls = [[], [_note("01")], [_note("01"), _note("02")], [_note("02"), _note("02")]]
+    ids, _ = _watch(run, polls)
+    assert ids == ["01", "02"]
+
+
+def test_eviction_keeps_the_last_poll(run, sleeps):
+    first = [_note(f"{index:02}") for index in range(4)]
+    # Four IDs are remembered beyond a seen_size of two, so none come back
+    ids, _ = _watch(run, [first, first, first + [_note("09")]], seen_size=2)
+    assert ids == ["09"]
+    # Once they drop out of the last poll only the newest two are kept
+    ids, _ = _watch(run, [first, [_note("09")], first], seen_size=2)
+    assert ids == ["09", "00", "01", "02"]
+
+
+def test_types_are_filtered(run, sleeps):
+    polls = [[], [_note("01", "CME"), _note("02", "GST"), _note("03", "FLR")]]
+    ids, queried = _watch(run, polls, types=["CME", "GST"])
+    assert ids == ["01", "02"]
+    assert set(queried) == {"all"}
+    ids, queried = _watch(run, polls, types="GST")
+    assert ids == ["02"]
+    assert set(queried) == {"GST"}
+
+
+def test_type_filters_ignore_case(run, sleeps):
+    polls = [[], [_note("01", "Report"), _note("02", "CME")]]
+    ids, queried = _watch(run, polls, types="report")
+    assert ids == ["01"]
+    assert set(queried) == {"report"}
+    ids, queried = _watch(run, polls, types=["Report", "cme"])
+    assert ids == ["01", "02"]
+
+
+def test_invalid_type(run, sleeps):
+    with pytest.raises(VoyagerException):
+        _watch(run, [], types=["CME", "XYZ"])
+
+
+def test_interval_grows_while_quiet_and_resets(run, sleeps):
+    polls = [[], [], [], [_note("01")], []]
+    _watch(run, polls, interval=10, max_interval=20)
+    assert sleeps == [10, 15, 20, 10, 15]
+
+
+@pytest.mark.parametrize("error", [
+    HTTPException(503),
+    aiohttp.ClientConnectionError(),
+    asyncio.TimeoutError(),
+])
+def test_transient_errors_back_off_and_keep_polling(run, sleeps, error):
+    ids, _ = _watch(run, [[], error, [_note("01")]], interval=10)
+    assert ids == ["01"]
+    assert sleeps == [10, 15, 10]
+
+
+def test_other_errors_end_the_watcher(run, sleeps):
+    with pytest.raises(HTTPException):
+        _watch(run, [HTTPException(403)])
+    assert sleeps == []
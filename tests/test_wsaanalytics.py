@@ -0,0 +1,124 @@
+import pytest
+
+from voyager.exceptions import VoyagerException
+
+np = pytest.importorskip("numpy")
+
+from voyager.resources.wsaanalytics import WSAAnalytics  # noqa: E402
+
+
+def _simulation(id, completed, arrival, kp, cmes):
+    return {
+        "simulationID": id,
+        "modelCompletionTime": completed,
+        "estimatedShockArrivalTime": arrival,
+        "kp_90": kp,
+        "isEarthGB": False,
+        "cmeInputs": [{"cmeid": cme, "speed": speed} for cme, speed in cmes],
+        "impactList": None,
+    }
+
+
+SIMULATIONS = [
+    _simulation("s1", "2020-01-01T00:00Z", "2020-01-03T00:00Z", 3, [("cme1", 500)]),
+    _simulation("s2", "2020-01-01T06:00Z", "2020-01-03T04:00Z", 5, [("cme1", 700)]),
+    _simulation("s3", "2020-01-02T00:00Z", None, None, [("cme1", None), ("cme2", 1000)]),
+    _simulation("s4", None, "2020-02-01T00:00Z", 4, [("cme2", 1200)]),
+]
+
+
+@pytest.fixture
+def analytics():
+    return WSAAnalytics(SIMULATIONS)
+
+
+def test_empty_batch():
+    analytics = WSAAnalytics([])
+    assert len(analytics) == 0
+    result = analytics.aggregate_by_cme(
+        runs=("simulation_id", "count"), speed=("speed", "std")
+    )
+    assert result["cme_id"].size == 0
+    assert result["runs"].size == 0
+    assert result["speed"].size == 0
+    assert analytics.latest_per_cme()["cme_id"].size == 0
+    assert analytics.arrival_spread()["spread"].size == 0
+
+
+def test_columns(analytics):
+    assert len(analytics) == 4
+    assert analytics.simulations["kp_90"][1] == 5
+    assert np.isnan(analytics.simulations["kp_90"][2])
+    assert np.isnat(analytics.simulations["estimated_shock_arrival_time"][2])
+    assert list(analytics.cme_inputs["simulation"]) == [0, 1, 2, 2, 3]
+    assert analytics.impacts["simulation"].size == 0
+
+
+def test_numeric_aggregates(analytics):
+    result = analytics.aggregate_by_cme(
+        runs=("simulation_id", "count"),
+        speeds=("speed", "count"),
+        total=("speed", "sum"),
+        mean=("speed", "mean"),
+        std=("speed", "std"),
+        low=("speed", "min"),
+        high=("speed", "max"),
+        spread=("speed", "spread"),
+        kp=("kp_90", "max"),
+    )
+    assert list(result["cme_id"]) == ["cme1", "cme2"]
+    assert list(result["runs"]) == [3, 2]
+    assert list(result["speeds"]) == [2, 2]
+    assert list(result["total"]) == [1200, 2200]
+    assert list(result["mean"]) == [600, 1100]
+    assert list(result["std"]) == [100, 100]
+    assert list(result["low"]) == [500, 1000]
+    assert list(result["high"]) == [700, 1200]
+    assert list(result["spread"]) == [200, 200]
+    assert list(result["kp"]) == [5, 4]
+
+
+def test_datetime_aggregates(analytics):
+    result = analytics.aggregate_by_cme(
+        std=("estimated_shock_arrival_time", "std"),
+        mean=("estimated_shock_arrival_time", "mean"),
+    )
+    assert result["std"].dtype == np.dtype("timedelta64[m]")
+    assert result["std"][0] == np.timedelta64(120, "m")
+    assert result["mean"][0] == np.datetime64("2020-01-03T02:00")
+    # cme2 has one arrival estimate, so its deviation is zero
+    assert result["std"][1] == np.timedelta64(0, "m")
+
+
+def test_groups_without_values_are_missing():
+    analytics = WSAAnalytics([_simulation("s1", None, None, None, [("cme1", None)])])
+    result = analytics.aggregate_by_cme(
+        speed=("speed", "mean"), arrival=("estimated_shock_arrival_time", "max"),
+        low=("speed", "min"),
+    )
+    assert np.isnan(result["speed"][0])
+    assert np.isnan(result["low"][0])
+    assert np.isnat(result["arrival"][0])
+
+
+def test_arrival_spread(analytics):
+    result = analytics.arrival_spread()
+    assert list(result["simulations"]) == [2, 1]
+    assert result["earliest"][0] == np.datetime64("2020-01-03T00:00")
+    assert result["latest"][0] == np.datetime64("2020-01-03T04:00")
+    assert result["spread"][0] == np.timedelta64(4, "h")
+    assert result["spread"][1] == np.timedelta64(0, "m")
+
+
+def test_latest_per_cme(analytics):
+    result = analytics.latest_per_cme()
+    assert list(result["simulation_id"]) == ["s3", "s3"]
+
+
+def test_invalid_aggregates(analytics):
+    with pytest.raises(VoyagerException):
+        analytics.aggregate_by_cme(x=("speed", "median"))
+    with pytest.raises(VoyagerException):
+        analytics.aggregate_by_cme(x=("simulation_id", "mean"))
+    with pytest.raises(VoyagerException):
+        analytics.aggregate_by_cme(x=("missing", "count"))
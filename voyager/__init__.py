@@ -1,3 +1,7 @@
+from .cache import *
+from .dates import *
+from .retry import *
+from .sync import *
 from .voyager import Client
 
 __author__ = "Marwynn Somridhivej"
@@ -0,0 +1,440 @@
+import abc
+import asyncio
+import concurrent.futures
+import datetime
+import functools
+import hashlib
+import json
+import mmap
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, AsyncIterator, Callable, Union
+
+__all__ = [
+    'BaseCache',
+    'MemoryCache',
+    'DiskCache',
+    'FileStore',
+]
+
+
+_Entry = namedtuple("CacheEntry", ['data', 'expires', 'etag', 'last_modified'],
+                    defaults=[None, None])
+_Stats = namedtuple("CacheStats", ['hits', 'misses', 'revalidated', 'size', 'max_size'])
+
+_DONKI_ROUTES = [
+    'cme',
+    'cme-a',
+    'gst',
+    'ips',
+    'flr',
+    'sep',
+    'mpc',
+    'rbe',
+    'hss',
+    'wsa-enlil',
+]
+
+# Time to live in seconds for responses whose content may still change.
+# None means the entry never expires
+_DEFAULT_TTLS = {
+    'apod': 3600,
+    'neo': 3600,
+    'donki': 300,
+    # Always revalidated, so that watchers see new notifications at once
+    'notifications': 0,
+}
+
+# Responses covering dates at least this old are considered settled
+_SETTLED = {
+    'apod': (datetime.timedelta(days=1), None),
+    'neo': (datetime.timedelta(days=1), 86400),
+    'donki': (datetime.timedelta(days=30), 86400),
+}
+
+
+def _to_date(value: Any) -> Union[datetime.date, None]:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    elif isinstance(value, datetime.date):
+        return value
+    try:
+        return datetime.date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+class BaseCache(abc.ABC):
+    """Base class for response cache backends. Backends store the parsed JSON
+    of a response, never the resource objects built from it
+
+    :param max_size: the maximum number of entries to keep, None for no
+        limit, defaults to 128
+    :type max_size: int, optional
+    :param ttls: per route time to live overrides in seconds, None meaning
+        the route's responses never expire, defaults to None
+    :type ttls: dict, optional
+    """
+
+    def __init__(self, max_size: int = 128, ttls: dict = None) -> None:
+        self._max_size = max_size
+        self._ttls = ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._get(key)
+        return entry is not None and not self._expired(entry)
+
+    @property
+    def max_size(self) -> Union[int, None]:
+        return self._max_size
+
+    @property
+    def stats(self) -> namedtuple:
+        return _Stats(self.hits, self.misses, self.revalidated,
+                      len(self), self._max_size)
+
+    def _expired(self, entry: _Entry) -> bool:
+        return entry.expires is not None and entry.expires <= time.time()
+
+    def ttl_for(self, route: str, options: dict) -> Union[float, None]:
+        """Returns the time to live for a response of a route
+
+        :param route: the name of the route
+        :type route: str
+        :param options: the options the request was made with
+        :type options: dict
+        :return: the time to live in seconds, or None if the response never
+            changes
+        :rtype: Union[float, None]
+        """
+        if route in self._ttls:
+            return self._ttls[route]
+        if route in ["neo-lookup", "neo-browse"]:
+            return 86400
+        group = "donki" if route in _DONKI_ROUTES else route.split("-", 1)[0]
+        end = (options.get("date") or options.get("end_date")
+               or options.get("endDate"))
+        if end is not None and (end := _to_date(end)) is not None and group in _SETTLED:
+            age, ttl = _SETTLED[group]
+            if end <= datetime.date.today() - age:
+                return ttl
+        return _DEFAULT_TTLS.get(group, 3600)
+
+    def get(self, key: str) -> Any:
+        """Returns the cached data for a key, or None if the key is missing
+        or expired. Expired entries that carry an ETag or Last-Modified
+        validator are kept so that they can be revalidated
+        """
+        if (entry := self._get(key)) is None:
+            self.misses += 1
+            return None
+        elif self._expired(entry):
+            if not (entry.etag or entry.last_modified):
+                self._delete(key)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.data
+
+    def get_stale(self, key: str) -> Union[_Entry, None]:
+        """Returns the entry for a key if it can be revalidated with a
+        conditional request, regardless of whether it has expired
+        """
+        if (entry := self._get(key)) is None:
+            return None
+        elif not (entry.etag or entry.last_modified):
+            return None
+        return entry
+
+    def set(self, key: str, data: Any, ttl: float = None,
+            etag: str = None, last_modified: str = None) -> None:
+        expires = time.time() + ttl if ttl is not None else None
+        self._set(key, _Entry(data, expires, etag, last_modified))
+
+    def revalidate(self, key: str, entry: _Entry, ttl: float = None) -> Any:
+        """Marks a stale entry as fresh again after the server answered a
+        conditional request with 304 Not Modified
+        """
+        self.revalidated += 1
+        self.set(key, entry.data, ttl=ttl,
+                 etag=entry.etag, last_modified=entry.last_modified)
+        return entry.data
+
+    def delete(self, key: str) -> None:
+        self._delete(key)
+
+    async def call(self, function: Callable, *args, **kwargs) -> Any:
+        """Runs a cache operation from a coroutine, such as
+        ``await cache.call(cache.get, key)``. Backends that do blocking I/O
+        override this to run the operation off the event loop
+        """
+        return function(*args, **kwargs)
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _get(self, key: str) -> Union[_Entry, None]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _set(self, key: str, entry: _Entry) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    """In-memory LRU cache with per entry expiry"""
+
+    def __init__(self, max_size: int = 128, ttls: dict = None) -> None:
+        super(MemoryCache, self).__init__(max_size=max_size, ttls=ttls)
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: str) -> Union[_Entry, None]:
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _set(self, key: str, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if self._max_size is not None:
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class DiskCache(BaseCache):
+    """LRU cache stored in a local SQLite database file. Entries survive
+    restarts and can be shared between processes on the same host. Reads
+    don't write to the database: access times are kept in memory and
+    written in one batch on the next :meth:`set` or on :meth:`close`.
+    The client runs every database call on a dedicated worker thread, so
+    a slow disk or a large payload never blocks the event loop
+
+    :param path: the path of the database file, defaults to "voyager.cache"
+    :type path: str, optional
+    """
+
+    def __init__(self, path: str = "voyager.cache",
+                 max_size: int = 4096, ttls: dict = None) -> None:
+        super(DiskCache, self).__init__(max_size=max_size, ttls=ttls)
+        self._path = path
+        self._accessed = {}
+        # One worker, so database calls from the client run in order. The
+        # lock guards against direct calls from other threads meanwhile
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="voyager-cache"
+        )
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, "
+            "data TEXT NOT NULL, "
+            "expires REAL, "
+            "accessed REAL NOT NULL, "
+            "etag TEXT, "
+            "last_modified TEXT)"
+        )
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(cache)")]
+        for column in ["etag", "last_modified"]:
+            if column not in columns:
+                self._db.execute(f"ALTER TABLE cache ADD COLUMN {column} TEXT")
+        self._db.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    async def call(self, function: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(function, *args, **kwargs)
+        )
+
+    def _get(self, key: str) -> Union[_Entry, None]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data, expires, etag, last_modified FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+        return _Entry(json.loads(row[0]), *row[1:])
+
+    def _flush_accessed(self) -> None:
+        # Written before an eviction so that it sees the latest reads
+        if self._accessed:
+            self._db.executemany(
+                "UPDATE cache SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _set(self, key: str, entry: _Entry) -> None:
+        data = json.dumps(entry.data)
+        with self._lock:
+            self._flush_accessed()
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache "
+                "(key, data, expires, accessed, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, data, entry.expires, time.time(),
+                 entry.etag, entry.last_modified),
+            )
+            if self._max_size is not None:
+                self._db.execute(
+                    "DELETE FROM cache WHERE key NOT IN "
+                    "(SELECT key FROM cache ORDER BY accessed DESC LIMIT ?)",
+                    (self._max_size,),
+                )
+            self._db.commit()
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._accessed.pop(key, None)
+            self._db.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._accessed.clear()
+            self._db.execute("DELETE FROM cache")
+            self._db.commit()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            self._flush_accessed()
+            self._db.commit()
+            self._db.close()
+
+
+class FileStore(object):
+    """Content-addressed store for downloaded files. Each file is kept once
+    under the SHA-256 digest of its content, and every URL it was fetched
+    from points at that digest, so a URL is never downloaded twice and
+    identical files share one copy on disk
+
+    :param path: the directory of the store, defaults to "voyager.files"
+    :type path: str, optional
+    """
+    __slots__ = [
+        '_path',
+    ]
+
+    def __init__(self, path: str = "voyager.files") -> None:
+        self._path = path
+        os.makedirs(os.path.join(path, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(path, "urls"), exist_ok=True)
+
+    def __contains__(self, url: str) -> bool:
+        return self.lookup(url) is not None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _object(self, digest: str) -> str:
+        return os.path.join(self._path, "objects", digest[:2], digest)
+
+    def _pointer(self, url: str) -> str:
+        return os.path.join(self._path, "urls",
+                            hashlib.sha256(url.encode()).hexdigest())
+
+    def lookup(self, url: str) -> Union[str, None]:
+        """Returns the path of the file downloaded from a URL, or None if
+        the URL hasn't been downloaded
+        """
+        try:
+            with open(self._pointer(url)) as fp:
+                path = self._object(fp.read().strip())
+        except FileNotFoundError:
+            return None
+        return path if os.path.exists(path) else None
+
+    async def store(self, url: str, chunks: AsyncIterator[bytes]) -> str:
+        """Writes a stream of chunks to the store, hashing them as they are
+        written, and records the URL they were downloaded from
+
+        :param url: the URL the chunks were downloaded from
+        :type url: str
+        :param chunks: the content of the file
+        :type chunks: AsyncIterator[bytes]
+        :return: the path of the stored file
+        :rtype: str
+        """
+        # Writes run in the default executor so a slow disk doesn't stall
+        # the event loop between chunks. The temporary file is created
+        # without awaiting, so a cancelled download can't leave it behind
+        loop = asyncio.get_running_loop()
+        digest = hashlib.sha256()
+        try:
+            fd, temp = tempfile.mkstemp(dir=self._path, suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as fp:
+                    async for chunk in chunks:
+                        digest.update(chunk)
+                        await loop.run_in_executor(None, fp.write, chunk)
+                path = self._object(digest.hexdigest())
+                await loop.run_in_executor(None, self._commit, temp, path)
+            except BaseException:
+                os.unlink(temp)
+                raise
+            await loop.run_in_executor(None, self._point, url, digest.hexdigest())
+        finally:
+            if (aclose := getattr(chunks, "aclose", None)) is not None:
+                await aclose()
+        return path
+
+    @staticmethod
+    def _commit(temp: str, path: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(temp, path)
+
+    def _point(self, url: str, digest: str) -> None:
+        with open(self._pointer(url), "w") as fp:
+            fp.write(digest)
+
+    @staticmethod
+    def open(path: str) -> memoryview:
+        """Maps a stored file into memory without copying it
+
+        :param path: the path of the file
+        :type path: str
+        :return: a read-only view of the content of the file
+        :rtype: memoryview
+        """
+        with open(path, "rb") as fp:
+            if os.fstat(fp.fileno()).st_size == 0:
+                return memoryview(b"")
+            return memoryview(mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ))
@@ -0,0 +1,153 @@
+import datetime
+import functools
+from typing import Any, Sequence, Union
+
+from .decorators import check_numpy_importable
+from .exceptions import VoyagerException
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+
+__all__ = [
+    'parse_datetime',
+    'parse_datetimes',
+    'from_julian',
+]
+
+
+_MONTHS = {
+    month: f"{number:02d}" for number, month in enumerate([
+        "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+        "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+    ], 1)
+}
+# Formats that can't be rewritten into ISO-8601, tried in order
+_FALLBACKS = [
+    "%b %Y",
+    "%B %Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%m/%d/%Y",
+    "%Y-%m",
+    "%Y",
+]
+_UNIX_EPOCH_JD = 2440587.5
+_UNIX_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def from_julian(jd: Union[float, str]) -> datetime.datetime:
+    """Converts a Julian date into a naive datetime on the same time scale
+
+    :param jd: the Julian date
+    :type jd: Union[float, str]
+    :rtype: datetime.datetime
+    """
+    return _UNIX_EPOCH + datetime.timedelta(days=float(jd) - _UNIX_EPOCH_JD)
+
+
+def _isoformat(text: str) -> str:
+    # "2020-Jan-01 00:00" -> "2020-01-01 00:00"
+    if len(text) >= 8 and text[4] == "-" and text[8:9] == "-" and text[5:8] in _MONTHS:
+        text = f"{text[:5]}{_MONTHS[text[5:8]]}{text[8:]}"
+    # "2020-01-01T00:00Z" -> "2020-01-01T00:00+00:00", needed before 3.11
+    if text.endswith(("Z", "z")):
+        text = f"{text[:-1]}+00:00"
+    return text
+
+
+def _naive(moment: datetime.datetime) -> datetime.datetime:
+    # Aware datetimes are converted to UTC so that every result compares
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse(text: str) -> datetime.datetime:
+    try:
+        return _naive(datetime.datetime.fromisoformat(_isoformat(text)))
+    except ValueError:
+        pass
+    try:
+        if "." in text and (jd := float(text)) > 1e6:
+            return from_julian(jd)
+    except ValueError:
+        pass
+    for fmt in _FALLBACKS:
+        try:
+            return datetime.datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    raise VoyagerException(f"{text} is not a recognised date format")
+
+
+def parse_datetime(value: Any) -> Union[datetime.datetime, None]:
+    """Parses a date or time in any of the formats used by the NASA APIs:
+    ISO-8601 with or without a ``Z`` suffix, ``YYYY-MM-DD HH:MM:SS``,
+    ``YYYY-Mon-DD HH:MM``, Julian dates and a few month-year forms.
+    Every result is a naive datetime, timestamps carrying a ``Z`` or an
+    offset being converted to UTC. Results are cached, so repeated
+    timestamps are parsed once and share one object
+
+    :param value: the value to parse
+    :type value: Any
+    :raises VoyagerException: the value is not in a recognised format
+    :return: the datetime, or None if the value is empty
+    :rtype: Union[datetime.datetime, None]
+    """
+    if value is None or value == "":
+        return None
+    elif isinstance(value, datetime.datetime):
+        return _naive(value)
+    elif isinstance(value, datetime.date):
+        return datetime.datetime(value.year, value.month, value.day)
+    elif isinstance(value, (int, float)):
+        return from_julian(value)
+    return _parse(value.strip())
+
+
+def _datetime64(text: str, unit: str) -> "np.datetime64":
+    try:
+        return np.datetime64(text, unit)
+    except ValueError:
+        return np.datetime64("NaT", unit)
+
+
+@check_numpy_importable
+def parse_datetimes(values: Union[Sequence, "np.ndarray"],
+                    unit: str = "s") -> "np.ndarray":
+    """Parses a column of dates or times into a datetime64 array in a
+    single vectorized pass. Accepts the same string formats as
+    :func:`parse_datetime` except the month-year forms, and converts
+    numeric columns as Julian dates. Missing or unparseable values become
+    NaT and ``Z`` or ``+00:00`` suffixes are dropped, the result being in
+    UTC
+
+    :param values: the values to parse
+    :type values: Union[Sequence, np.ndarray]
+    :param unit: the datetime64 unit of the result, defaults to "s"
+    :type unit: str, optional
+    :rtype: np.ndarray
+    """
+    column = np.asarray(values)
+    if column.size == 0:
+        return np.array([], dtype=f"datetime64[{unit}]")
+    elif column.dtype.kind in "iuf":
+        micros = (column.astype(np.float64) - _UNIX_EPOCH_JD) * 86400e6
+        micros = np.where(np.isnan(micros), np.iinfo(np.int64).min, np.round(micros))
+        return micros.astype(np.int64).astype("datetime64[us]").astype(f"datetime64[{unit}]")
+    column = column.astype(str)
+    column = np.where(np.isin(column, ["", "None", "null"]), "NaT", column)
+    for month, number in _MONTHS.items():
+        column = np.char.replace(column, f"-{month}-", f"-{number}-")
+    column = np.char.replace(np.char.rstrip(column, "Zz"), "+00:00", "")
+    try:
+        return column.astype(f"datetime64[{unit}]")
+    except ValueError:
+        # Like the Arrow export, values that can't be parsed become NaT
+        # rather than failing the whole column
+        return np.array([_datetime64(value, unit) for value in column],
+                        dtype=f"datetime64[{unit}]")
@@ -1,6 +1,8 @@
 import asyncio
-import datetime
+import collections
 import functools
+import itertools
+import time
 import weakref
 from asyncio.coroutines import iscoroutine, iscoroutinefunction
 
@@ -30,6 +32,46 @@ def check_pil_importable(func: callable):
     return decorator
 
 
+def check_numpy_importable(func: callable):
+    @functools.wraps(func)
+    def decorator(*args, **kwargs):
+        """Decorator interface to check if the NumPy module can be
+        imported
+
+        :param func: the function to decorate
+        :type func: callable
+        :raises MissingDependency: error raised if NumPy cannot be imported
+        :return: the return value of the function
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise MissingDependency("numpy")
+        else:
+            return func(*args, **kwargs)
+    return decorator
+
+
+def check_pyarrow_importable(func: callable):
+    @functools.wraps(func)
+    def decorator(*args, **kwargs):
+        """Decorator interface to check if the PyArrow module can be
+        imported
+
+        :param func: the function to decorate
+        :type func: callable
+        :raises MissingDependency: error raised if PyArrow cannot be imported
+        :return: the return value of the function
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise MissingDependency("pyarrow")
+        else:
+            return func(*args, **kwargs)
+    return decorator
+
+
 def apply_cache(max_size: int = None):
     def actual_decorator(func: callable):
         if iscoroutine(func) or iscoroutinefunction(func):
@@ -46,6 +88,100 @@ def apply_cache(max_size: int = None):
     return actual_decorator
 
 
+_MISSING = object()
+_lazy_limit = None
+# (store token, name) -> weak reference to the store, least recently used first
+_lazy_entries = collections.OrderedDict()
+# store token -> the names of the store that are in _lazy_entries
+_lazy_names = {}
+_lazy_tokens = itertools.count()
+
+
+class _LazyStore(dict):
+    """The values memoized on one instance. Unlike a plain dict it can be
+    weakly referenced, and its token, unlike its id, is never reused
+    """
+    __slots__ = [
+        'token',
+        '__weakref__',
+    ]
+
+    def __init__(self) -> None:
+        super(_LazyStore, self).__init__()
+        self.token = next(_lazy_tokens)
+
+
+def set_lazy_limit(limit: int = None) -> None:
+    """Bounds the total number of values memoized by :class:`lazy_property`
+    across every live resource. The least recently used values are dropped
+    first and recomputed on their next access
+
+    :param limit: the maximum number of memoized values, None for no limit,
+        defaults to None
+    :type limit: int, optional
+    """
+    global _lazy_limit
+    _lazy_limit = limit
+    if limit is None:
+        _lazy_entries.clear()
+        _lazy_names.clear()
+    else:
+        _evict_lazy()
+
+
+def _remember_lazy(store: _LazyStore, name: str) -> None:
+    if (names := _lazy_names.get(store.token)) is None:
+        names = _lazy_names[store.token] = set()
+        # Entries only hold weak references, and go once the store is collected
+        weakref.finalize(store, _forget_lazy, store.token).atexit = False
+    names.add(name)
+    _lazy_entries[(store.token, name)] = weakref.ref(store)
+    _evict_lazy()
+
+
+def _forget_lazy(token: int) -> None:
+    for name in _lazy_names.pop(token, ()):
+        _lazy_entries.pop((token, name), None)
+
+
+def _evict_lazy() -> None:
+    while len(_lazy_entries) > _lazy_limit:
+        (token, name), ref = _lazy_entries.popitem(last=False)
+        _lazy_names.get(token, set()).discard(name)
+        if (store := ref()) is not None:
+            store.pop(name, None)
+
+
+class lazy_property(object):
+    """Property whose value is computed on first access and then kept on the
+    instance, in the dict held by its ``_lazy`` slot. Values live and die
+    with the instance that owns them
+    """
+
+    def __init__(self, func: callable) -> None:
+        self._func = func
+        self._name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: object, owner: type = None):
+        if instance is None:
+            return self
+        try:
+            store = instance._lazy
+        except AttributeError:
+            store = instance._lazy = _LazyStore()
+        if (value := store.get(self._name, _MISSING)) is _MISSING:
+            value = store[self._name] = self._func(instance)
+            if _lazy_limit is not None:
+                _remember_lazy(store, self._name)
+        elif _lazy_limit is not None and (store.token, self._name) in _lazy_entries:
+            _lazy_entries.move_to_end((store.token, self._name))
+        return value
+
+
 class LockManager():
     def __init__(self, lock: asyncio.Lock):
         self.lock = lock
@@ -63,22 +199,198 @@ class LockManager():
 
 
 class RateLimit(object):
-    def __init__(self, max_calls: int = 1000,
-                 period: int = 3600, silent_ignore: bool = False) -> None:
+    """Client-side token bucket shared by every request made with one API key
+
+    The bucket holds at most ``max_calls`` tokens and refills continuously at
+    ``max_calls / period`` tokens per second. Callers await :meth:`acquire`
+    instead of failing when the bucket is empty, so bursts are smoothed out to
+    the maximum sustainable rate. :meth:`update` re-seeds the bucket from the
+    ``X-RateLimit-Limit`` and ``X-RateLimit-Remaining`` response headers.
+
+    :param max_calls: the number of calls allowed per period, defaults to 1000
+    :type max_calls: int, optional
+    :param period: the length of the period in seconds, defaults to 3600
+    :type period: int, optional
+    """
+    __slots__ = [
+        '_max_calls',
+        '_period',
+        '_tokens',
+        '_updated',
+        '_lock',
+    ]
+
+    def __init__(self, max_calls: int = 1000, period: int = 3600) -> None:
         self._max_calls = max_calls
         self._period = period
-        self._now = lambda: int(datetime.datetime.now())
-        self._silent = silent_ignore
-        self._latest_reset = self.now()
-        self._calls = 0
-        self._locks = weakref.WeakValueDictionary()
-
-    def __call__(self, route):
-        def actual_decorator(func):
-            @functools.wraps(func)
-            async def limiter(*args, **kwargs):
-                lock = self._locks.get(route, None)
-                if not lock:
-                    lock = asyncio.Lock()
-                    self._locks[route] = lock
-                await lock.acquire()
\ No newline at end of file
+        self._tokens = float(max_calls)
+        self._updated = time.monotonic()
+        self._lock = None
+
+    def __call__(self, func: callable):
+        @functools.wraps(func)
+        async def limiter(*args, **kwargs):
+            await self.acquire()
+            return await func(*args, **kwargs)
+        return limiter
+
+    @property
+    def limit(self) -> int:
+        return self._max_calls
+
+    @property
+    def remaining(self) -> int:
+        self._refill()
+        return int(self._tokens)
+
+    @property
+    def rate(self) -> float:
+        return self._max_calls / self._period
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            float(self._max_calls),
+            self._tokens + (now - self._updated) * self.rate,
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Waits until a token is available and consumes it. Waiters are
+        served in the order they arrived
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def update(self, limit: int = None, remaining: int = None) -> None:
+        """Re-seeds the bucket from the rate limit reported by the server
+
+        :param limit: the value of the X-RateLimit-Limit header
+        :type limit: int, optional
+        :param remaining: the value of the X-RateLimit-Remaining header
+        :type remaining: int, optional
+        """
+        self._refill()
+        if limit:
+            self._max_calls = limit
+            self._tokens = min(self._tokens, float(limit))
+        if remaining is not None:
+            self._tokens = min(self._tokens, float(remaining))
+
+    def drain(self) -> None:
+        """Empties the bucket, used when the server answers with a 429"""
+        self._refill()
+        self._tokens = 0.0
+
+
+class AdaptiveLimiter(object):
+    """Adaptive concurrency limit for the requests sent to one host
+
+    The limit follows additive increase / multiplicative decrease: it grows
+    by roughly one slot per round trip while latency stays close to the
+    observed baseline, and it is cut by ``decrease`` when a request is
+    overloaded (a 429 or 5xx answer, or a connection failure) or when its
+    latency rises past ``tolerance`` times the baseline. At most one cut is
+    made per round trip so that a burst of failures doesn't collapse the limit.
+
+    :param initial: the starting limit, defaults to 4
+    :type initial: int, optional
+    :param min_limit: the lowest the limit can go, defaults to 1
+    :type min_limit: int, optional
+    :param max_limit: the highest the limit can go, defaults to 64
+    :type max_limit: int, optional
+    :param decrease: the factor the limit is multiplied by on overload, defaults to 0.5
+    :type decrease: float, optional
+    :param tolerance: how many times the baseline latency counts as congested, defaults to 2.0
+    :type tolerance: float, optional
+    :param smoothing: the weight of a new sample in the latency averages, defaults to 0.1
+    :type smoothing: float, optional
+    """
+    __slots__ = [
+        '_limit',
+        '_min_limit',
+        '_max_limit',
+        '_decrease',
+        '_tolerance',
+        '_smoothing',
+        '_inflight',
+        '_waiters',
+        '_baseline',
+        '_latency',
+        '_last_decrease',
+    ]
+
+    def __init__(self, initial: int = 4, min_limit: int = 1,
+                 max_limit: int = 64, decrease: float = 0.5,
+                 tolerance: float = 2.0, smoothing: float = 0.1) -> None:
+        self._limit = float(initial)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._decrease = decrease
+        self._tolerance = tolerance
+        self._smoothing = smoothing
+        self._inflight = 0
+        self._waiters = collections.deque()
+        self._baseline = None
+        self._latency = None
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        return max(self._min_limit, int(self._limit))
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    async def acquire(self) -> None:
+        while self._inflight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+        self._inflight += 1
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        """Releases a slot and adjusts the limit from the outcome of the request
+
+        :param latency: the number of seconds the request took
+        :type latency: float
+        :param overloaded: whether the host signalled overload, defaults to False
+        :type overloaded: bool, optional
+        """
+        self._inflight -= 1
+        now = time.monotonic()
+        if self._baseline is None:
+            self._baseline = self._latency = latency
+        else:
+            s = self._smoothing
+            self._latency = (1 - s) * self._latency + s * latency
+            self._baseline = min((1 - s / 10) * self._baseline + s / 10 * latency,
+                                 self._latency)
+        congested = self._latency > self._baseline * self._tolerance
+        if overloaded or congested:
+            if now - self._last_decrease >= self._latency:
+                self._limit = max(float(self._min_limit), self._limit * self._decrease)
+                self._last_decrease = now
+        else:
+            self._limit = min(float(self._max_limit), self._limit + 1 / self._limit)
+        self._wake()
+
+    def _wake(self) -> None:
+        available = self.limit - self._inflight
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
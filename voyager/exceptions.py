@@ -14,6 +14,7 @@ class HTTPException(VoyagerException):
     def __init__(self, code: int) -> None:
         message = f"HTTP Error Code: {code}"
         super(HTTPException, self).__init__(message)
+        self.code = code
 
 
 class RateLimitException(VoyagerException):
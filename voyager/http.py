@@ -1,152 +1,326 @@
 import asyncio
 import datetime
+import json
 from collections import namedtuple
-from typing import List, Tuple
+from typing import Any, AsyncIterator, Callable, Tuple, Union
 
 import aiohttp
 import yarl
 from aiohttp.client_reqrep import ClientResponse
 
+from .cache import BaseCache, MemoryCache
+from .decorators import AdaptiveLimiter, RateLimit
 from .exceptions import HTTPException, RateLimitException
 from .resources import (APODResource, CMEAnalysisResource, CMEResource,
-                        GSTResource, NEOResource)
-from .utils import ROUTES, VALID_KEYS
+                        EPICResource, FLRResource, GSTResource, HSSResource,
+                        IPSResource, MPCResource, NEOResource,
+                        NotificationResource, RBEResource, SEPResource,
+                        WSAResource)
+from .retry import RetryPolicy
+from .utils import BASE_URL, ROUTES, VALID_KEYS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 _RLS = namedtuple("RatelimitStatus", ['limit', 'remaining'])
+_Route = namedtuple("Route", ['url', 'valid_keys', 'resource', 'many', 'bucket', 'meta', 'stream'],
+                    defaults=[None, False])
+
+
+def _route(name: str, resource: type, many: bool, meta: dict = None,
+           stream: bool = False) -> _Route:
+    return _Route(BASE_URL + ROUTES[name], VALID_KEYS[name], resource, many, 'api_key', meta, stream)
+
+
+_ROUTES = {
+    'apod': _route('apod', APODResource, False),
+    'neo-feed': _route('neo-feed', NEOResource, False, {'search_type': 'feed-query'}),
+    'neo-lookup': _route('neo-lookup', NEOResource, False, {'search_type': 'lookup'}),
+    'neo-browse': _route('neo-browse', NEOResource, False, {'search_type': 'browse'}),
+    'cme': _route('cme', CMEResource, True),
+    'cme-a': _route('cme-a', CMEAnalysisResource, True),
+    'gst': _route('gst', GSTResource, True),
+    'ips': _route('ips', IPSResource, True),
+    'flr': _route('flr', FLRResource, True),
+    'sep': _route('sep', SEPResource, True),
+    'mpc': _route('mpc', MPCResource, True),
+    'rbe': _route('rbe', RBEResource, True),
+    'hss': _route('hss', HSSResource, True),
+    'wsa-enlil': _route('wsa-enlil', WSAResource, True),
+    'notifications': _route('notifications', NotificationResource, True),
+    'epic': _route('epic', EPICResource, True, stream=True),
+    'epic-date': _route('epic-date', EPICResource, True, stream=True),
+}
 
 
 class HTTPClient():
     def __init__(self,
                  session: aiohttp.ClientSession = None,
-                 api_key: str = "DEMO KEY",
-                 cache_size: int = None,
+                 api_key: str = "DEMO_KEY",
+                 cache: BaseCache = None,
+                 cache_size: int = 128,
+                 retry_policy: RetryPolicy = None,
+                 max_concurrency: int = 64,
+                 json_loads: Callable[[bytes], Any] = None,
+                 connections: int = 100,
+                 connections_per_host: int = 10,
+                 dns_ttl: int = 300,
+                 keepalive_timeout: float = 30.0,
+                 timeout: float = 60.0,
+                 connect_timeout: float = 10.0,
                  loop: asyncio.AbstractEventLoop = None) -> None:
-        self._key = api_key,
-        self._cache_size = cache_size,
+        self._key = api_key
+        if cache is None and cache_size != 0:
+            cache = MemoryCache(max_size=cache_size)
+        self._cache = cache
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._max_concurrency = max_concurrency
+        self._limiters = {}
+        self._ratelimits = {}
+        self._json_loads = json_loads or (orjson.loads if orjson else json.loads)
         try:
             self._loop = loop or asyncio.get_running_loop()
         except RuntimeError:
             self._loop = asyncio.get_event_loop()
-        self._session = session or aiohttp.ClientSession(
-            headers={
-                'Content-Type': 'application/json',
-                'User-Agent': 'apodasync Python Library by @marwynnsomridhivej',
-            },
-            loop=self._loop,
-        )
-        self._mapping = {
-            'apod': '_get_apod',
-            'neo': '_get_neo',
-            'cme': '_get_cme',
-            'cme-a': '_get_cme_a',
-            'gst': '_get_gst',
-            'ips': '_get_ips',
-            'flr': '_get_flr',
-            'sep': '_get_sep',
-            'mpc': '_get_mpc',
-            'rbe': '_get_rbe',
-            'hss': '_get_hss',
-            'wsa-enlil': '_get_wsa_enlil',
+        self._session = session
+        self._owns_session = session is None
+        self._connector_options = {
+            'limit': connections,
+            'limit_per_host': connections_per_host,
+            'ttl_dns_cache': dns_ttl,
+            'keepalive_timeout': keepalive_timeout,
         }
-        self._bucket = {}
-        self._rls = {}
+        self._timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self._inflight = {}
+
+    @property
+    def cache(self) -> Union[BaseCache, None]:
+        return self._cache
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self._retry_policy
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._owns_session and (self._session is None or self._session.closed):
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self._connector_options),
+                timeout=self._timeout,
+                headers={
+                    'Content-Type': 'application/json',
+                    'User-Agent': 'apodasync Python Library by @marwynnsomridhivej',
+                },
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def get_limiter(self, host: str) -> AdaptiveLimiter:
+        if (limiter := self._limiters.get(host)) is None:
+            limiter = self._limiters[host] = AdaptiveLimiter(
+                initial=min(4, self._max_concurrency),
+                max_limit=self._max_concurrency,
+            )
+        return limiter
+
+    async def stream(self, url: str, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """Downloads a file in chunks over the shared session, holding a
+        slot of the host's concurrency limit until the body is consumed
+
+        :param url: the URL of the file
+        :type url: str
+        :param chunk_size: the largest number of bytes per chunk, defaults to 65536
+        :type chunk_size: int, optional
+        :raises HTTPException: the server didn't answer with a 200
+        """
+        limiter = self.get_limiter(yarl.URL(url).host)
+        await limiter.acquire()
+        start, overloaded = self._loop.time(), True
+        try:
+            async with self.session.get(url) as response:
+                overloaded = response.status == 429 or response.status >= 500
+                if response.status != 200:
+                    raise HTTPException(response.status)
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    yield chunk
+        finally:
+            limiter.release(self._loop.time() - start, overloaded=overloaded)
 
     def replace_key(self, new_key: str) -> None:
         self._key = new_key
 
-    def get_ratelimit(self, route: str) -> namedtuple:
-        return self._rls.get(route, None)
+    @property
+    def ratelimit(self) -> RateLimit:
+        if (rl := self._ratelimits.get(self._key)) is None:
+            rl = self._ratelimits[self._key] = RateLimit()
+        return rl
+
+    def get_ratelimit(self, route: str = None) -> namedtuple:
+        return _RLS(self.ratelimit.limit, self.ratelimit.remaining)
+
+    def _update_ratelimit(self, response: ClientResponse) -> None:
+        if response.status == 429:
+            self.ratelimit.drain()
+        limit = response.headers.get("X-RateLimit-Limit")
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        self.ratelimit.update(
+            limit=int(limit) if limit else None,
+            remaining=int(remaining) if remaining else None,
+        )
+
+    def _format_value(self, value: Any) -> Union[str, int, float]:
+        if isinstance(value, bool):
+            return str(value).lower()
+        elif isinstance(value, datetime.datetime):
+            return value.strftime("%Y-%m-%d")
+        elif isinstance(value, datetime.date):
+            return value.isoformat()
+        return value
 
     def _ensure_valid_query(self, route: str, **options) -> dict:
         return {
-            key: value for key, value in options.items()
-            if key in VALID_KEYS[route]
+            key: self._format_value(value) for key, value in options.items()
+            if key in _ROUTES[route].valid_keys and value is not None
         }
 
+    def _request_key(self, url: str) -> str:
+        url = yarl.URL(url)
+        query = sorted(
+            (key, value) for key, value in url.query.items()
+            if key != "api_key"
+        )
+        return str(url.with_query(query))
+
     def _get_url(self, route: str, **options) -> str:
+        spec = _ROUTES[route]
         valid_options = self._ensure_valid_query(route, **options)
-        valid_options['api_key'] = self._key
-        url = yarl.URL.build(
-            scheme="https",
-            host="api.nasa.gov",
-            path=ROUTES[route],
-            query=valid_options,
-        )
+        if spec.bucket == 'api_key':
+            valid_options['api_key'] = self._key
+        url = yarl.URL(spec.url.format(**options)).with_query(valid_options)
         return str(url)
 
-    async def request(self, route: str, method: str = None, **options) -> APODResource:
-        url = options.get("url") or self._get_url(route, **options)
-        for tries in range(5):
-            if (rls := self._rls.get(route, None)):
-                if rls.remaining == 0:
-                    raise RateLimitException()
-            await asyncio.sleep(2 ** tries if tries else 0)
+    async def request(self, route: str, method: str = None,
+                      revalidate: bool = False, **options) -> Any:
+        url = options.pop("url", None) or self._get_url(route, **options)
+        key = self._request_key(url)
+        if (inflight := self._inflight.get(key)) is not None:
             try:
-                response, ret = await self._mapping.get(route)(self, url=url, method=method, **options)
-                return ret
-            except OSError as e:
-                if tries < 4 and e.errno in (54, 10054):
-                    continue
-                raise e
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                return await self.request(route, method=method, url=url,
+                                          revalidate=revalidate, **options)
+        inflight = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            ret = await self._request(route, url, key, method=method,
+                                      revalidate=revalidate, **options)
+        except asyncio.CancelledError:
+            inflight.cancel()
+            raise
+        except Exception as e:
+            inflight.set_exception(e)
+            inflight.exception()
+            raise
         else:
-            raise HTTPException(response.status)
-
-    async def _get_apod(self, url: str = None, **kwargs) -> Tuple[ClientResponse, APODResource]:
-        async with self._session.get(url) as response:
-            raw = await response.read()
-            ret = await response.json()
-            ret['raw'], ret['query_url'], ret['code'] = raw, url, response.status
-            limit = int(response.headers.get("X-RateLimit-Limit"))
-            remaining = int(response.headers.get("X-RateLimit-Remaining"))
-        self._rls['apod'] = _RLS(limit, remaining)
-        if limit - remaining == 1:
-            self._bucket['apod'] = int(datetime.datetime.now())
-        return response, APODResource(ret, loop=self._loop)
-
-    async def _get_neo(self, url: str = None, **kwargs) -> Tuple[ClientResponse, NEOResource]:
-        search_type = kwargs.get("search_type")
-        async with self._session.get(url) as response:
-            ret = await response.json()
-            ret['query_url'], ret['code'], ret['search_type'] = url, response.status, search_type
-            limit = int(response.headers.get("X-RateLimit-Limit"))
-            remaining = int(response.headers.get("X-RateLimit-Remaining"))
-        self._rls['neo'] = _RLS(limit, remaining)
-        if limit - remaining == 1:
-            self._bucket['neo'] = int(datetime.datetime.now())
-        return response, NEOResource(ret, loop=self._loop)
-
-    async def _get_cme(self, url: str = None, **kwargs) -> Tuple[ClientResponse, List[CMEResource]]:
-        async with self._session.get(url) as response:
-            ret = await response.json()
-            for subdict in ret:
-                subdict['query_url'], subdict['code'] = url, response.status
-            limit = int(response.headers.get("X-RateLimit-Limit"))
-            remaining = int(response.headers.get("X-RateLimit-Remaining"))
-        self._rls['cme'] = _RLS(limit, remaining)
-        if limit - remaining == 1:
-            self._bucket['cme'] = int(datetime.datetime.now())
-        return response, [CMEResource(data, loop=self._loop) for data in ret]
-
-    async def _get_cme_a(self, url: str = None, **kwargs) -> Tuple[ClientResponse, List[CMEAnalysisResource]]:
-        async with self._session.get(url) as response:
-            ret = await response.json()
-            for subdict in ret:
-                subdict['query_url'], subdict['code'] = url, response.status
-            limit = int(response.headers.get("X-RateLimit-Limit"))
-            remaining = int(response.headers.get("X-RateLimit-Remaining"))
-        self._rls['cme'] = _RLS(limit, remaining)
-        if limit - remaining == 1:
-            self._bucket['cme'] = int(datetime.datetime.now())
-        return response, [CMEAnalysisResource(data, loop=self._loop) for data in ret]
-
-    async def _get_gst(self, url: str = None, **kwargs) -> Tuple[ClientResponse, List[GSTResource]]:
-        async with self._session.get(url) as response:
-            ret = await response.json()
-            for subdict in ret:
-                subdict['query_url'], subdict['code'] = url, response.status
-            limit = int(response.headers.get("X-RateLimit-Limit"))
-            remaining = int(response.headers.get("X-RateLimit-Remaining"))
-        self._rls['gst'] = _RLS(limit, remaining)
-        if limit - remaining == 1:
-            self._bucket['gst'] = int(datetime.datetime.now())
-        return response, [GSTResource(data, loop=self._loop) for data in ret]
+            inflight.set_result(ret)
+            return ret
+        finally:
+            del self._inflight[key]
+
+    async def _request(self, route: str, url: str, key: str,
+                       method: str = None, revalidate: bool = False,
+                       **options) -> Any:
+        spec = _ROUTES[route]
+        stale, headers = None, {}
+        if (cache := self._cache) is not None:
+            # A revalidating request skips fresh entries but still sends
+            # their validators, so an unchanged response costs a 304
+            if not revalidate and (data := await cache.call(cache.get, key)) is not None:
+                return self._build(spec, url, 200, data)
+            if (stale := await cache.call(cache.get_stale, key)) is not None:
+                if stale.etag:
+                    headers['If-None-Match'] = stale.etag
+                if stale.last_modified:
+                    headers['If-Modified-Since'] = stale.last_modified
+        policy = self._retry_policy
+        policy.record_request()
+        start, attempt = self._loop.time(), 0
+        while True:
+            if spec.bucket == 'api_key':
+                await self.ratelimit.acquire()
+            attempt += 1
+            try:
+                response, data = await self._fetch(url, method=method, headers=headers)
+            except Exception as e:
+                if not policy.retries_exception(e):
+                    raise
+                if (delay := policy.next_delay(attempt, self._loop.time() - start)) is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            if policy.retries_status(response.status):
+                delay = policy.next_delay(attempt, self._loop.time() - start,
+                                          retry_after=response.headers.get("Retry-After"))
+                if delay is None:
+                    if response.status == 429:
+                        raise RateLimitException()
+                    raise HTTPException(response.status)
+                await asyncio.sleep(delay)
+                continue
+            break
+        if data is None and spec.many and response.status == 200:
+            # DONKI answers a window without events with an empty body
+            data = []
+        if cache is not None:
+            ttl = cache.ttl_for(route, options)
+            if response.status == 304 and stale is not None:
+                data = await cache.call(cache.revalidate, key, stale, ttl=ttl)
+                return self._build(spec, url, 200, data)
+            elif response.status == 200:
+                await cache.call(cache.set, key, data, ttl=ttl,
+                                 etag=response.headers.get("ETag"),
+                                 last_modified=response.headers.get("Last-Modified"))
+        return self._build(spec, url, response.status, data)
+
+    async def _fetch(self, url: str, method: str = None,
+                     headers: dict = None) -> Tuple[ClientResponse, Any]:
+        limiter = self.get_limiter(yarl.URL(url).host)
+        await limiter.acquire()
+        start, overloaded = self._loop.time(), True
+        try:
+            async with self.session.request(method or "GET", url, headers=headers) as response:
+                self._update_ratelimit(response)
+                overloaded = response.status == 429 or response.status >= 500
+                if response.status == 304 or self._retry_policy.retries_status(response.status):
+                    return response, None
+                body = await response.read()
+                if not body.strip():
+                    # Like response.json(), a blank body carries no data
+                    return response, None
+                try:
+                    data = self._json_loads(body)
+                except ValueError:
+                    # Error pages, such as the one sent for an invalid API
+                    # key, aren't always JSON
+                    if response.status != 200:
+                        raise HTTPException(response.status) from None
+                    raise
+            return response, data
+        finally:
+            limiter.release(self._loop.time() - start, overloaded=overloaded)
+
+    def _build(self, spec: _Route, url: str, code: int, data: Any) -> Any:
+        meta = dict(spec.meta or {}, query_url=url, code=code)
+        options = {'stream': self.stream} if spec.stream else {}
+        if not spec.many:
+            return spec.resource(dict(data or {}, **meta), loop=self._loop, **options)
+        elif not isinstance(data, list):
+            raise HTTPException(code)
+        return [spec.resource(dict(subdict, **meta), loop=self._loop, **options)
+                for subdict in data]
@@ -1,6 +1,8 @@
+from .base import *
 from .apodresource import *
 from .cadresource import *
 from .cmeresource import *
+from .donkigraph import *
 from .earthresource import *
 from .eonetresource import *
 from .epicresource import *
@@ -24,6 +26,7 @@ from .sentryresource import *
 from .sepresource import *
 from .techportresource import *
 from .techtransferresource import *
+from .wsaanalytics import *
 from .wsaresource import *
 
 
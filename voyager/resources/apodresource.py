@@ -3,7 +3,8 @@ from asyncio.events import AbstractEventLoop
 from io import BytesIO
 from typing import Tuple, Union
 
-from ..decorators import check_pil_importable
+from ..dates import parse_datetime
+from ..decorators import check_pil_importable, lazy_property
 from .base import BaseResource
 
 try:
@@ -29,7 +30,6 @@ class APODResource(BaseResource):
         '_bytes',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -86,14 +86,12 @@ class APODResource(BaseResource):
 
     def _process_datetime(self) -> datetime.datetime:
         if not isinstance(self._date, datetime.datetime):
-            return datetime.datetime.strptime(self._date)
+            return parse_datetime(self._date)
         return self._date
 
-    @property
+    @lazy_property
     def datetime(self) -> datetime.datetime:
-        if self not in self._cache:
-            self._cache[self] = self._process_datetime()
-        return self._cache[self]
+        return self._process_datetime()
 
     @property
     def error(self) -> Tuple[int, str, str]:
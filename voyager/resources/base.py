@@ -1,19 +1,75 @@
 import asyncio
 from asyncio.events import AbstractEventLoop, AbstractEventLoopPolicy
-from typing import Union
+from collections.abc import Sequence
+from typing import Any, Callable, Union
 
 
 __all__ = [
     'BaseResource',
+    'LazySequence',
 ]
 
 
+_UNBUILT = object()
+
+
+class LazySequence(Sequence):
+    """Read-only sequence of records built from raw response data
+
+    A record is only built the first time it is accessed and is then kept,
+    so the sequence can be indexed, sliced and iterated any number of times
+    without building anything twice
+
+    :param raw: the raw data of each record
+    :type raw: Sequence
+    :param factory: the callable that builds a record from its raw data
+    :type factory: Callable
+    """
+    __slots__ = [
+        '_raw',
+        '_factory',
+        '_items',
+    ]
+
+    def __init__(self, raw: Sequence, factory: Callable[[Any], Any]) -> None:
+        self._raw = raw
+        self._factory = factory
+        self._items = [_UNBUILT] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        if (item := self._items[index]) is _UNBUILT:
+            item = self._items[index] = self._factory(self._raw[index])
+        return item
+
+    def __iter__(self):
+        for index in range(len(self._items)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        built = sum(item is not _UNBUILT for item in self._items)
+        return f"<LazySequence len={len(self._items)} built={built}>"
+
+
+def _as_sequence(value: Any) -> Sequence:
+    if value is None:
+        return ()
+    elif isinstance(value, (LazySequence, list)):
+        return value
+    return (value,)
+
+
 class BaseResource(object):
     __slots__ = [
         '_query_url',
         '_code',
         '_loop',
         '_attrs',
+        '_lazy',
     ]
 
     def __init__(self, attrs: dict, loop: AbstractEventLoop = None) -> None:
@@ -1,15 +1,34 @@
+from __future__ import annotations
+
 import datetime
 from asyncio.events import AbstractEventLoop
-from typing import Generator, List, Union
+from typing import Dict, List, Union
 
+from ..dates import parse_datetime, parse_datetimes
+from ..decorators import check_numpy_importable, lazy_property
 from ..exceptions import VoyagerException
-from .base import BaseResource
+from .base import BaseResource, LazySequence, _as_sequence
+from .columns import float_column, string_matrix
+from .tables import ArrowExport, from_matrix
 
 __all__ = [
     'CADResource',
 ]
 
 
+_FLOAT_FIELDS = [
+    'jd',
+    'dist',
+    'dist_min',
+    'dist_max',
+    'v_rel',
+    'v_inf',
+    'h',
+    'diameter',
+    'diameter_sigma',
+]
+
+
 class CADRecord(object):
     __slots__ = [
         '_fc',
@@ -26,6 +45,7 @@ class CADRecord(object):
         '_body',
         '_h',
         '_fullname',
+        '_lazy',
     ]
     _FIELDS = [
         'des',
@@ -42,21 +62,18 @@ class CADRecord(object):
         'h',
         'fullname',
     ]
-    _cache = {}
 
     def __init__(self, data: List[str], fields: List[str]) -> None:
-        self._fc = self._FIELDS.copy()
-        for field, value in zip(fields, data):
-            setattr(self, f"_{field}", value)
-            self._FIELDS.remove(field)
         for unset in self._FIELDS:
             setattr(self, f"_{unset}", None)
+        self._fc = []
+        for field, value in zip(fields, data):
+            if field in self._FIELDS:
+                setattr(self, f"_{field}", value)
+                self._fc.append(field)
 
     def __len__(self) -> int:
-        if (l := "len") not in self._cache:
-            self._cache[l] = len(self._fc) - len(self._FIELDS)
-            del self._FIELDS
-        return self._cache[l]
+        return len(self._fc)
 
     @property
     def des(self) -> Union[str, None]:
@@ -82,7 +99,7 @@ class CADRecord(object):
     def cd_datetime(self) -> Union[datetime.datetime, None]:
         if not self._cd:
             return None
-        return datetime.datetime.strptime(self._cd, "%Y-%b-%d %H:%M")
+        return parse_datetime(self._cd)
 
     @property
     def dist(self) -> Union[float, None]:
@@ -137,13 +154,11 @@ class CADRecord(object):
         return self._fullname
 
     def _process_dict(self) -> dict:
-        return {field: getattr(self, f"_{field}") for field in self._fc}
+        return {field: getattr(self, f"_{field}") for field in self._FIELDS}
 
-    @property
+    @lazy_property
     def to_dict(self) -> dict:
-        if self not in self._cache:
-            self._cache[self] = self._process_dict()
-        return self._cache[self]
+        return self._process_dict()
 
     @classmethod
     def from_dict(cls, data: dict) -> "CADRecord":
@@ -152,14 +167,13 @@ class CADRecord(object):
         return cls([value for value in data.values()], [key for key in data])
 
 
-class CADResource(BaseResource):
+class CADResource(BaseResource, ArrowExport):
     __slots__ = [
         '_signature',
         '_count',
         '_fields',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -173,11 +187,7 @@ class CADResource(BaseResource):
         return self.count
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        for cr in self.data:
-            yield cr
+        return iter(_as_sequence(self.data))
 
     @property
     def signature(self) -> dict:
@@ -199,20 +209,48 @@ class CADResource(BaseResource):
     def fields(self) -> List[str]:
         return self._fields
 
-    def _process_cad_data(self) -> Union[Generator[CADRecord, None, None], CADRecord, None]:
+    def _process_cad_data(self) -> Union[LazySequence[CADRecord], CADRecord, None]:
         if not (cad := self._data.get("data")):
             return None
         elif len(cad) != 1:
-            for values in cad:
-                yield CADRecord(values, self._fields)
+            return LazySequence(cad, lambda values: CADRecord(values, self._fields))
         else:
             return CADRecord(cad[0], self._fields)
 
-    @property
-    def data(self) -> Union[Generator[CADRecord, None, None], CADRecord, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_cad_data()
-        return self._cache[self]
+    @lazy_property
+    def data(self) -> Union[LazySequence[CADRecord], CADRecord, None]:
+        return self._process_cad_data()
+
+    def _arrow_table(self) -> "pa.Table":
+        return from_matrix(
+            self._fields or [],
+            self._data.get("data") or [],
+            types={field: float for field in _FLOAT_FIELDS},
+            timestamps={"cd": "%Y-%b-%d %H:%M"},
+        )
+
+    @check_numpy_importable
+    def to_columns(self) -> Dict[str, "np.ndarray"]:
+        """Returns the close approach data as one typed NumPy array per
+        field, parsed column by column without building any records.
+        ``jd``, the distances, velocities, ``h`` and diameters are float64
+        with NaN for missing values, ``cd`` is datetime64 and every other
+        field is a string array
+
+        :return: the arrays keyed by field name, in the order of the fields
+        :rtype: Dict[str, np.ndarray]
+        """
+        fields = self._fields or []
+        matrix = string_matrix(self._data.get("data") or [], len(fields))
+        columns = {}
+        for index, field in enumerate(fields):
+            if field in _FLOAT_FIELDS:
+                columns[field] = float_column(matrix[:, index])
+            elif field == "cd":
+                columns[field] = parse_datetimes(matrix[:, index], unit="m")
+            else:
+                columns[field] = matrix[:, index]
+        return columns
 
     @property
     def to_dict(self) -> dict:
@@ -1,12 +1,17 @@
+import bisect
 import datetime
 from asyncio.events import AbstractEventLoop
-from typing import Any, List, Union
+from typing import Any, Iterable, List, Tuple, Union
 
+from ..dates import parse_datetime
+from ..decorators import lazy_property
+from ..exceptions import VoyagerException
 from .base import BaseResource
 
 __all__ = [
     'CMEResource',
     'CMEAnalysisResource',
+    'CMEAnalysisIndex',
 ]
 
 
@@ -16,8 +21,8 @@ class CMEImpact(object):
         '_location',
         '_arrival_time',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._glancing = data.get("isGlancingBlow")
@@ -37,14 +42,12 @@ class CMEImpact(object):
     def arrival_time(self) -> str:
         return self._arrival_time
 
-    def _process_arrival(self) -> datetime.datetime:  # TODO: Implement datetime.datetime version
-        return
+    def _process_arrival(self) -> Union[datetime.datetime, None]:
+        return parse_datetime(self._arrival_time)
 
-    @property
+    @lazy_property
     def arrival_datetime(self) -> datetime.datetime:
-        if self not in self._cache:
-            self._cache[self] = self._process_arrival()
-        return self._cache[self]
+        return self._process_arrival()
 
     @property
     def to_dict(self) -> dict:
@@ -68,9 +71,9 @@ class CMEEnlilList(object):
         '_kp_180',
         '_is_earth_gb',
         '_link',
-        '_data'
+        '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._model_comp_time = data.get("modelCompletionTime")
@@ -84,7 +87,6 @@ class CMEEnlilList(object):
         self._kp_180 = data.get("kp_180")
         self._is_earth_gb = data.get("isEarthGB")
         self._link = data.get("link")
-        self._impact_list = data.get("impactList")
         self._data = data
 
     def _process_impacts(self) -> Union[List[CMEImpact], CMEImpact, None]:
@@ -95,25 +97,21 @@ class CMEEnlilList(object):
         else:
             return CMEImpact(data[0])
 
-    @property
+    @lazy_property
     def impact_list(self) -> Union[List[CMEImpact], CMEImpact, None]:
-        if (imp := f"{self}impacts") not in self._cache:
-            self._cache[imp] = self._process_impacts()
-        return self._cache[imp]
+        return self._process_impacts()
 
     def _process_ids(self) -> Union[List[str], str, None]:
-        if not (data := self._data.get("cmdIDs")):
+        if not (data := self._data.get("cmeIDs")):
             return None
         if len(data) != 1:
             return [item for item in data]
         else:
             return data[0]
 
-    @property
+    @lazy_property
     def cme_ids(self) -> Union[List[str], str, None]:
-        if (ids := f"{self}ids") not in self._cache:
-            self._cache[ids] = self._process_ids()
-        return self._cache[ids]
+        return self._process_ids()
 
     @property
     def to_dict(self) -> dict:
@@ -139,8 +137,8 @@ class CMEAnalysis(object):
         '_level_of_data',
         '_link',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._time21_5 = data.get("time21_5")
@@ -213,11 +211,9 @@ class CMEAnalysis(object):
         else:
             return CMEEnlilList(enlil[0])
 
-    @property
+    @lazy_property
     def enlillist(self) -> Union[List[CMEEnlilList], CMEEnlilList, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_enlil()
-        return self._cache[self]
+        return self._process_enlil()
 
     @property
     def to_dict(self) -> dict:
@@ -269,7 +265,6 @@ class CMEResource(BaseResource):
         '_linked_events',
         '_data'
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -324,11 +319,9 @@ class CMEResource(BaseResource):
         else:
             return CMEInstrument(instrs[0])
 
-    @property
+    @lazy_property
     def instruments(self) -> Union[List[CMEInstrument], CMEInstrument, None]:
-        if (instr := f"{self}instr") not in self._cache:
-            self._cache[instr] = self._process_instruments()
-        return self._cache[instr]
+        return self._process_instruments()
 
     def _process_analyses(self) -> Union[List[CMEAnalysis], CMEAnalysis, None]:
         if not (cme := self._data.get("cmeAnalyses")):
@@ -338,11 +331,9 @@ class CMEResource(BaseResource):
         else:
             return CMEAnalysis(cme[0])
 
-    @property
+    @lazy_property
     def cme_analyses(self) -> Union[List[CMEAnalysis], CMEAnalysis, None]:
-        if (cme := f"{self}cme") not in self._cache:
-            self._cache[cme] = self._process_analyses()
-        return self._cache[cme]
+        return self._process_analyses()
 
     @property
     def to_dict(self) -> dict:
@@ -358,26 +349,19 @@ class CMEAnalysisResource(BaseResource):
     __slots__ = [
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
         super(CMEAnalysisResource, self).__init__(data, loop=loop)
         self._data = data
 
-    def _process_analyses(self) -> Union[List[CMEAnalysis], CMEAnalysis, None]:
-        if not (ays := self._data):
-            return None
-        elif len(ays) != 1:
-            return [CMEAnalysis(data) for data in ays]
-        else:
-            return CMEAnalysis(ays[0])
+    def _process_analyses(self) -> CMEAnalysis:
+        # The route returns a list of analyses, each built into its own resource
+        return CMEAnalysis(self._data)
 
-    @property
-    def analyses(self) -> Union[List[CMEAnalysis], CMEAnalysis, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_analyses()
-        return self._cache[self]
+    @lazy_property
+    def analyses(self) -> CMEAnalysis:
+        return self._process_analyses()
 
     @property
     def to_dict(self) -> dict:
@@ -387,3 +371,137 @@ class CMEAnalysisResource(BaseResource):
     def from_dict(cls, data: dict,
                   loop: AbstractEventLoop = None) -> "CMEAnalysisResource":
         return cls(data, loop=loop)
+
+
+def _number(value: Any) -> Union[float, None]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class CMEAnalysisIndex(object):
+    """Sorted index over a set of CME analyses that answers range queries
+    on ``speed``, ``half_angle`` and ``time21_5`` with binary searches
+    instead of a scan, for example the fast CMEs of the past year::
+
+        index.query(speed=(1500, None), time21_5=("2020-01-01", None))
+
+    Analyses missing a value are left out of the index of that field.
+    Times are compared in UTC
+
+    :param analyses: the analyses to index, as resources, analyses or raw dicts
+    :type analyses: Iterable[Union[CMEAnalysisResource, CMEAnalysis, dict]]
+    """
+    __slots__ = [
+        '_analyses',
+        '_values',
+        '_keys',
+        '_positions',
+    ]
+    _FIELDS = {
+        'speed': ("speed", _number),
+        'half_angle': ("halfAngle", _number),
+        'time21_5': ("time21_5", parse_datetime),
+    }
+
+    def __init__(self, analyses: Iterable[Any]) -> None:
+        self._analyses = []
+        for analysis in analyses:
+            if isinstance(analysis, CMEAnalysisResource):
+                analysis = analysis.analyses
+            elif isinstance(analysis, dict):
+                analysis = CMEAnalysis(analysis)
+            self._analyses.append(analysis)
+        self._values = {}
+        self._keys = {}
+        self._positions = {}
+        for field, (key, convert) in self._FIELDS.items():
+            values = self._values[field] = [
+                convert(analysis.to_dict.get(key)) for analysis in self._analyses
+            ]
+            pairs = sorted(
+                (value, position) for position, value in enumerate(values)
+                if value is not None
+            )
+            self._keys[field] = [value for value, _ in pairs]
+            self._positions[field] = [position for _, position in pairs]
+
+    def __len__(self) -> int:
+        return len(self._analyses)
+
+    def __iter__(self):
+        return iter(self._analyses)
+
+    def _bounds(self, field: str, low: Any, high: Any,
+                inclusive: bool) -> Tuple[int, int]:
+        if field not in self._FIELDS:
+            raise VoyagerException(f"{field} is not an indexed field")
+        convert, keys = self._FIELDS[field][1], self._keys[field]
+        if low is None:
+            start = 0
+        elif inclusive:
+            start = bisect.bisect_left(keys, convert(low))
+        else:
+            start = bisect.bisect_right(keys, convert(low))
+        if high is None:
+            stop = len(keys)
+        elif inclusive:
+            stop = bisect.bisect_right(keys, convert(high))
+        else:
+            stop = bisect.bisect_left(keys, convert(high))
+        return start, max(start, stop)
+
+    def range(self, field: str, low: Any = None, high: Any = None,
+              inclusive: bool = True) -> List[CMEAnalysis]:
+        """Returns the analyses whose field lies between two bounds, in
+        ascending order of the field
+
+        :param field: one of "speed", "half_angle" or "time21_5"
+        :type field: str
+        :param low: the lower bound, defaults to no bound
+        :type low: Any, optional
+        :param high: the upper bound, defaults to no bound
+        :type high: Any, optional
+        :param inclusive: whether the bounds are included, defaults to True
+        :type inclusive: bool, optional
+        :raises VoyagerException: the field is not indexed
+        :rtype: List[CMEAnalysis]
+        """
+        start, stop = self._bounds(field, low, high, inclusive)
+        return [self._analyses[position]
+                for position in self._positions[field][start:stop]]
+
+    def query(self, inclusive: bool = True,
+              **ranges: Tuple[Any, Any]) -> List[CMEAnalysis]:
+        """Returns the analyses that match a range on every given field,
+        in the order they were indexed. Each keyword is an indexed field
+        mapped to a ``(low, high)`` pair, either bound being None for an
+        open range. The narrowest range is searched first and the others
+        only filter its matches
+
+        :param inclusive: whether the bounds are included, defaults to True
+        :type inclusive: bool, optional
+        :raises VoyagerException: a field is not indexed
+        :rtype: List[CMEAnalysis]
+        """
+        if not ranges:
+            return list(self._analyses)
+        slices = sorted(
+            (stop - start, field, start, stop) for field, (low, high) in ranges.items()
+            for start, stop in [self._bounds(field, low, high, inclusive)]
+        )
+        _, field, start, stop = slices[0]
+        matches = self._positions[field][start:stop]
+        for _, field, _, _ in slices[1:]:
+            low, high = ranges[field]
+            convert, values = self._FIELDS[field][1], self._values[field]
+            low = convert(low) if low is not None else None
+            high = convert(high) if high is not None else None
+            matches = [
+                position for position in matches
+                if (value := values[position]) is not None
+                and (low is None or value > low or (inclusive and value == low))
+                and (high is None or value < high or (inclusive and value == high))
+            ]
+        return [self._analyses[position] for position in sorted(matches)]
@@ -0,0 +1,35 @@
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+
+_NULLS = ["", "None", "null"]
+
+
+def string_matrix(rows: List[list], width: int) -> "np.ndarray":
+    """Converts the row matrix of a tabular response into a 2D array of
+    strings, None values becoming the string "None"
+    """
+    return np.array(rows, dtype=str).reshape(len(rows), width)
+
+
+def _nulls(column: "np.ndarray") -> "np.ndarray":
+    return np.isin(column, _NULLS)
+
+
+def float_column(column: "np.ndarray") -> "np.ndarray":
+    """Parses a column of numeric strings as float64 in one pass, missing
+    values becoming NaN
+    """
+    return np.where(_nulls(column), "nan", column).astype(np.float64)
+
+
+def signed_column(column: "np.ndarray", direction: "np.ndarray",
+                  negative: str) -> "np.ndarray":
+    """Parses a column of unsigned magnitudes as float64, negating the
+    values whose direction column equals ``negative``
+    """
+    return np.where(direction == negative, -1.0, 1.0) * float_column(column)
@@ -0,0 +1,161 @@
+import collections
+import datetime
+from typing import Dict, Iterable, List, Union
+
+from ..dates import parse_datetime
+from ..exceptions import VoyagerException
+from .base import BaseResource
+
+__all__ = [
+    'DonkiGraph',
+]
+
+
+# The identifier and event time fields of each DONKI route
+EVENT_KEYS = {
+    'cme': ("activityID", "startTime"),
+    'gst': ("gstID", "startTime"),
+    'ips': ("activityID", "eventTime"),
+    'flr': ("flrID", "beginTime"),
+    'sep': ("sepID", "eventTime"),
+    'mpc': ("mpcID", "eventTime"),
+    'rbe': ("rbeID", "eventTime"),
+    'hss': ("hssID", "eventTime"),
+    'wsa-enlil': ("simulationID", "modelCompletionTime"),
+}
+
+
+def _links(data: dict) -> List[str]:
+    links = [event.get("activityID") for event in data.get("linkedEvents") or []]
+    links.extend(cme.get("cmeid") for cme in data.get("cmeInputs") or [])
+    return [link for link in links if link]
+
+
+class DonkiGraph(object):
+    """Graph of the DONKI events of a date window, with an edge between any
+    two events that list each other in their ``linkedEvents``, or between
+    a WSA-Enlil simulation and the CMEs it modelled. Events are indexed by
+    their activity ID, and links to events outside the window are kept so
+    that they can be resolved once those events are added
+
+    :param events: the resources of each route, keyed by route name
+    :type events: Dict[str, Iterable[BaseResource]]
+    """
+    __slots__ = [
+        '_events',
+        '_types',
+        '_edges',
+    ]
+
+    def __init__(self, events: Dict[str, Iterable[BaseResource]] = None) -> None:
+        self._events = {}
+        self._types = {}
+        self._edges = collections.defaultdict(set)
+        for route, resources in (events or {}).items():
+            self.add(route, resources)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __contains__(self, activity_id: str) -> bool:
+        return activity_id in self._events
+
+    def __getitem__(self, activity_id: str) -> BaseResource:
+        if (event := self._events.get(activity_id)) is None:
+            raise VoyagerException(f"{activity_id} is not an event of this graph")
+        return event
+
+    def __iter__(self):
+        return iter(self._events.values())
+
+    def __repr__(self) -> str:
+        return f"<DonkiGraph events={len(self._events)}>"
+
+    def add(self, route: str, resources: Iterable[BaseResource]) -> None:
+        """Adds the resources returned by a DONKI route to the graph
+
+        :param route: the name of the route, such as "cme" or "gst"
+        :type route: str
+        :param resources: the resources returned by the route
+        :type resources: Iterable[BaseResource]
+        :raises VoyagerException: the route is not a DONKI event route
+        """
+        if route not in EVENT_KEYS:
+            raise VoyagerException(f"{route} is not a DONKI event route")
+        key = EVENT_KEYS[route][0]
+        for resource in resources:
+            data = resource.to_dict
+            if not (activity_id := data.get(key)):
+                continue
+            self._events[activity_id] = resource
+            self._types[activity_id] = route
+            for link in _links(data):
+                self._edges[activity_id].add(link)
+                self._edges[link].add(activity_id)
+
+    def get(self, activity_id: str) -> Union[BaseResource, None]:
+        return self._events.get(activity_id)
+
+    def type_of(self, activity_id: str) -> Union[str, None]:
+        return self._types.get(activity_id)
+
+    def time_of(self, activity_id: str) -> Union[datetime.datetime, None]:
+        """Returns the time an event started, or the time a simulation
+        completed, as a datetime
+        """
+        if (event := self._events.get(activity_id)) is None:
+            return None
+        return parse_datetime(event.to_dict.get(EVENT_KEYS[self._types[activity_id]][1]))
+
+    def events(self, route: str) -> List[BaseResource]:
+        """Returns the events of one route, in the order they were added"""
+        return [self._events[activity_id] for activity_id, kind in self._types.items()
+                if kind == route]
+
+    def linked(self, activity_id: str) -> List[BaseResource]:
+        """Returns the events directly linked to an event"""
+        return [self._events[link] for link in sorted(self._edges.get(activity_id, ()))
+                if link in self._events]
+
+    def traverse(self, activity_id: str, types: Iterable[str] = None,
+                 max_depth: int = None,
+                 downstream: bool = False) -> List[BaseResource]:
+        """Walks the graph breadth first from an event and returns the
+        events reached, nearest first. For example, the geomagnetic storms
+        caused by a CME are::
+
+            graph.traverse(cme_id, types=["gst"], downstream=True)
+
+        :param activity_id: the activity ID of the event to start from
+        :type activity_id: str
+        :param types: the routes of the events to return, defaults to every route
+        :type types: Iterable[str], optional
+        :param max_depth: the most links to follow, defaults to no limit
+        :type max_depth: int, optional
+        :param downstream: only follow links to events that happened at or
+            after the event they are linked from, defaults to False
+        :type downstream: bool, optional
+        :rtype: List[BaseResource]
+        """
+        types = set(types) if types is not None else None
+        seen = {activity_id}
+        queue = collections.deque([(activity_id, 0)])
+        found = []
+        while queue:
+            current, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for link in sorted(self._edges.get(current, ())):
+                if link in seen or link not in self._events:
+                    continue
+                if downstream and not self._follows(current, link):
+                    continue
+                seen.add(link)
+                queue.append((link, depth + 1))
+                if types is None or self._types[link] in types:
+                    found.append(self._events[link])
+        return found
+
+    def _follows(self, source: str, target: str) -> bool:
+        start, end = self.time_of(source), self.time_of(target)
+        return start is None or end is None or end >= start
@@ -3,7 +3,8 @@ from asyncio.events import AbstractEventLoop
 from io import BytesIO
 from typing import Tuple, Union
 
-from ..decorators import check_pil_importable
+from ..dates import parse_datetime
+from ..decorators import check_pil_importable, lazy_property
 from .base import BaseResource
 
 try:
@@ -54,7 +55,6 @@ class EarthAssetResource(BaseResource):
         '_service_version',
         '_url',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -78,11 +78,9 @@ class EarthAssetResource(BaseResource):
         else:
             return EarthResource(res)
 
-    @property
+    @lazy_property
     def resource(self) -> Union[EarthResource, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_resource()
-        return self._cache[self]
+        return self._process_resource()
 
     @property
     def service_version(self) -> str:
@@ -142,7 +140,7 @@ class EarthImageryResource(BaseResource):
 
     @property
     def datetime(self) -> datetime.datetime:
-        return datetime.datetime.strptime(self._date, "%Y-%m-%d")
+        return parse_datetime(self._date)
 
     @property
     def cloud_score(self) -> bool:  # Not currently available
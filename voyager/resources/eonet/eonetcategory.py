@@ -1,8 +1,12 @@
+from __future__ import annotations
+
 from asyncio.events import AbstractEventLoop
-from typing import Generator, Union
+from typing import Union
 
 import aiohttp
 
+from ...decorators import lazy_property
+from ..base import LazySequence
 from .eonetlayer import EONETLayer
 
 
@@ -14,8 +18,8 @@ class EONETCategory(object):
         '_description',
         '_data',
         '_loop',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict, loop: AbstractEventLoop) -> None:
         self._id = data.get("id")
@@ -42,7 +46,7 @@ class EONETCategory(object):
     def description(self) -> str:
         return self._description
 
-    async def _process_layers(self) -> Union[Generator[EONETLayer, None, None], EONETLayer, str, None]:
+    async def _process_layers(self) -> Union[LazySequence[EONETLayer], EONETLayer, str, None]:
         async with aiohttp.ClientSession() as cs:
             async with cs.get(self._layers) as resp:
                 ret = await resp.json()
@@ -51,14 +55,12 @@ class EONETCategory(object):
         if len(cat) != 1:
             return self._layers
         if len((lyr := cat[0].get("layers"))) != 1:
-            return (EONETLayer(data) for data in lyr)
+            return LazySequence(lyr, EONETLayer)
         return EONETLayer(lyr[0])
 
-    @property
+    @lazy_property
     def layers(self) -> str:
-        if self not in self._cache:
-            self._cache[self] = self._loop.run_in_executor(None, self._process_layers)
-        return self._cache[self]
+        return self._loop.run_in_executor(None, self._process_layers)
 
     @property
     def to_dict(self) -> dict:
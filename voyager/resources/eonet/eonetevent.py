@@ -1,5 +1,9 @@
-from typing import Any, Generator, Union
+from __future__ import annotations
 
+from typing import Any, Union
+
+from ...decorators import lazy_property
+from ..base import LazySequence
 from .eonetcategory import EONETCategory
 from .eonetgeometry import EONETGeometry
 
@@ -18,12 +22,12 @@ class EONETEvent(object):
         '_link',
         '_closed',
         '_data',
+        '_lazy',
     ]
     _map = {
         'categories': EONETCategory,
         'geometry': EONETGeometry,
     }
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._id = data.get("id")
@@ -53,33 +57,27 @@ class EONETEvent(object):
     def closed(self) -> bool:
         return self._closed
 
-    def _process_event_meta(self, type) -> Union[Generator[Any, None, None], Any, None]:
+    def _process_event_meta(self, type) -> Union[LazySequence[Any], Any, None]:
         if not (ret := self._data.get(type)):
             return None
         from .eonetsource import EONETSource
         _class = self._map.get(type, EONETSource)
         if len(ret) != 1:
-            return (_class(data) for data in ret)
+            return LazySequence(ret, _class)
         else:
             return _class(ret[0])
 
-    @property
-    def categories(self) -> Union[Generator[EONETCategory, None, None], EONETCategory, None]:
-        if (cat := f"{self}categories") not in self._cache:
-            self._cache[cat] = self._process_event_meta("categories")
-        return self._cache[cat]
+    @lazy_property
+    def categories(self) -> Union[LazySequence[EONETCategory], EONETCategory, None]:
+        return self._process_event_meta("categories")
 
-    @property
-    def sources(self) -> Union[Generator[EONETSource, None, None], EONETSource, None]:
-        if (src := f"{self}sources") not in self._cache:
-            self._cache[src] = self._process_event_meta("source")
-        return self._cache[src]
+    @lazy_property
+    def sources(self) -> Union[LazySequence[EONETSource], EONETSource, None]:
+        return self._process_event_meta("source")
 
-    @property
-    def geometry(self) -> Union[Generator[EONETGeometry, None, None], EONETGeometry, None]:
-        if (geo := f"{self}geometry") not in self._cache:
-            self._cache[geo] = self._process_event_meta("geometry")
-        return self._cache[geo]
+    @lazy_property
+    def geometry(self) -> Union[LazySequence[EONETGeometry], EONETGeometry, None]:
+        return self._process_event_meta("geometry")
 
     @property
     def to_dict(self) -> dict:
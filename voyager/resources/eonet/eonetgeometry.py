@@ -1,6 +1,11 @@
+from __future__ import annotations
+
 import datetime
-from typing import Any, Generator, List, Union
+from typing import Any, List, Union
 
+from ...dates import parse_datetime
+from ...decorators import lazy_property
+from ..base import LazySequence
 from .eonetcategory import EONETCategory
 
 try:
@@ -22,12 +27,12 @@ class EONETGeometry(object):
         '_date',
         '_type',
         '_coords',
-        '_data'
+        '_data',
+        '_lazy',
     ]
     _map = {
         "categories": EONETCategory,
     }
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         _prop = data.get("properties", data)
@@ -61,34 +66,30 @@ class EONETGeometry(object):
         return self._date
 
     @property
-    def datetime(self) -> datetime.datetime:  # TODO: Implement this
-        pass
+    def datetime(self) -> Union[datetime.datetime, None]:
+        return parse_datetime(self._date)
 
     @property
     def coordinates(self) -> Union[List[List[float]], List[float], None]:
         return self._coords
 
-    def _process_meta(self, type: str) -> Union[Generator[Any, None, None], Any, None]:
+    def _process_meta(self, type: str) -> Union[LazySequence[Any], Any, None]:
         if not (meta := self._data.get(type)):
             return None
         from .eonetsource import EONETSource
         _class = self._map.get(type, EONETSource)
         if len(meta) != 1:
-            return (_class(data) for data in meta)
+            return LazySequence(meta, _class)
         else:
             return _class(meta[0])
 
-    @property
-    def categories(self) -> Union[Generator[EONETCategory, None, None], EONETCategory, None]:
-        if (cat := f"{self}categories") not in self._cache:
-            self._cache[cat] = self._process_meta("categories")
-        return self._cache[cat]
+    @lazy_property
+    def categories(self) -> Union[LazySequence[EONETCategory], EONETCategory, None]:
+        return self._process_meta("categories")
 
-    @property
-    def sources(self) -> Union[Generator[EONETSource, None, None], EONETSource, None]:
-        if (src := f"{self}sources") not in self._cache:
-            self._cache[src] = self._process_meta("sources")
-        return self._cache[src]
+    @lazy_property
+    def sources(self) -> Union[LazySequence[EONETSource], EONETSource, None]:
+        return self._process_meta("sources")
 
     @property
     def to_dict(self) -> dict:
@@ -1,5 +1,7 @@
 from typing import List
 
+from ...decorators import lazy_property
+
 
 class EONETLayer(object):
     __slots__ = [
@@ -7,8 +9,8 @@ class EONETLayer(object):
         '_service_url',
         '_service_type_id',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._name = data.get("name")
@@ -36,11 +38,9 @@ class EONETLayer(object):
     def type_id(self) -> str:
         return self.service_type_id
 
-    @property
+    @lazy_property
     def parameters(self) -> List[dict]:
-        if self not in self._cache:
-            self._cache[self] = self._data.get("parameters")
-        return self._cache[self]
+        return self._data.get("parameters")
 
     @property
     def params(self) -> List[dict]:
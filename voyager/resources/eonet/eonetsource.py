@@ -1,8 +1,12 @@
+from __future__ import annotations
+
 from asyncio.events import AbstractEventLoop
-from typing import Generator, Union
+from typing import Union
 
 import aiohttp
 
+from ...decorators import lazy_property
+from ..base import LazySequence
 from .eonetevent import EONETEvent
 
 
@@ -14,6 +18,7 @@ class EONETSource(object):
         '_link',
         '_data',
         '_loop',
+        '_lazy',
     ]
 
     def __init__(self, data: dict, loop: AbstractEventLoop) -> None:
@@ -40,19 +45,17 @@ class EONETSource(object):
     def link(self) -> str:
         return self._link
 
-    async def _process_events(self) -> Union[Generator[EONETEvent, None, None], EONETEvent, None]:
+    async def _process_events(self) -> Union[LazySequence[EONETEvent], EONETEvent, None]:
         async with aiohttp.ClientSession() as cs:
             async with cs.get(self._link) as resp:
                 ret = await resp.json()
         if not (events := ret.get("events")):
             return None
-        return (EONETEvent(event) for event in events)
+        return LazySequence(events, EONETEvent)
 
-    @property
-    def events(self) -> Union[Generator[EONETEvent, None, None], EONETEvent, None]:
-        if self not in self._cache:
-            self._cache[self] = self._loop.run_in_executor(None, self._process_events)
-        return self._cache[self]
+    @lazy_property
+    def events(self) -> Union[LazySequence[EONETEvent], EONETEvent, None]:
+        return self._loop.run_in_executor(None, self._process_events)
 
     @property
     def to_dict(self) -> dict:
@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 from asyncio.events import AbstractEventLoop
-from typing import Any, Generator, Union
+from typing import Any, Union
 
-from .base import BaseResource
+from ..decorators import lazy_property
+from .base import BaseResource, LazySequence
 from .eonet import EONETCategory, EONETEvent, EONETGeometry, EONETSource
 
 __all__ = [
@@ -20,7 +23,6 @@ class EONETCategoryResource(BaseResource):
         '_link',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -59,7 +61,6 @@ class EONETEventResource(BaseResource):
         '_link',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -81,19 +82,17 @@ class EONETEventResource(BaseResource):
     def link(self) -> str:
         return self._link
 
-    def _process_events(self) -> Union[Generator[EONETEvent, None, None], EONETEvent, None]:
+    def _process_events(self) -> Union[LazySequence[EONETEvent], EONETEvent, None]:
         if not (ev := self._data.get("events")):
             return None
         elif len(ev) != 1:
-            return (EONETEvent(data) for data in ev)
+            return LazySequence(ev, EONETEvent)
         else:
             return EONETEvent(ev[0])
 
-    @property
-    def events(self) -> Union[Generator[EONETEvent, None, None], EONETEvent, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_events()
-        return self._cahce[self]
+    @lazy_property
+    def events(self) -> Union[LazySequence[EONETEvent], EONETEvent, None]:
+        return self._process_events()
 
     @property
     def to_dict(self) -> dict:
@@ -120,7 +119,6 @@ class EONETGeoJSONEventResource(EONETEventResource):
         "sources": EONETSource,
         "features": EONETGeometry,
     }
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -157,32 +155,26 @@ class EONETGeoJSONEventResource(EONETEventResource):
     def closed(self) -> Union[bool, None]:
         return self._closeds
 
-    def _process_meta(self, type: str) -> Union[Generator[Any, None, None], Any, None]:
+    def _process_meta(self, type: str) -> Union[LazySequence[Any], Any, None]:
         if not (meta := self._data.get(type)):
             return None
         _class = self._map.get(type)
         if len(meta) != 1:
-            return (_class(data) for data in meta)
+            return LazySequence(meta, _class)
         else:
             return _class(meta[0])
 
-    @property
-    def categories(self) -> Union[Generator[EONETCategory, None, None], EONETCategory, None]:
-        if (cat := f"{self}categories") not in self._cache:
-            self._cache[cat] = self._process_meta("categories")
-        return self._cache[cat]
+    @lazy_property
+    def categories(self) -> Union[LazySequence[EONETCategory], EONETCategory, None]:
+        return self._process_meta("categories")
 
-    @property
-    def sources(self) -> Union[Generator[EONETSource, None, None], EONETSource, None]:
-        if (src := f"{self}sources") not in self._cache:
-            self._cache[src] = self._process_meta("sources")
-        return self._cache[src]
+    @lazy_property
+    def sources(self) -> Union[LazySequence[EONETSource], EONETSource, None]:
+        return self._process_meta("sources")
 
-    @property
-    def features(self) -> Union[Generator[EONETGeometry, None, None], EONETGeometry, None]:
-        if (geo := f"{self}features") not in self._cache:
-            self._cache[geo] = self._process_meta("features")
-        return self._cache[geo]
+    @lazy_property
+    def features(self) -> Union[LazySequence[EONETGeometry], EONETGeometry, None]:
+        return self._process_meta("features")
 
     @property
     def to_dict(self) -> dict:
@@ -201,7 +193,6 @@ class EONETLayerResource(BaseResource):
         '_link',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -240,7 +231,6 @@ class EONETSourceResource(BaseResource):
         '_link',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -262,19 +252,17 @@ class EONETSourceResource(BaseResource):
     def link(self) -> str:
         return self._link
 
-    def _process_sources(self) -> Union[Generator[EONETSource, None, None], EONETSource, None]:
+    def _process_sources(self) -> Union[LazySequence[EONETSource], EONETSource, None]:
         if not (sc := self._data.get("sources")):
             return None
         elif len(sc) != 1:
-            return (EONETSource(data, self._loop) for data in sc)
+            return LazySequence(sc, lambda data: EONETSource(data, self._loop))
         else:
             return EONETSource(sc[0], self._loop)
 
-    @property
-    def sources(self) -> Union[Generator[EONETSource, None, None], EONETSource, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_sources()
-        return self._cache[self]
+    @lazy_property
+    def sources(self) -> Union[LazySequence[EONETSource], EONETSource, None]:
+        return self._process_sources()
 
     @property
     def to_dict(self) -> dict:
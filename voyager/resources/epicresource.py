@@ -1,12 +1,13 @@
+import asyncio
 import datetime
 from asyncio.events import AbstractEventLoop
 from collections import namedtuple
 from io import BytesIO
-from typing import List, Tuple
+from typing import AsyncIterator, Callable, List, Tuple, Union
 
-import aiohttp
-
-from ..decorators import check_pil_importable
+from ..cache import FileStore
+from ..dates import parse_datetime
+from ..decorators import check_pil_importable, lazy_property
 from ..exceptions import VoyagerException
 from .base import BaseResource
 
@@ -27,6 +28,9 @@ _LUNAR = namedtuple("Lunarj2000Position", ["x", "y", "z"])
 _SUN = namedtuple("Sunj2000Position", ["x", "y", "z"])
 _AQ = namedtuple("AttitudeQuaternions", ["q0", "q1", "q2", "q3"])
 
+FORMATS = ['png', 'jpg', 'thumb']
+MODES = ['natural', 'enhanced']
+
 
 class EPICImage(object):
     __slots__ = [
@@ -34,15 +38,18 @@ class EPICImage(object):
         '_base',
         '_data',
         '_loop',
+        '_stream',
     ]
     _NAT = "https://epic.gsfc.nasa.gov/archive/natural/"
     _ENH = "https://epic.gsfc.nasa.gov/archive/enhanced/"
 
     def __init__(self, data: dict,
-                 loop: AbstractEventLoop = None) -> None:
+                 loop: AbstractEventLoop = None,
+                 stream: Callable[[str], AsyncIterator[bytes]] = None) -> None:
         self._name = data.get("identifier")
         self._base = (data.get("date")).split(" ", 1)[0].replace("-", "/")
         self._loop = loop
+        self._stream = stream
         self._data = data
 
     @property
@@ -55,7 +62,7 @@ class EPICImage(object):
 
     @property
     def normal_thumbnail(self) -> str:
-        return self._NAT + self._base + f"/thumb/epic_1b_{self._name}.jpg"
+        return self._NAT + self._base + f"/thumbs/epic_1b_{self._name}.jpg"
 
     @property
     def enhanced_png(self) -> str:
@@ -67,33 +74,72 @@ class EPICImage(object):
 
     @property
     def enhanced_thumbnail(self) -> str:
-        return self._ENH + self._base + f"/thumb/epic_RGB_{self._name}.jpg"
-
-    async def _process_raw_image(self, url: str) -> Image:
-        async with aiohttp.ClientSession() as cs:
-            async with cs.get(url) as resp:
-                ret = await resp.raw()
-        return Image.open(BytesIO(ret))
-
-    @check_pil_importable
-    async def get_image(self, format: str = "png", mode: str = "natural") -> Image:
-        if not (fmt := format.lower()) in ['png', 'jpg', 'thumb']:
+        return self._ENH + self._base + f"/thumbs/epic_RGB_{self._name}.jpg"
+
+    def _chunks(self, url: str) -> AsyncIterator[bytes]:
+        # Downloads share the client's session and host concurrency limit
+        if self._stream is None:
+            raise VoyagerException("EPIC images can only be downloaded from a resource "
+                                   "returned by a Client")
+        return self._stream(url)
+
+    async def _read(self, url: str) -> bytes:
+        return b"".join([chunk async for chunk in self._chunks(url)])
+
+    def url(self, format: str = "png", mode: str = "natural") -> str:
+        """Returns the archive URL of one variant of the image
+
+        :param format: one of "png", "jpg" or "thumb", defaults to "png"
+        :type format: str, optional
+        :param mode: one of "natural" or "enhanced", defaults to "natural"
+        :type mode: str, optional
+        :raises VoyagerException: the format or mode is not supported
+        :rtype: str
+        """
+        if not (fmt := format.lower()) in FORMATS:
             raise VoyagerException(f"{format} is not a supported image format")
-        elif not (md := mode.lower()) in ['natural', 'enhanced']:
+        elif not (md := mode.lower()) in MODES:
             raise VoyagerException(f"{mode} is not a valid mode")
-        else:
-            url = getattr(self, f"{md}_{fmt}")
+        return getattr(self, "{}_{}".format(
+            "normal" if md == "natural" else md,
+            "thumbnail" if fmt == "thumb" else fmt,
+        ))
+
+    async def _process_raw_image(self, url: str, store: FileStore = None) -> Image:
+        if store is None:
+            return Image.open(BytesIO(await self._read(url)))
+        if (path := store.lookup(url)) is None:
+            path = await store.store(url, self._chunks(url))
+        return Image.open(path)
 
-        if (req := f"{self}{fmt}{md}{url}") not in self._cache:
-            self._cache[req] = self._process_raw_image(url)
-        return self._cache[req]
+    @check_pil_importable
+    async def get_image(self, format: str = "png", mode: str = "natural",
+                        store: Union[FileStore, str] = None) -> Image:
+        """Downloads and decodes one variant of the image. Decoded images
+        are not kept, so each call downloads the image again unless a
+        store is given, in which case it is downloaded once and decoded
+        from the stored file
+
+        :param format: one of "png", "jpg" or "thumb", defaults to "png"
+        :type format: str, optional
+        :param mode: one of "natural" or "enhanced", defaults to "natural"
+        :type mode: str, optional
+        :param store: the store or the directory of the store to keep the
+            downloaded file in, defaults to None
+        :type store: Union[FileStore, str], optional
+        :rtype: Image
+        """
+        url = self.url(format=format, mode=mode)
+        if store is not None and not isinstance(store, FileStore):
+            store = FileStore(store)
+        return await self._process_raw_image(url, store=store)
 
     @check_pil_importable
-    async def show(self, format: str = "png", mode: str = "natural") -> None:
-        image = await self._loop.run_in_executor(
-            None, self.get_image(format=format, mode=mode)
-        )
-        return await self._loop.run_in_executor(None, image.show())
+    async def show(self, format: str = "png", mode: str = "natural",
+                   store: Union[FileStore, str] = None) -> None:
+        image = await self.get_image(format=format, mode=mode, store=store)
+        loop = self._loop or asyncio.get_running_loop()
+        return await loop.run_in_executor(None, image.show)
 
 
 class EPICResource(BaseResource):
@@ -107,9 +153,9 @@ class EPICResource(BaseResource):
         '_sun_j2000_position',
         '_attitude_quaternions',
         '_date',
+        '_stream',
         '_data',
     ]
-    _cache = {}
     _nt_map = {
         'centroid_coordinates': _CC,
         'dscovr_j2000_position': _DSCOVR,
@@ -119,8 +165,10 @@ class EPICResource(BaseResource):
     }
 
     def __init__(self, data: dict,
-                 loop: AbstractEventLoop = None) -> None:
+                 loop: AbstractEventLoop = None,
+                 stream: Callable[[str], AsyncIterator[bytes]] = None) -> None:
         super(EPICResource, self).__init__(data, loop=loop)
+        self._stream = stream
         self._identifier = data.get("identifier")
         self._caption = data.get("caption")
         self._version = data.get("version")
@@ -151,35 +199,25 @@ class EPICResource(BaseResource):
     def _process_coords(self, ct: str) -> namedtuple:
         return (self._nt_map[ct])(*(getattr(self, f"_{ct}")).values())
 
-    @property
+    @lazy_property
     def centroid_coords(self) -> Tuple[float, float]:
-        if (cc := f"{self}cc") not in self._cache:
-            self._cache[cc] = self._process_coords("centroid_coordinates")
-        return self._cache[cc]
+        return self._process_coords("centroid_coordinates")
 
-    @property
+    @lazy_property
     def dscovr_pos(self) -> Tuple[float, float, float]:
-        if (dp := f"{self}dp") not in self._cache:
-            self._cache[dp] = self._process_coords("dscovr_j2000_position")
-        return self._cache[dp]
+        return self._process_coords("dscovr_j2000_position")
 
-    @property
+    @lazy_property
     def lunar_pos(self) -> Tuple[float, float, float]:
-        if (lp := f"{self}lp") not in self._cache:
-            self._cache[lp] = self._process_coords("lunar_j2000_position")
-        return self._cache[lp]
+        return self._process_coords("lunar_j2000_position")
 
-    @property
+    @lazy_property
     def sun_pos(self) -> Tuple[float, float, float]:
-        if (sp := f"{self}sp") not in self._cache:
-            self._cache[sp] = self._process_coords("sun_j2000_position")
-        return self._cache[sp]
+        return self._process_coords("sun_j2000_position")
 
-    @property
+    @lazy_property
     def attitude_quaternions(self) -> Tuple[float, float, float, float]:
-        if (aq := f"{self}aq") not in self._cache:
-            self._cache[aq] = self._process_coords("attitude_quaternions")
-        return self._cache[aq]
+        return self._process_coords("attitude_quaternions")
 
     @property
     def aq(self) -> Tuple[float, float, float, float]:
@@ -201,16 +239,14 @@ class EPICResource(BaseResource):
 
     @property
     def datetime(self) -> datetime.datetime:
-        return datetime.datetime.strptime(self._date, "%Y-%m-%d %H:%M:%S")
+        return parse_datetime(self._date)
 
     def _process_image(self) -> EPICImage:
-        return EPICImage(self._data, loop=self._loop)
+        return EPICImage(self._data, loop=self._loop, stream=self._stream)
 
-    @property
+    @lazy_property
     def image(self) -> EPICImage:
-        if (img := f"{self}img") not in self._cache:
-            self._cache[img] = self._process_image()
-        return self._cache[img]
+        return self._process_image()
 
     @property
     def to_dict(self) -> dict:
@@ -6,6 +6,7 @@ from .exoplanetcomposite import ExoplanetCompositeData
 from .exoplanetconfirmed import ExoplanetConfirmedData
 from .exoplanetextended import ExoplanetExtendedData
 from .exoplanetmicrolensing import ExoplanetMicrolensing
+from .exoplanettable import ExoplanetTable
 # ============================
 # K2
 # ============================
@@ -42,6 +43,7 @@ __all__ = [
     'ExoplanetConfirmedData',
     'ExoplanetExtendedData',
     'ExoplanetMicrolensing',
+    'ExoplanetTable',
     'K2Candidate',
     'K2Name',
     'K2Target',
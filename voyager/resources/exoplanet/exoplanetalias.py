@@ -1,5 +1,7 @@
 from typing import Union
 
+from ...decorators import lazy_property
+
 _ATTRS = {
     'name',
     '2mass',
@@ -19,8 +21,8 @@ _ATTRS = {
 class ExoplanetAlias(object):
     __slots__ = [
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: list) -> None:
         self._data = data
@@ -32,11 +34,9 @@ class ExoplanetAlias(object):
             )
         }
 
-    @property
+    @lazy_property
     def to_dict(self) -> dict:
-        if (sf := f"{self}dict") not in self._cache:
-            self._cache[sf] = self._process_dict()
-        return self._cache[sf]
+        return self._process_dict()
 
     @classmethod
     def from_dict(cls, data: dict) -> "ExoplanetAlias":
@@ -62,7 +62,6 @@ class ExoplanetAlias(object):
 
 
 def _add_func(name: str):
-    @property
     def fn(self) -> Union[str, None]:
         def _extract(attr: str) -> Union[str, None]:
             if attr == "name":
@@ -75,10 +74,9 @@ def _add_func(name: str):
             else:
                 return None
 
-        if name not in self._cache:
-            self._cache[name] = _extract(name)
-        return self._cache[name]
-    setattr(ExoplanetAlias, name, fn)
+        return _extract(name)
+    fn.__name__ = name
+    setattr(ExoplanetAlias, name, lazy_property(fn))
 
 
 for attr in _ATTRS:
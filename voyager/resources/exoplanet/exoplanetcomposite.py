@@ -1,5 +1,7 @@
 from typing import Union
 
+from ..records import record_class
+
 
 _ATTRS = {
     "fpl_hostname":      Union[str, None],
@@ -109,30 +111,4 @@ _ATTRS = {
 }
 
 
-class ExoplanetCompositeData(object):
-    __slots__ = [
-        '_data'
-    ]
-    _cache = {}
-
-    def __init__(self, data: dict) -> None:
-        self._data = data
-
-    @property
-    def to_dict(self) -> dict:
-        return self._data
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "ExoplanetCompositeData":
-        return cls(data)
-
-
-def _add_func(name: str):
-    @property
-    def fn(self) -> _ATTRS.get(name):
-        return self._data.get(name)
-    setattr(ExoplanetCompositeData, name, fn)
-
-
-for attr in _ATTRS:
-    _add_func(attr)
+ExoplanetCompositeData = record_class("ExoplanetCompositeData", _ATTRS, __name__)
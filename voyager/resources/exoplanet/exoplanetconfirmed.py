@@ -1,5 +1,7 @@
 from typing import Union
 
+from ..records import record_class
+
 
 _ATTRS = {
     "pl_hostname":     Union[str, None],
@@ -87,29 +89,4 @@ _ATTRS = {
 }
 
 
-class ExoplanetConfirmedData(object):
-    __slots__ = [
-        '_data'
-    ]
-
-    def __init__(self, data: dict) -> None:
-        self._data = data
-
-    @property
-    def to_dict(self) -> dict:
-        return self._data
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "ExoplanetConfirmedData":
-        return cls(data)
-
-
-def _add_func(name: str):
-    @property
-    def fn(self) -> _ATTRS.get(name):
-        return self._data.get(name)
-    setattr(ExoplanetConfirmedData, name, fn)
-
-
-for attr in _ATTRS:
-    _add_func(attr)
+ExoplanetConfirmedData = record_class("ExoplanetConfirmedData", _ATTRS, __name__)
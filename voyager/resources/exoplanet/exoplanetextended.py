@@ -1,5 +1,7 @@
 from typing import Union
 
+from ..records import record_class
+
 
 _ATTRS = {
     "mpl_hostname":     Union[str, None],
@@ -55,29 +57,4 @@ _ATTRS = {
 }
 
 
-class ExoplanetExtendedData(object):
-    __slots__ = [
-        '_data',
-    ]
-
-    def __init__(self, data: dict) -> None:
-        self._data = data
-
-    @property
-    def to_dict(self) -> dict:
-        return self._data
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "ExoplanetExtendedData":
-        return cls(data)
-
-
-def _add_func(name: str):
-    @property
-    def fn(self) -> _ATTRS.get(name):
-        return self._data.get(name)
-    setattr(ExoplanetExtendedData, name, fn)
-
-
-for attr in _ATTRS:
-    _add_func(attr)
+ExoplanetExtendedData = record_class("ExoplanetExtendedData", _ATTRS, __name__)
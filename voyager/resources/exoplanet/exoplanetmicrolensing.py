@@ -1,5 +1,7 @@
 from typing import Union
 
+from ..records import record_class
+
 
 _ATTRS = {
     "plntname":         Union[str, None],
@@ -78,29 +80,4 @@ _ATTRS = {
 }
 
 
-class ExoplanetMicrolensing(object):
-    __slots__ = [
-        '_data',
-    ]
-
-    def __init__(self, data: dict) -> None:
-        self._data = data
-
-    @property
-    def to_dict(self) -> dict:
-        return self._data
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "ExoplanetMicrolensing":
-        return cls(data)
-
-
-def _add_func(name: str):
-    @property
-    def fn(self) -> _ATTRS.get(name):
-        return self._data.get(name)
-    setattr(ExoplanetMicrolensing, name, fn)
-
-
-for attr in _ATTRS:
-    _add_func(attr)
+ExoplanetMicrolensing = record_class("ExoplanetMicrolensing", _ATTRS, __name__)
@@ -0,0 +1,264 @@
+from typing import Any, Dict, List, Sequence, Union
+
+from ...exceptions import VoyagerException
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+
+# Aggregates only ever see the values that are present, so an empty or
+# all missing group is NaN without NumPy warning about an empty slice
+_AGGREGATES = {
+    'count': lambda values: len(values),
+    'sum': lambda values: np.sum(values),
+    'mean': lambda values: np.mean(values) if len(values) else np.nan,
+    'median': lambda values: np.median(values) if len(values) else np.nan,
+    'std': lambda values: np.std(values) if len(values) else np.nan,
+    'min': lambda values: np.min(values) if len(values) else np.nan,
+    'max': lambda values: np.max(values) if len(values) else np.nan,
+}
+
+
+def _base_type(annotation: Any) -> Any:
+    args = [arg for arg in getattr(annotation, "__args__", [annotation])
+            if arg is not type(None)]
+    return args[0] if len(args) == 1 else None
+
+
+def _missing(column: "np.ndarray") -> "np.ndarray":
+    if column.dtype.kind == "f":
+        return np.isnan(column)
+    elif column.dtype.kind == "O":
+        return np.equal(column, None)
+    return np.zeros(len(column), dtype=bool)
+
+
+def _aggregate(function: str, column: "np.ndarray") -> Any:
+    return _AGGREGATES[function](column[~_missing(column)])
+
+
+def _typed_column(values: List[Any], annotation: Any) -> "np.ndarray":
+    kind = _base_type(annotation)
+    if kind in [int, float]:
+        try:
+            if kind is int and None not in values:
+                return np.array(values, dtype=np.int64)
+            return np.array(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            pass
+    return np.array(values, dtype=object)
+
+
+class ExoplanetTable(object):
+    """Typed, column oriented view of an Exoplanet Archive table that can be
+    filtered, projected, sorted and aggregated without building a record
+    per row. Columns are NumPy arrays typed from the ``_ATTRS`` map of the
+    table: numeric columns are int64 or float64, with NaN for missing
+    values, and every other column is an object array
+
+    Queries never copy the columns. Each one returns a new table that
+    shares the columns and holds the indices of its rows, so they can be
+    chained freely::
+
+        table.where("pl_orbper", "between", 1, 10).order_by("st_dist")
+
+    :param columns: the arrays of the table keyed by column name
+    :type columns: Dict[str, np.ndarray]
+    """
+    __slots__ = [
+        '_columns',
+        '_names',
+        '_index',
+    ]
+
+    def __init__(self, columns: Dict[str, "np.ndarray"],
+                 names: List[str] = None,
+                 index: "np.ndarray" = None) -> None:
+        self._columns = columns
+        self._names = list(names if names is not None else columns)
+        if index is None:
+            size = len(next(iter(columns.values()))) if columns else 0
+            index = np.arange(size)
+        self._index = index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        return self.column(name)
+
+    def __iter__(self):
+        for position in range(len(self._index)):
+            yield {name: self._columns[name][self._index[position]]
+                   for name in self._names}
+
+    def __repr__(self) -> str:
+        return f"<ExoplanetTable rows={len(self)} columns={len(self._names)}>"
+
+    @classmethod
+    def from_rows(cls, rows: List[dict],
+                  types: Dict[str, Any] = None) -> "ExoplanetTable":
+        """Loads the rows returned by the archive into a typed table
+
+        :param rows: the rows of the table
+        :type rows: List[dict]
+        :param types: the type annotation of each column, defaults to None
+        :type types: Dict[str, Any], optional
+        :rtype: ExoplanetTable
+        """
+        types = types or {}
+        names = list(rows[0]) if rows else list(types)
+        return cls({
+            name: _typed_column([row.get(name) for row in rows], types.get(name))
+            for name in names
+        })
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._names)
+
+    def column(self, name: str) -> "np.ndarray":
+        """Returns the values of a column for the rows of this table
+
+        :param name: the name of the column
+        :type name: str
+        :raises VoyagerException: the table has no such column
+        :rtype: np.ndarray
+        """
+        if name not in self._columns:
+            raise VoyagerException(f"{name} is not a column of this table")
+        return self._columns[name][self._index]
+
+    def _derive(self, names: List[str] = None,
+                index: "np.ndarray" = None) -> "ExoplanetTable":
+        return ExoplanetTable(
+            self._columns,
+            names=names if names is not None else self._names,
+            index=index if index is not None else self._index,
+        )
+
+    def where(self, name: str, op: str, *values: Any) -> "ExoplanetTable":
+        """Keeps the rows whose column satisfies a condition. ``op`` is one
+        of "==", "!=", "<", "<=", ">", ">=", "between" (two bounds,
+        inclusive), "in" (any number of values), "null" or "notnull" (no
+        value). Rows with a missing value never match a comparison
+
+        :param name: the name of the column
+        :type name: str
+        :param op: the comparison to apply
+        :type op: str
+        :raises VoyagerException: the comparison is not supported
+        :rtype: ExoplanetTable
+        """
+        column = self.column(name)
+        missing = _missing(column)
+        if op == "null":
+            return self._derive(index=self._index[missing])
+        elif op == "notnull":
+            return self._derive(index=self._index[~missing])
+        elif op == "in":
+            mask = np.isin(column, list(values))
+        elif op == "between":
+            if len(values) != 2:
+                raise VoyagerException("between takes a lower and an upper bound")
+            present = column[~missing]
+            mask = np.zeros(len(column), dtype=bool)
+            mask[~missing] = (present >= values[0]) & (present <= values[1])
+        elif op in ["==", "!=", "<", "<=", ">", ">="]:
+            if len(values) != 1:
+                raise VoyagerException(f"{op} takes exactly one value")
+            compare = {
+                "==": np.equal,
+                "!=": np.not_equal,
+                "<": np.less,
+                "<=": np.less_equal,
+                ">": np.greater,
+                ">=": np.greater_equal,
+            }[op]
+            mask = np.zeros(len(column), dtype=bool)
+            mask[~missing] = compare(column[~missing], values[0])
+        else:
+            raise VoyagerException(f"{op} is not a supported comparison")
+        return self._derive(index=self._index[mask & ~missing])
+
+    def select(self, *names: str) -> "ExoplanetTable":
+        """Keeps only the given columns, in the given order
+
+        :raises VoyagerException: the table has no such column
+        :rtype: ExoplanetTable
+        """
+        for name in names:
+            if name not in self._columns:
+                raise VoyagerException(f"{name} is not a column of this table")
+        return self._derive(names=list(names))
+
+    def order_by(self, *names: str, descending: bool = False) -> "ExoplanetTable":
+        """Sorts the rows by one or more columns, the first column being
+        the primary key. Missing values sort last
+
+        :param descending: whether to sort in descending order, defaults to False
+        :type descending: bool, optional
+        :rtype: ExoplanetTable
+        """
+        keys = []
+        for name in reversed(names):
+            column = self.column(name)
+            missing = _missing(column)
+            if column.dtype.kind == "O":
+                _, column = np.unique(
+                    np.where(missing, "", column).astype(str), return_inverse=True
+                )
+            if descending:
+                column = -column.astype(np.float64)
+            keys.extend([column, missing])
+        order = np.lexsort(keys) if keys else np.arange(len(self._index))
+        return self._derive(index=self._index[order])
+
+    def limit(self, count: int) -> "ExoplanetTable":
+        return self._derive(index=self._index[:count])
+
+    def aggregate(self, by: Union[str, None] = None,
+                  **aggregates: Sequence[str]) -> Union[dict, "ExoplanetTable"]:
+        """Computes aggregates over the rows, ignoring missing values. Each
+        keyword names a result and maps to a ``(column, function)`` pair
+        where the function is one of "count", "sum", "mean", "median",
+        "std", "min" or "max"::
+
+            table.aggregate(by="pl_discmethod", n=("pl_name", "count"),
+                            period=("pl_orbper", "median"))
+
+        :param by: the column to group the rows by, defaults to None
+        :type by: str, optional
+        :raises VoyagerException: an aggregate function is not supported
+        :return: the aggregates, or a table with one row per group if
+            ``by`` is given
+        :rtype: Union[dict, ExoplanetTable]
+        """
+        for _, function in aggregates.values():
+            if function not in _AGGREGATES:
+                raise VoyagerException(f"{function} is not a supported aggregate")
+        if by is None:
+            return {
+                result: _aggregate(function, self.column(name))
+                for result, (name, function) in aggregates.items()
+            }
+        grouped = self.where(by, "notnull")
+        keys = grouped.column(by)
+        if keys.dtype.kind == "O":
+            keys = keys.astype(str)
+        groups, inverse = np.unique(keys, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(groups) + 1))
+        columns = {by: groups}
+        for result, (name, function) in aggregates.items():
+            column = grouped.column(name)[order]
+            columns[result] = np.array([
+                _aggregate(function, column[bounds[i]:bounds[i + 1]])
+                for i in range(len(groups))
+            ])
+        return ExoplanetTable(columns)
+
+    def to_dict(self) -> Dict[str, "np.ndarray"]:
+        return {name: self.column(name) for name in self._names}
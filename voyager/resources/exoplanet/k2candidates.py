@@ -1,5 +1,7 @@
 from typing import Union
 
+from ..records import record_class
+
 
 _ATTRS = {
     "epic_name":       Union[str, None],
@@ -44,29 +46,4 @@ _ATTRS = {
 }
 
 
-class K2Candidate(object):
-    __slots__ = [
-        '_data',
-    ]
-
-    def __init__(self, data: dict) -> None:
-        self._data = data
-
-    @property
-    def to_dict(self) -> dict:
-        return self._data
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "K2Candidate":
-        return cls(data)
-
-
-def _add_func(name: str):
-    @property
-    def fn(self) -> _ATTRS.get(name):
-        return self._data.get(name)
-    setattr(K2Candidate, name, fn)
-
-
-for attr in _ATTRS:
-    _add_func(attr)
+K2Candidate = record_class("K2Candidate", _ATTRS, __name__)
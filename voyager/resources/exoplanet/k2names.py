@@ -1,5 +1,7 @@
 from typing import Union
 
+from ..records import record_class
+
 
 _ATTRS = {
     "epic_host":       Union[str, None],
@@ -14,29 +16,4 @@ _ATTRS = {
 }
 
 
-class K2Name(object):
-    __slots__ = [
-        '_data',
-    ]
-
-    def __init__(self, data: dict) -> None:
-        self._data = data
-
-    @property
-    def to_dict(self) -> dict:
-        return self._data
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "K2Name":
-        return cls(data)
-
-
-def _add_func(name: str):
-    @property
-    def fn(self) -> _ATTRS.get(name):
-        return self._data.get(name)
-    setattr(K2Name, name, fn)
-
-
-for attr in _ATTRS:
-    _add_func(attr)
+K2Name = record_class("K2Name", _ATTRS, __name__)
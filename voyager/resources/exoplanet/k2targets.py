@@ -1,5 +1,7 @@
 from typing import Union
 
+from ..records import record_class
+
 
 _ATTRS = {
     "epic_number":     Union[int, None],
@@ -31,29 +33,4 @@ _ATTRS = {
 }
 
 
-class K2Target(object):
-    __slots__ = [
-        '_data',
-    ]
-
-    def __init__(self, data: dict) -> None:
-        self._data = data
-
-    @property
-    def to_dict(self) -> dict:
-        return self._data
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "K2Target":
-        return cls(data)
-
-
-def _add_func(name: str):
-    @property
-    def fn(self) -> _ATTRS.get(name):
-        return self._data.get(name)
-    setattr(K2Target, name, fn)
-
-
-for attr in _ATTRS:
-    _add_func(attr)
+K2Target = record_class("K2Target", _ATTRS, __name__)
@@ -1,5 +1,8 @@
 from typing import Union
 
+from ..records import record_class
+
+
 _ATTRS = {
     "kepid":             Union[int, None],
     "kepoi_name":        Union[str, None],
@@ -54,29 +57,4 @@ _ATTRS = {
 }
 
 
-class KeplerKOI(object):
-    __slots__ = [
-        '_data'
-    ]
-
-    def __init__(self, data: dict) -> None:
-        self._data = data
-
-    @property
-    def to_dict(self) -> dict:
-        return self._data
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "KeplerKOI":
-        return cls(data)
-
-
-def _add_func(name: str):
-    @property
-    def fn(self) -> _ATTRS.get(name):
-        return self._data.get(name)
-    setattr(KeplerKOI, name, fn)
-
-
-for attr in _ATTRS:
-    _add_func(attr)
+KeplerKOI = record_class("KeplerKOI", _ATTRS, __name__)
@@ -1,5 +1,7 @@
 from typing import Union
 
+from ..records import record_class
+
 
 _ATTRS = {
     "star_id":         Union[int, None],
@@ -62,29 +64,4 @@ _ATTRS = {
 }
 
 
-class KeplerTimeSeries(object):
-    __slots__ = [
-        '_data',
-    ]
-
-    def __init__(self, data: dict) -> None:
-        self._data = data
-
-    @property
-    def to_dict(self) -> dict:
-        return self._data
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "KeplerTimeSeries":
-        return cls(data)
-
-
-def _add_func(name: str):
-    @property
-    def fn(self) -> _ATTRS.get(name):
-        return self._data.get(name)
-    setattr(KeplerTimeSeries, name, fn)
-
-
-for attr in _ATTRS:
-    _add_func(attr)
+KeplerTimeSeries = record_class("KeplerTimeSeries", _ATTRS, __name__)
@@ -1,5 +1,7 @@
 from typing import Union
 
+from ..records import record_class
+
 
 _ATTRS = {
     "star_name":        Union[str, None],
@@ -32,29 +34,4 @@ _ATTRS = {
 }
 
 
-class MissionStars(object):
-    __slots__ = [
-        '_data',
-    ]
-
-    def __init__(self, data: dict) -> None:
-        self._data = data
-
-    @property
-    def to_dict(self) -> dict:
-        return self._data
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "MissionStars":
-        return cls(data)
-
-
-def _add_func(name: str):
-    @property
-    def fn(self) -> _ATTRS.get(name):
-        return self._data.get(name)
-    setattr(MissionStars, name, fn)
-
-
-for attr in _ATTRS:
-    _add_func(attr)
+MissionStars = record_class("MissionStars", _ATTRS, __name__)
@@ -1,8 +1,12 @@
+from __future__ import annotations
+
 from asyncio.events import AbstractEventLoop
-from typing import Any, Generator, Union
+from typing import Any, Union
 
-from .base import BaseResource
+from ..decorators import check_numpy_importable, lazy_property
+from .base import BaseResource, LazySequence, _as_sequence
 from .exoplanet import *
+from .tables import ArrowExport, from_rows, type_map
 
 
 __all__ = [
@@ -46,12 +50,11 @@ _TYPES = {
 }
 
 
-class ExoplanetResource(BaseResource):
+class ExoplanetResource(BaseResource, ArrowExport):
     __slots__ = [
         '_table_name',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -60,26 +63,38 @@ class ExoplanetResource(BaseResource):
         self._data = data.get("raw")
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        for res in self.results:
-            yield res
+        return iter(_as_sequence(self.results))
 
-    def _process_results(self) -> Union[Generator[Any, None, None], Any, None]:
+    def _process_results(self) -> Union[LazySequence[Any], Any, None]:
         _class = _TYPES.get(self._table_name)
         if not (res := self._data):
             return None
         elif len(res) != 1:
-            return (_class(data) for data in res)
+            return LazySequence(res, _class)
         else:
             return _class(res[0])
 
-    @property
-    def results(self) -> Union[Generator[Any, None, None], Any, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_results()
-        return self._cache[self]
+    @lazy_property
+    def results(self) -> Union[LazySequence[Any], Any, None]:
+        return self._process_results()
+
+    def _arrow_table(self) -> "pa.Table":
+        return from_rows(self._data or [], type_map(_TYPES.get(self._table_name)))
+
+    @lazy_property
+    def _table(self) -> ExoplanetTable:
+        return ExoplanetTable.from_rows(
+            self._data or [], type_map(_TYPES.get(self._table_name))
+        )
+
+    @check_numpy_importable
+    def to_table(self) -> ExoplanetTable:
+        """Returns the results as a typed columnar table that can be
+        queried locally. The table is built once per resource
+
+        :rtype: ExoplanetTable
+        """
+        return self._table
 
     @property
     def table_name(self) -> str:
@@ -1,15 +1,37 @@
+from __future__ import annotations
+
 import datetime
 from asyncio.events import AbstractEventLoop
-from typing import Generator, List, Union
+from typing import Dict, List, Union
 
+from ..dates import parse_datetime, parse_datetimes
+from ..decorators import check_numpy_importable, lazy_property
 from ..exceptions import VoyagerException
-from .base import BaseResource
+from .base import BaseResource, LazySequence, _as_sequence
+from .columns import float_column, signed_column, string_matrix
+from .tables import ArrowExport, from_matrix
 
 __all__ = [
     'FireballResource',
 ]
 
 
+_FLOAT_FIELDS = [
+    'alt',
+    'vel',
+    'energy',
+    'impact-e',
+    'vx',
+    'vy',
+    'vz',
+]
+# The direction field of each signed coordinate and its negative value
+_SIGNED_FIELDS = {
+    'lat': ("lat-dir", "S"),
+    'lon': ("lon-dir", "W"),
+}
+
+
 class FireballRecord(object):
     __slots__ = [
         '_fc',
@@ -25,6 +47,7 @@ class FireballRecord(object):
         '_vx',
         '_vy',
         '_vz',
+        '_lazy',
     ]
     _FIELDS = [
         'date',
@@ -40,21 +63,18 @@ class FireballRecord(object):
         'vy',
         'vz',
     ]
-    _cache = {}
 
     def __init__(self, data: List[str], fields: List[str]) -> None:
-        self._fc = self._FIELDS.copy()
-        for field, value in zip(fields, data):
-            setattr(self, f"_{field.replace('-', '_')}", value)
-            self._FIELDS.remove(field)
         for unset in self._FIELDS:
             setattr(self, f"_{unset.replace('-', '_')}", None)
+        self._fc = []
+        for field, value in zip(fields, data):
+            if field in self._FIELDS:
+                setattr(self, f"_{field.replace('-', '_')}", value)
+                self._fc.append(field)
 
     def __len__(self) -> int:
-        if (l := "len") not in self._cache:
-            self._cache[l] = len(self._fc) - len(self._FIELDS)
-            del self._FIELDS
-        return self._cache[l]
+        return len(self._fc)
 
     @property
     def date(self) -> Union[str, None]:
@@ -64,7 +84,7 @@ class FireballRecord(object):
     def datetime(self) -> Union[datetime.datetime, None]:
         if not self._date:
             return None
-        return datetime.datetime.strptime(self._date, "%Y-%m-%d %H:%M:%S")
+        return parse_datetime(self._date)
 
     @property
     def lat(self) -> Union[float, None]:
@@ -162,20 +182,18 @@ class FireballRecord(object):
     def vz(self) -> Union[float, None]:
         if not self._vz:
             return None
-        return self._vz
+        return float(self._vz)
 
     @property
     def velocity_z(self) -> Union[float, None]:
         return self.vz
 
     def _process_dict(self) -> dict:
-        return {field: getattr(self, f"_{field.replace('-', '_')}") for field in self._fc}
+        return {field: getattr(self, f"_{field.replace('-', '_')}") for field in self._FIELDS}
 
-    @property
+    @lazy_property
     def to_dict(self) -> dict:
-        if self not in self._cache:
-            self._cache[self] = self._process_dict()
-        return self._cache[self]
+        return self._process_dict()
 
     @classmethod
     def from_dict(cls, data: dict) -> "FireballRecord":
@@ -184,14 +202,13 @@ class FireballRecord(object):
         return cls([value for value in data.values()], [key for key in data])
 
 
-class FireballResource(BaseResource):
+class FireballResource(BaseResource, ArrowExport):
     __slots__ = [
         '_signature',
         '_count',
         '_fields',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -205,11 +222,7 @@ class FireballResource(BaseResource):
         return self.count
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        for fb in self.data:
-            yield fb
+        return iter(_as_sequence(self.data))
 
     @property
     def signature(self) -> str:
@@ -231,20 +244,59 @@ class FireballResource(BaseResource):
     def fields(self) -> List[str]:
         return self._fields
 
-    def _process_fb_data(self) -> Union[Generator[FireballRecord, None, None], FireballRecord, None]:
+    def _process_fb_data(self) -> Union[LazySequence[FireballRecord], FireballRecord, None]:
         if not (fb := self._data.get("data")):
             return None
         elif len(fb) != 1:
-            for values in fb:
-                yield FireballRecord(values, self._fields)
+            return LazySequence(fb, lambda values: FireballRecord(values, self._fields))
         else:
             return FireballRecord(fb[0], self._fields)
 
-    @property
-    def data(self) -> Union[Generator[FireballRecord, None, None], FireballRecord, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_fb_data()
-        return self._cache[self]
+    @lazy_property
+    def data(self) -> Union[LazySequence[FireballRecord], FireballRecord, None]:
+        return self._process_fb_data()
+
+    @lazy_property
+    def _columns(self) -> Dict[str, "np.ndarray"]:
+        fields = self._fields or []
+        matrix = string_matrix(self._data.get("data") or [], len(fields))
+        raw = {field: matrix[:, index] for index, field in enumerate(fields)}
+        columns = {}
+        for field, column in raw.items():
+            if field in _FLOAT_FIELDS:
+                columns[field] = float_column(column)
+            elif field == "date":
+                columns[field] = parse_datetimes(column, unit="s")
+            elif field in _SIGNED_FIELDS and _SIGNED_FIELDS[field][0] in raw:
+                direction, negative = _SIGNED_FIELDS[field]
+                columns[field] = signed_column(column, raw[direction], negative)
+            elif field in _SIGNED_FIELDS:
+                columns[field] = float_column(column)
+            else:
+                columns[field] = column
+        return columns
+
+    def _arrow_table(self) -> "pa.Table":
+        return from_matrix(
+            self._fields or [],
+            self._data.get("data") or [],
+            types={field: float for field in _FLOAT_FIELDS + ["lat", "lon"]},
+            timestamps={"date": "%Y-%m-%d %H:%M:%S"},
+            signed=_SIGNED_FIELDS,
+        )
+
+    @check_numpy_importable
+    def to_columns(self) -> Dict[str, "np.ndarray"]:
+        """Returns the fireball data as one NumPy array per field, built
+        once per response. ``date`` is datetime64, ``lat`` and ``lon`` are
+        float64 signed from ``lat-dir`` and ``lon-dir`` (south and west
+        negative), energies, altitude and velocities are float64 with NaN
+        for missing values, and the direction fields are string arrays
+
+        :return: the arrays keyed by field name, in the order of the fields
+        :rtype: Dict[str, np.ndarray]
+        """
+        return self._columns
 
     @property
     def to_dict(self) -> dict:
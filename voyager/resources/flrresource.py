@@ -1,6 +1,7 @@
 from asyncio.events import AbstractEventLoop
 from typing import List, Union
 
+from ..decorators import lazy_property
 from .base import BaseResource
 
 
@@ -77,7 +78,6 @@ class FLRResource(BaseResource):
         '_link',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -108,11 +108,9 @@ class FLRResource(BaseResource):
         else:
             return FLRInstrument(instrs[0])
 
-    @property
+    @lazy_property
     def instruments(self) -> Union[List[FLRInstrument], FLRInstrument, None]:
-        if (instrs := f"{self}instrs") not in self._cache:
-            self._cache[instrs] = self._process_instruments()
-        return self._cache[instrs]
+        return self._process_instruments()
 
     @property
     def begin_time(self) -> str:
@@ -146,11 +144,9 @@ class FLRResource(BaseResource):
         else:
             return FLRLinkedEvent(le[0])
 
-    @property
+    @lazy_property
     def linked_events(self) -> Union[List[FLRLinkedEvent], FLRLinkedEvent, None]:
-        if (le := f"{self}le") not in self._cache:
-            self._cache[le] = self._process_linked_events()
-        return self._cache[le]
+        return self._process_linked_events()
 
     @property
     def link(self) -> str:
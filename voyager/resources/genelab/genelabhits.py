@@ -1,5 +1,7 @@
 from typing import List, Union
 
+from ...decorators import lazy_property
+
 
 class GenelabMission(object):
     __slots__ = [
@@ -398,8 +400,8 @@ class GenelabHit(object):
         '_id',
         '_score',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._index = data.get("_index")
@@ -424,17 +426,13 @@ class GenelabHit(object):
     def score(self) -> float:
         return self._score
 
-    @property
+    @lazy_property
     def source(self) -> GenelabSource:
-        if (src := f"{self}source") not in self._cache:
-            self._cache[src] = GenelabSource(self._data.get("_source"))
-        return self._cache[src]
+        return GenelabSource(self._data.get("_source"))
 
-    @property
+    @lazy_property
     def highlight(self) -> GenelabHighlight:
-        if (hl := f"{self}highlight") not in self._cache:
-            self._cache[hl] = GenelabHighlight(self._data.get("highlight"))
-        return self._cache[hl]
+        return GenelabHighlight(self._data.get("highlight"))
 
     @property
     def to_dict(self) -> dict:
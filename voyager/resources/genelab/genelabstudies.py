@@ -1,5 +1,10 @@
+from __future__ import annotations
+
 import datetime
-from typing import Generator, Union
+from typing import Union
+
+from ...decorators import lazy_property
+from ..base import LazySequence, _as_sequence
 
 
 class GenelabStudyFile(object):
@@ -55,46 +60,38 @@ class GenelabStudy(object):
     __slots__ = [
         '_name',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, name: str, data: dict) -> None:
         self._name = name
         self._data = data
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        for fl in self.files:
-            yield fl
+        return iter(_as_sequence(self.files))
 
     @property
     def name(self) -> str:
         return self._name
 
-    def _process_files(self) -> Union[Generator[GenelabStudyFile, None, None], GenelabStudyFile, None]:
+    def _process_files(self) -> Union[LazySequence[GenelabStudyFile], GenelabStudyFile, None]:
         if not (fl := self._data.get("study_files")):
             return None
         elif len(fl) != 1:
-            return (GenelabStudyFile(data) for data in fl)
+            return LazySequence(fl, GenelabStudyFile)
         else:
             return GenelabStudyFile(fl[0])
 
-    @property
-    def files(self) -> Union[Generator[GenelabStudyFile, None, None], GenelabStudyFile, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_files()
-        return self._cache[self]
+    @lazy_property
+    def files(self) -> Union[LazySequence[GenelabStudyFile], GenelabStudyFile, None]:
+        return self._process_files()
 
-    @property
+    @lazy_property
     def to_dict(self) -> dict:
-        if (dt := f"{self}dict") not in self._cache:
-            self._cache[dt] = {
-                "name": self.name,
-                "study_files": self._data.get("study_files")
-            }
-        return self._cache[dt]
+        return {
+            "name": self.name,
+            "study_files": self._data.get("study_files")
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "GenelabStudy":
@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 from asyncio.events import AbstractEventLoop
-from typing import Generator, List, Union
+from typing import List, Union
 
-from .base import BaseResource
+from ..decorators import lazy_property
+from .base import BaseResource, LazySequence, _as_sequence
 from .genelab import GenelabStudy, GenelabHit
 
 
@@ -23,7 +26,6 @@ class GenelabResource(BaseResource):
         '_page_size',
         '_data'
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -38,11 +40,7 @@ class GenelabResource(BaseResource):
         self._data = data
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        for sd in self.studies:
-            yield sd
+        return iter(_as_sequence(self.studies))
 
     @property
     def hits(self) -> int:
@@ -72,26 +70,22 @@ class GenelabResource(BaseResource):
     def success(self) -> bool:
         return self._success
 
-    @property
+    @lazy_property
     def valid_input(self) -> Union[List[int], None]:
-        if (vi := f"{self}input") not in self._cache:
-            self._cache[vi] = self._data.get("valid_input")
-        return self._cache[vi]
+        return self._data.get("valid_input")
 
-    def _process_studies(self) -> Union[Generator[GenelabStudy, None, None], GenelabStudy, None]:
+    def _process_studies(self) -> Union[LazySequence[GenelabStudy], GenelabStudy, None]:
         if not (sd := self._data.get("studies")):
             return None
         elif len(sd) != 1:
-            return (GenelabStudy(name, data) for name, data in sd.items())
+            return LazySequence(list(sd.items()), lambda item: GenelabStudy(*item))
         else:
             nd = [(name, data) for name, data in sd.items()]
             return GenelabStudy(nd[0][0], nd[0][1])
 
-    @property
-    def studies(self) -> Union[Generator[GenelabStudy, None, None], GenelabStudy, None]:
-        if (sd := f"{self}study") not in self._cache:
-            self._cache[sd] = self._process_studies()
-        return self._cache[sd]
+    @lazy_property
+    def studies(self) -> Union[LazySequence[GenelabStudy], GenelabStudy, None]:
+        return self._process_studies()
 
     @property
     def page_size(self) -> int:
@@ -114,7 +108,6 @@ class GenelabDatasetResource(BaseResource):
         '_hits',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -140,19 +133,17 @@ class GenelabDatasetResource(BaseResource):
     def max_score(self) -> Union[float, None]:
         return self._hits.get("max_score") if self._hits else None
 
-    def _process_hits(self) -> Union[Generator[GenelabHit, None, None], GenelabHit, None]:
+    def _process_hits(self) -> Union[LazySequence[GenelabHit], GenelabHit, None]:
         if not self._hits or not (ht := self._hits.get("hits")):
             return None
         elif len(ht) != 1:
-            return (GenelabHit(data) for data in ht)
+            return LazySequence(ht, GenelabHit)
         else:
             return GenelabHit(ht[0])
 
-    @property
-    def hits(self) -> Union[Generator[GenelabHit, None, None], GenelabHit, None]:
-        if self not in self._cache:
-            self._cache = self._process_hits()
-        return self._cache[self]
+    @lazy_property
+    def hits(self) -> Union[LazySequence[GenelabHit], GenelabHit, None]:
+        return self._process_hits()
 
     @property
     def to_dict(self) -> dict:
@@ -171,7 +162,6 @@ class GenelabMetadataResource(BaseResource):
         '_success',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -1,6 +1,7 @@
 from asyncio.events import AbstractEventLoop
 from typing import List, Union
 
+from ..decorators import lazy_property
 from .base import BaseResource
 
 __all__ = [
@@ -73,7 +74,6 @@ class GSTResource(BaseResource):
         '_link',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -103,11 +103,9 @@ class GSTResource(BaseResource):
         else:
             return GSTKPIndex(kp[0])
 
-    @property
+    @lazy_property
     def all_kp_index(self) -> Union[List[GSTKPIndex], GSTKPIndex, None]:
-        if (kp := f"{self}kpindex") not in self._cache:
-            self._cache[kp] = self._process_kp()
-        return self._cache[kp]
+        return self._process_kp()
 
     def _process_linked_events(self) -> Union[List[GSTLinkedEvent], GSTLinkedEvent, None]:
         if not (le := self._data.get("linkedEvents")):
@@ -117,11 +115,9 @@ class GSTResource(BaseResource):
         else:
             return GSTLinkedEvent(le[0])
 
-    @property
+    @lazy_property
     def linked_events(self) -> Union[List[GSTLinkedEvent], GSTLinkedEvent, None]:
-        if (le := f"{self}le") not in self._cache:
-            self._cache[le] = self._process_linked_events()
-        return self._cache[le]
+        return self._process_linked_events()
 
     @property
     def link(self) -> str:
@@ -1,3 +1,4 @@
+from ...decorators import lazy_property
 from .atmospherictemperature import AtmosphericTemperature
 from .horizontalwindspeed import HorizontalWindSpeed
 from .pressuredata import PressureData
@@ -10,8 +11,8 @@ class InsightSol(object):
         '_last_utc',
         '_season',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._first_utc = data.get("First_UTC")
@@ -31,29 +32,21 @@ class InsightSol(object):
     def season(self) -> str:
         return self._season
 
-    @property
+    @lazy_property
     def atmospheric_temperature(self) -> AtmosphericTemperature:
-        if (at := f"{self}at") not in self._cache:
-            self._cache[at] = AtmosphericTemperature(self._data.get("AT"))
-        return self._cache[at]
+        return AtmosphericTemperature(self._data.get("AT"))
 
-    @property
+    @lazy_property
     def horizontal_wind_speed(self) -> HorizontalWindSpeed:
-        if (hws := f"{self}hws") not in self._cache:
-            self._cache[hws] = HorizontalWindSpeed(self._data.get("HWS"))
-        return self._cache[hws]
+        return HorizontalWindSpeed(self._data.get("HWS"))
 
-    @property
+    @lazy_property
     def pressure_data(self) -> PressureData:
-        if (pre := f"{self}pre") not in self._cache:
-            self._cache[pre] = PressureData(self._data.get("PRE"))
-        return self._cache[pre]
+        return PressureData(self._data.get("PRE"))
 
-    @property
+    @lazy_property
     def wind_direction(self) -> WindDirection:
-        if (wd := f"{self}wd") not in self._cache:
-            self._cache[wd] = WindDirection(self._data.get("WD"))
-        return self._cache[wd]
+        return WindDirection(self._data.get("WD"))
 
     @property
     def to_dict(self) -> dict:
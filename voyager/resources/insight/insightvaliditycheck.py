@@ -1,4 +1,9 @@
-from typing import Generator, List, Union
+from __future__ import annotations
+
+from typing import List, Union
+
+from ...decorators import lazy_property
+from ..base import LazySequence, _as_sequence
 from .atmospherictemperature import AtmosphericTemperature
 from .horizontalwindspeed import HorizontalWindSpeed
 from .pressuredata import PressureData
@@ -16,8 +21,8 @@ _ATTRS = {
 class InsightSolValidityCheck(object):
     __slots__ = [
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._data = data
@@ -36,8 +41,8 @@ class InsightValidityCheck(object):
         '_sol_hrs',
         '_sols_checked',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._sol_hrs = data.get("sol_hours_required")
@@ -45,11 +50,7 @@ class InsightValidityCheck(object):
         self._data = data
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        for sol in self.checks:
-            yield sol
+        return iter(_as_sequence(self.checks))
 
     @property
     def sol_hours_required(self) -> int:
@@ -63,19 +64,17 @@ class InsightValidityCheck(object):
     def sols_checked(self) -> List[int]:
         return [int(sol) for sol in self._sols_checked]
 
-    def _process_checks(self) -> Union[Generator[InsightSolValidityCheck, None, None], InsightSolValidityCheck, None]:
+    def _process_checks(self) -> Union[LazySequence[InsightSolValidityCheck], InsightSolValidityCheck, None]:
         if not (sol := self.sols_checked):
             return None
         elif len(sol) != 1:
-            return (InsightSolValidityCheck(self._data.get(str(sl))) for sl in sol)
+            return LazySequence(sol, lambda sl: InsightSolValidityCheck(self._data.get(str(sl))))
         else:
             return InsightSolValidityCheck(self._data.get(sol[0]))
 
-    @property
-    def checks(self) -> Union[Generator[InsightSolValidityCheck, None, None], InsightSolValidityCheck, None]:
-        if (ck := f"{self}checks") not in self._cache:
-            self._cache[ck] = self._process_checks()
-        return self._cache[ck]
+    @lazy_property
+    def checks(self) -> Union[LazySequence[InsightSolValidityCheck], InsightSolValidityCheck, None]:
+        return self._process_checks()
 
     @property
     def to_dict(self) -> dict:
@@ -87,12 +86,10 @@ class InsightValidityCheck(object):
 
 
 def _add_func(name: str, abbrev: str, _class: object):
-    @property
     def fn(self) -> _class:
-        if (c := name) not in self._cache:
-            self._cache[c] = _class(self._data.get(abbrev))
-        return self._cache[c]
-    setattr(InsightSolValidityCheck, name, fn)
+        return _class(self._data.get(abbrev))
+    fn.__name__ = name
+    setattr(InsightSolValidityCheck, name, lazy_property(fn))
 
 
 for attr, abbrevclass in _ATTRS.items():
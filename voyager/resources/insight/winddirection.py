@@ -1,5 +1,7 @@
 from typing import Union
 
+from ...decorators import lazy_property
+
 
 class CompassPoint(object):
     __slots__ = [
@@ -67,19 +69,17 @@ class CompassPoint(object):
 class WindDirection(object):
     __slots__ = [
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._data = data
 
-    @property
+    @lazy_property
     def most_common(self) -> Union[CompassPoint, None]:
-        if (n := "mc") not in self._cache:
-            self._cache[n] = CompassPoint(data) if (
-                data := self._data.get("most_common")
-            ) else None
-        return self._cache[n]
+        return CompassPoint(data) if (
+            data := self._data.get("most_common")
+        ) else None
 
     @property
     def to_dict(self) -> dict:
@@ -91,14 +91,12 @@ class WindDirection(object):
 
 
 def _add_func(number: int):
-    @property
     def fn(self) -> Union[CompassPoint, None]:
-        if (n := str(number)) not in self._cache:
-            self._cache[n] = CompassPoint(data) if (
-                data := self._data.get(str(number))
-            ) else None
-        return self._cache[n]
-    setattr(WindDirection, f"point{number + 1}", fn)
+        return CompassPoint(data) if (
+            data := self._data.get(str(number))
+        ) else None
+    fn.__name__ = f"point{number + 1}"
+    setattr(WindDirection, fn.__name__, lazy_property(fn))
 
 
 for num in range(0, 15):
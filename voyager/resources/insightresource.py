@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 from asyncio.events import AbstractEventLoop
-from typing import Generator, List, Union
+from typing import List, Union
 
-from .base import BaseResource
+from ..decorators import lazy_property
+from .base import BaseResource, LazySequence, _as_sequence
 from .insight import InsightSol, InsightValidityCheck
 
 __all__ = [
@@ -14,7 +17,6 @@ class InsightResource(BaseResource):
         '_sol_keys',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -23,31 +25,23 @@ class InsightResource(BaseResource):
         self._data = data
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        for sol in self.sols:
-            yield sol
+        return iter(_as_sequence(self.sols))
 
-    def _process_sols(self) -> Union[Generator[InsightSol, None, None], InsightSol, None]:
+    def _process_sols(self) -> Union[LazySequence[InsightSol], InsightSol, None]:
         if not (sols := self._sol_keys):
             return None
         elif len(sols) != 1:
-            return (InsightSol(sol) for sol in sols)
+            return LazySequence(sols, InsightSol)
         else:
             return InsightSol(sols[0])
 
-    @property
-    def sols(self) -> Union[Generator[InsightSol, None, None], InsightSol, None]:
-        if (sl := f"{self}sols") not in self._cache:
-            self._cache[sl] = self._process_sols()
-        return self._cache[sl]
+    @lazy_property
+    def sols(self) -> Union[LazySequence[InsightSol], InsightSol, None]:
+        return self._process_sols()
 
-    @property
+    @lazy_property
     def validity_checks(self) -> InsightValidityCheck:
-        if (vc := f"{self}validity") not in self._cache:
-            self._cache[vc] = InsightValidityCheck(self._data.get("validity_checks"))
-        return self._cache[vc]
+        return InsightValidityCheck(self._data.get("validity_checks"))
 
     @property
     def sol_keys(self) -> List[int]:
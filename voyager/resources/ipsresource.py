@@ -1,6 +1,7 @@
 from asyncio.events import AbstractEventLoop
 from typing import List, Union
 
+from ..decorators import lazy_property
 from .base import BaseResource
 
 
@@ -47,7 +48,6 @@ class IPSResource(BaseResource):
         '_link',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -87,11 +87,9 @@ class IPSResource(BaseResource):
         else:
             return IPSInstrument(instrs[0])
 
-    @property
+    @lazy_property
     def instruments(self) -> Union[List[IPSInstrument], IPSInstrument, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_instruments()
-        return self._cache[self]
+        return self._process_instruments()
 
     @property
     def to_dict(self) -> dict:
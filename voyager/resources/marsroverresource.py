@@ -1,6 +1,11 @@
+from __future__ import annotations
+
 from asyncio.events import AbstractEventLoop
-from typing import Generator, List, Union
-from .base import BaseResource
+from typing import List, Union
+
+from ..dates import parse_datetime
+from ..decorators import lazy_property
+from .base import BaseResource, LazySequence, _as_sequence
 import datetime
 
 
@@ -83,7 +88,7 @@ class MarsRover(object):
 
     @property
     def landing_datetime(self) -> datetime.datetime:
-        return datetime.datetime.strptime(self._landing_date, "%Y-%m-%d")
+        return parse_datetime(self._landing_date)
 
     @property
     def launch_date(self) -> str:
@@ -91,7 +96,7 @@ class MarsRover(object):
 
     @property
     def launch_datetime(self) -> datetime.datetime:
-        return datetime.datetime.strptime(self._launch_date, "%Y-%m-%d")
+        return parse_datetime(self._launch_date)
 
     @property
     def status(self) -> str:
@@ -148,7 +153,7 @@ class MarsPhoto(object):
 
     @property
     def earth_datetime(self) -> datetime.datetime:
-        return datetime.datetime.strptime(self._earth_date, "%Y-%m-%d")
+        return parse_datetime(self._earth_date)
 
     @property
     def total_photos(self) -> Union[int, None]:
@@ -172,7 +177,6 @@ class MarsRoverResource(BaseResource):
     __slots__ = [
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -180,32 +184,23 @@ class MarsRoverResource(BaseResource):
         self._data = data
 
     def __iter__(self):
-        return self
+        return iter(_as_sequence(self.photos))
 
-    def __next__(self):
-        for mp in self.photos:
-            yield mp
-
-    def _process_photos(self) -> Union[Generator[MarsPhoto, None, None], MarsPhoto, None]:
+    def _process_photos(self) -> Union[LazySequence[MarsPhoto], MarsPhoto, None]:
         if not (pic := self._data.get("photos")):
             return None
         elif len(pic) != 1:
-            for data in pic:
-                yield MarsPhoto(data)
+            return LazySequence(pic, MarsPhoto)
         else:
             return MarsPhoto(pic[0])
 
-    @property
-    def photos(self) -> Union[Generator[MarsPhoto, None, None], MarsPhoto, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_photos()
-        return self._cache[self]
+    @lazy_property
+    def photos(self) -> Union[LazySequence[MarsPhoto], MarsPhoto, None]:
+        return self._process_photos()
 
-    @property
-    def all_photos(self) -> Union[Generator[MarsPhoto, None, None], MarsPhoto, None]:
-        if (pic := f"{self}all") not in self._cache:
-            self._cache[pic] = [mp for mp in self._process_photos()]
-        return self._cache[pic]
+    @lazy_property
+    def all_photos(self) -> List[MarsPhoto]:
+        return list(_as_sequence(self.photos))
 
     @property
     def to_dict(self) -> dict:
@@ -229,7 +224,6 @@ class MarsManifestResource(BaseResource):
         '_total_photos',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -245,11 +239,7 @@ class MarsManifestResource(BaseResource):
         self._data = data
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        for mp in self.photos:
-            yield mp
+        return iter(_as_sequence(self.photos))
 
     @property
     def name(self) -> str:
@@ -261,7 +251,7 @@ class MarsManifestResource(BaseResource):
 
     @property
     def landing_datetime(self) -> datetime.datetime:
-        return datetime.datetime.strptime(self._landing_date, "%Y-%m-%d")
+        return parse_datetime(self._landing_date)
 
     @property
     def launch_date(self) -> str:
@@ -269,7 +259,7 @@ class MarsManifestResource(BaseResource):
 
     @property
     def launch_datetime(self) -> datetime.datetime:
-        return datetime.datetime.strptime(self._launch_date, "%Y-%m-%d")
+        return parse_datetime(self._launch_date)
 
     @property
     def status(self) -> str:
@@ -289,26 +279,23 @@ class MarsManifestResource(BaseResource):
 
     @property
     def max_datetime(self) -> datetime.datetime:
-        return datetime.datetime.strptime(self._max_date, "%Y-%m-%d")
+        return parse_datetime(self._max_date)
 
     @property
     def total_photos(self) -> int:
         return self._total_photos
 
-    def _process_photos(self) -> Union[Generator[MarsPhoto, None, None], MarsPhoto, None]:
+    def _process_photos(self) -> Union[LazySequence[MarsPhoto], MarsPhoto, None]:
         if not (mp := self._pm.get("photos")):
             return None
         elif len(mp) != 1:
-            for data in mp:
-                yield MarsPhoto(data)
+            return LazySequence(mp, MarsPhoto)
         else:
             return MarsPhoto(mp[0])
 
-    @property
-    def photos(self) -> Union[Generator[MarsPhoto, None, None], MarsPhoto, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_photos()
-        return self._cache[self]
+    @lazy_property
+    def photos(self) -> Union[LazySequence[MarsPhoto], MarsPhoto, None]:
+        return self._process_photos()
 
     @property
     def to_dict(self) -> dict:
@@ -1,10 +1,14 @@
+from __future__ import annotations
+
 from asyncio.events import AbstractEventLoop
 from collections import namedtuple
-from typing import Generator, List, Union
+from typing import List, Union
 
-from .base import BaseResource
+from ..decorators import lazy_property
+from .base import BaseResource, LazySequence
 from .missiondesign import (MissionDesignDVLowThrust, MissionDesignObject,
                             MissionDesignSignature)
+from .records import field_setter
 
 __all__ = [
     'MissionDesignResource',
@@ -35,59 +39,51 @@ _ATTRS = {
     "decl_dep": Union[List[List[float]], None],
     "approach_ang": Union[List[List[float]], None],
 }
+_assign_fields = field_setter(_ATTRS)
 
 
 class MissionDesignResource(BaseResource):
     __slots__ = [
         '_data',
+        *_ATTRS,
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
         super(MissionDesignResource, self).__init__(data, loop=loop)
+        _assign_fields(self, data)
         self._data = data
 
-    @property
+    @lazy_property
     def signature(self) -> MissionDesignSignature:
-        if (sig := f"{self}signature") not in self._cache:
-            self._cache[sig] = MissionDesignSignature(self._data.get("signature"))
-        return self._cache[sig]
+        return MissionDesignSignature(self._data.get("signature"))
 
-    @property
+    @lazy_property
     def object(self) -> MissionDesignObject:
-        if (obj := f"{self}object") not in self._cache:
-            self._cache[obj] = MissionDesignObject(self._data.get("object"))
-        return self._cache[obj]
+        return MissionDesignObject(self._data.get("object"))
 
-    @property
+    @lazy_property
     def dv_lowthrust(self) -> MissionDesignDVLowThrust:
-        if (lt := f"{self}lt") not in self._cache:
-            self._cache[lt] = MissionDesignDVLowThrust(self._data.get("dv_lowthrust"))
-        return self._cache[lt]
+        return MissionDesignDVLowThrust(self._data.get("dv_lowthrust"))
 
     @property
     def fields(self) -> Union[List[str], None]:
-        if (fd := f"{self}fields") not in self._cache:
-            self._cache[fd] = self._data.get("fields")
-        return self._cahe[fd]
+        return self._data.get("fields")
 
-    def _process_sm(self) -> Union[Generator[namedtuple, None, None], namedtuple, None]:
+    def _process_sm(self) -> Union[LazySequence[namedtuple], namedtuple, None]:
         if not (sm := self._data.get("selectedMissions")):
             return None
         elif len(sm) != 1:
-            return (_SELM(*data) for data in sm)
+            return LazySequence(sm, lambda data: _SELM(*data))
         else:
             return _SELM(*sm[0])
 
-    @property
-    def selected_missions(self) -> Union[Generator[namedtuple, None, None], namedtuple, None]:
-        if (sm := f"{self}sm") not in self._cache:
-            self._cache[sm] = self._process_sm()
-        return self._cache[sm]
+    @lazy_property
+    def selected_missions(self) -> Union[LazySequence[namedtuple], namedtuple, None]:
+        return self._process_sm()
 
     @property
-    def missions(self) -> Union[Generator[namedtuple, None, None], namedtuple, None]:
+    def missions(self) -> Union[LazySequence[namedtuple], namedtuple, None]:
         return self.selected_missions
 
     @property
@@ -98,14 +94,3 @@ class MissionDesignResource(BaseResource):
     def from_dict(cls, data: dict,
                   loop: AbstractEventLoop = None) -> "MissionDesignResource":
         return cls(data, loop=loop)
-
-
-def _add_func(name: str):
-    @property
-    def fn(self) -> _ATTRS.get(name):
-        return self._data.get(name)
-    setattr(MissionDesignResource, name, fn)
-
-
-for attr in _ATTRS:
-    _add_func(attr)
@@ -1,6 +1,7 @@
 from asyncio.events import AbstractEventLoop
 from typing import List, Union
 
+from ..decorators import lazy_property
 from .base import BaseResource
 
 __all__ = [
@@ -71,7 +72,6 @@ class MPCResource(BaseResource):
         '_link',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -101,11 +101,9 @@ class MPCResource(BaseResource):
         else:
             return MPCInstrument(instrs[0])
 
-    @property
+    @lazy_property
     def instruments(self) -> Union[List[MPCInstrument], MPCInstrument, None]:
-        if (instr := f"{self}instr") not in self._cache:
-            self._cache[instr] = self._process_instruments()
-        return self._cache[instr]
+        return self._process_instruments()
 
     def _process_linked_events(self) -> Union[List[MPCLinkedEvent], MPCLinkedEvent, None]:
         if not (le := self._data.get("linkedEvents")):
@@ -115,11 +113,9 @@ class MPCResource(BaseResource):
         else:
             return MPCLinkedEvent(le[0])
 
-    @property
+    @lazy_property
     def linked_events(self) -> Union[List[MPCLinkedEvent], MPCLinkedEvent, None]:
-        if (le := f"{self}le") not in self._cache:
-            self._cache[le] = self._process_linked_events()
-        return self._cache[le]
+        return self._process_linked_events()
 
     @property
     def link(self) -> str:
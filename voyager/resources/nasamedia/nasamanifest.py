@@ -1,4 +1,9 @@
-from typing import Generator, Union
+from __future__ import annotations
+
+from typing import Union
+
+from ...decorators import lazy_property
+from ..base import LazySequence
 
 
 class NASAManifest(object):
@@ -31,8 +36,8 @@ class NASAManifestCollection(object):
         '_version',
         '_href',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._version = data.get("version")
@@ -47,19 +52,17 @@ class NASAManifestCollection(object):
     def href(self) -> str:
         return self._href
 
-    def _process_manifests(self) -> Union[Generator[NASAManifest, None, None], NASAManifest, None]:
+    def _process_manifests(self) -> Union[LazySequence[NASAManifest], NASAManifest, None]:
         if not (mf := self._data.get("items")):
             return None
         elif len(mf) != 1:
-            return (NASAManifest(data) for data in mf)
+            return LazySequence(mf, NASAManifest)
         else:
             return NASAManifest(mf[0])
 
-    @property
-    def manifests(self) -> Union[Generator[NASAManifest, None, None], NASAManifest, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_manifests()
-        return self._cache[self]
+    @lazy_property
+    def manifests(self) -> Union[LazySequence[NASAManifest], NASAManifest, None]:
+        return self._process_manifests()
 
     @property
     def to_dict(self) -> dict:
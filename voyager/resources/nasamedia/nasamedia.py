@@ -1,4 +1,9 @@
-from typing import Generator, List, Union
+from __future__ import annotations
+
+from typing import List, Union
+
+from ...decorators import lazy_property
+from ..base import LazySequence
 from .nasamedialink import NASAMediaLink
 
 
@@ -69,26 +74,24 @@ class NASAMediaAsset(object):
     __slots__ = [
         '_href',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._href = data.get("href")
         self._data = data
 
-    def _process_data(self) -> Union[Generator[NASAMediaData, None, None], NASAMediaData, None]:
+    def _process_data(self) -> Union[LazySequence[NASAMediaData], NASAMediaData, None]:
         if not (dt := self._data.get("data")):
             return None
         elif len(dt) != 1:
-            return (NASAMediaData(data) for data in dt)
+            return LazySequence(dt, NASAMediaData)
         else:
             return NASAMediaData(dt[0])
 
-    @property
-    def data(self) -> Union[Generator[NASAMediaData, None, None], NASAMediaData, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_data()
-        return self._cache[self]
+    @lazy_property
+    def data(self) -> Union[LazySequence[NASAMediaData], NASAMediaData, None]:
+        return self._process_data()
 
     @property
     def href(self) -> str:
@@ -1,4 +1,9 @@
-from typing import Generator, Union
+from __future__ import annotations
+
+from typing import Union
+
+from ...decorators import lazy_property
+from ..base import LazySequence
 from .nasamedia import NASAMediaAsset
 from .nasamedialink import NASAMediaLink
 
@@ -9,8 +14,8 @@ class NASAMediaCollection(object):
         '_metadata',
         '_href',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._version = data.get("version")
@@ -34,33 +39,29 @@ class NASAMediaCollection(object):
     def url(self) -> str:
         return self.href
 
-    def _process_items(self) -> Union[Generator[NASAMediaAsset, None, None], NASAMediaAsset, None]:
+    def _process_items(self) -> Union[LazySequence[NASAMediaAsset], NASAMediaAsset, None]:
         if not (ma := self._data.get("items")):
             return None
         elif len(ma) != 1:
-            return (NASAMediaAsset(item) for item in ma)
+            return LazySequence(ma, NASAMediaAsset)
         else:
             return NASAMediaAsset(ma[0])
 
-    @property
-    def items(self) -> Union[Generator[NASAMediaAsset, None, None], NASAMediaAsset, None]:
-        if (ma := f"{self}asset") not in self._cache:
-            self._cache[ma] = self._process_items()
-        return self._cache[ma]
+    @lazy_property
+    def items(self) -> Union[LazySequence[NASAMediaAsset], NASAMediaAsset, None]:
+        return self._process_items()
 
-    def _process_links(self) -> Union[Generator[NASAMediaLink, None, None], NASAMediaLink, None]:
+    def _process_links(self) -> Union[LazySequence[NASAMediaLink], NASAMediaLink, None]:
         if not (lk := self._data.get("links")):
             return None
         elif len(lk) != 1:
-            return (NASAMediaLink(data) for data in lk)
+            return LazySequence(lk, NASAMediaLink)
         else:
             return NASAMediaLink(lk[0])
 
-    @property
-    def links(self) -> Union[Generator[NASAMediaLink, None, None], NASAMediaLink, None]:
-        if (lk := f"{self}links") not in self._cache:
-            self._cache[lk] = self._process_links()
-        return self._cache[lk]
+    @lazy_property
+    def links(self) -> Union[LazySequence[NASAMediaLink], NASAMediaLink, None]:
+        return self._process_links()
 
     @property
     def to_dict(self) -> dict:
@@ -1,6 +1,7 @@
 from asyncio.events import AbstractEventLoop
 from typing import Union
 
+from ..decorators import lazy_property
 from .base import BaseResource
 from .nasamedia import NASAManifestCollection, NASAMediaCollection
 
@@ -38,7 +39,6 @@ class NASAMediaResource(BaseResource):
         '_col_asset',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -49,11 +49,9 @@ class NASAMediaResource(BaseResource):
             self._col_asset = NASAManifestCollection
         self._data = data
 
-    @property
+    @lazy_property
     def collection(self) -> Union[NASAMediaCollection, NASAManifestCollection, None]:
-        if self not in self._cache:
-            self._cache[self] = self._col_asset(self._data.get("collection"))
-        return self._cache[self]
+        return self._col_asset(self._data.get("collection"))
 
     @property
     def to_dict(self) -> dict:
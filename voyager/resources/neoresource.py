@@ -1,10 +1,14 @@
+from __future__ import annotations
+
 import datetime as dt
 from asyncio.events import AbstractEventLoop
 from collections import namedtuple
 from typing import List, Union
 
+from ..dates import parse_datetime
+from ..decorators import lazy_property
 from ..exceptions import ResourceException, VoyagerException
-from .base import BaseResource
+from .base import BaseResource, LazySequence, _as_sequence
 
 __all__ = [
     'NEOResource',
@@ -182,8 +186,8 @@ class NEOOrbitalData(object):
         self._mean_anomaly = data.get("mean_anomaly")
         self._mean_motion = data.get("mean_motion")
         self._equinox = data.get("equinox")
-        self._orbit_class = NEOOrbitClass(data.get("orbit_class"))
-        self._data = self.to_dict
+        self._orbit_class = NEOOrbitClass(data.get("orbit_class") or {})
+        self._data = data
 
     @property
     def id(self) -> int:
@@ -195,9 +199,7 @@ class NEOOrbitalData(object):
 
     @property
     def determination_datetime(self) -> dt.datetime:
-        return dt.datetime.strptime(
-            self._determination_date,
-            "%Y-%m-%d %H:%M:%S")
+        return parse_datetime(self._determination_date)
 
     @property
     def first_observation_date(self) -> str:
@@ -205,10 +207,7 @@ class NEOOrbitalData(object):
 
     @property
     def first_observation_datetime(self) -> dt.datetime:
-        return dt.datetime.strptime(
-            self._first_observe_date,
-            "%Y-%m-%d"
-        )
+        return parse_datetime(self._first_observe_date)
 
     @property
     def last_observation_date(self) -> str:
@@ -216,10 +215,7 @@ class NEOOrbitalData(object):
 
     @property
     def last_observation_datetime(self) -> dt.datetime:
-        return dt.datetime.strptime(
-            self._last_observe_date,
-            "%Y-%m-%d"
-        )
+        return parse_datetime(self._last_observe_date)
 
     @property
     def data_arc_in_days(self) -> int:
@@ -315,8 +311,8 @@ class NEOCloseApproachData(object):
         '_missdist',
         '_orbiting_body',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._date = data.get("close_approach_date")
@@ -333,27 +329,23 @@ class NEOCloseApproachData(object):
 
     def _process_datetime(self, type: str) -> dt.datetime:
         if type == "short":
-            return dt.datetime.strptime(self._date, "%Y-%m-%d")
+            return parse_datetime(self._date)
         elif type == "full":
-            return dt.datetime.strptime(self._fulldate, "%Y-%b-%d %H:%M")
+            return parse_datetime(self._fulldate)
         else:
             raise VoyagerException("Invalid type passed for datetime conversion")
 
-    @property
+    @lazy_property
     def shortdatetime(self) -> dt.datetime:
-        if (name := f"{self}short") not in self._cache:
-            self._cache[name] = self._process_datetime("short")
-        return self._cache[name]
+        return self._process_datetime("short")
 
     @property
     def date(self) -> str:
         return self._fulldate
 
-    @property
+    @lazy_property
     def datetime(self) -> dt.datetime:
-        if (name := f"{self}full") not in self._cache:
-            self._cache[name] = self._process_datetime("full")
-        return self._cache[name]
+        return self._process_datetime("full")
 
     @property
     def epoch(self) -> dt.datetime:
@@ -414,8 +406,8 @@ class NEOObject(object):
         '_orbital_data',
         '_sentry',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._links = data.get("links")
@@ -427,7 +419,7 @@ class NEOObject(object):
         self._abs_mag_h = data.get("absolute_magnitude_h")
         self._diameter = data.get("estimated_diameter")  # TODO: Implement methods
         self._hazardous = data.get("is_potentially_hazardous_asteroid")
-        self._orbital_data = NEOOrbitalData(data.get("orbital_data"))
+        self._orbital_data = NEOOrbitalData(data.get("orbital_data") or {})
         self._sentry = data.get("is_sentry_object")
         self._data = data
 
@@ -497,11 +489,9 @@ class NEOObject(object):
         else:
             raise ResourceException("Invalid resource returned in the request")
 
-    @property
+    @lazy_property
     def close_approach(self) -> Union[NEOCloseApproachData, List[NEOCloseApproachData], None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_close_approach()
-        return self._cache[self]
+        return self._process_close_approach()
 
     @property
     def orbit(self) -> NEOOrbitalData:
@@ -523,12 +513,11 @@ class NEOObject(object):
 class NEOResource(BaseResource):
     __slots__ = [
         '_links',
-        '_page'
+        '_page',
         '_element_count',
-        'search_type',
+        '_search_type',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -540,16 +529,7 @@ class NEOResource(BaseResource):
         self._data = data
 
     def __iter__(self):
-        self.__index = 0
-        return self.neo
-
-    def __next__(self):
-        try:
-            ret = self.neo[self.__index]
-            self.__index += 1
-            return ret
-        except IndexError:
-            raise StopIteration
+        return iter(_as_sequence(self.neo))
 
     @property
     def links(self) -> NEOLinks:
@@ -559,26 +539,32 @@ class NEOResource(BaseResource):
     def page(self) -> NEOPage:
         return self._page
 
-    def _process_neo(self) -> Union[List[NEOObject], List[List[NEOObject]], NEOObject, None]:
+    @property
+    def element_count(self) -> Union[int, None]:
+        return self._element_count
+
+    @property
+    def search_type(self) -> Union[str, None]:
+        return self._search_type
+
+    def _process_neo(self) -> Union[LazySequence[NEOObject], List[LazySequence[NEOObject]], NEOObject, None]:
         if self._search_type == "feed-none" or self._search_type == "browse":
-            return [
-                NEOObject(data for data in self._data.get("near_earth_objects"))
-            ] or None
+            return LazySequence(neo, NEOObject) if (
+                neo := self._data.get("near_earth_objects")
+            ) else None
         elif self._search_type == "feed-query":
             return [
-                [NEOObject(data) for data in subdict]
-                for subdict in self._data.get("near_earth_objects")
+                LazySequence(subdict, NEOObject)
+                for _, subdict in sorted(self._data.get("near_earth_objects").items())
             ] or None
         elif self._search_type == "lookup":
             return NEOObject(self._data)
         else:
             raise ResourceException("Invalid resource returned in the request")
 
-    @property
-    def neo(self) -> Union[List[NEOObject], List[List[NEOObject]], NEOObject, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_neo()
-        return self._cache[self]
+    @lazy_property
+    def neo(self) -> Union[LazySequence[NEOObject], List[LazySequence[NEOObject]], NEOObject, None]:
+        return self._process_neo()
 
     @property
     def to_dict(self) -> dict:
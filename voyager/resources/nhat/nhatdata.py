@@ -2,6 +2,7 @@ from asyncio.events import AbstractEventLoop
 from collections import namedtuple
 from typing import Union
 
+from ...decorators import lazy_property
 from ..base import BaseResource
 
 _ATTRS = {
@@ -59,8 +60,8 @@ def _handle(pot_num: str) -> Union[float, int, str]:
 class NHATTrajectory(object):
     __slots__ = [
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._data = data
@@ -78,7 +79,6 @@ class NHATSData(BaseResource):
     __slots__ = [
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -89,21 +89,17 @@ class NHATSData(BaseResource):
     def min_dv(self) -> namedtuple:
         return _DUR(*self._data.get("min_dv"))
 
-    @property
+    @lazy_property
     def min_dv_traj(self) -> NHATTrajectory:
-        if (mdvt := f"{self}mindivtraj") not in self._cache:
-            self._cache[mdvt] = NHATTrajectory(self._data.get("min_dv_traj"))
-        return self._cache[mdvt]
+        return NHATTrajectory(self._data.get("min_dv_traj"))
 
     @property
     def min_dur(self) -> namedtuple:
         return _DUR(*self._data.get("min_dur"))
 
-    @property
+    @lazy_property
     def min_dur_traj(self) -> NHATTrajectory:
-        if (mdrt := f"{self}mindurtraj") not in self._cache:
-            self._cache[mdrt] = NHATTrajectory(self._data.get("min_dur_traj"))
-        return self._cache[mdrt]
+        return NHATTrajectory(self._data.get("min_dur_traj"))
 
     @property
     def to_dict(self) -> dict:
@@ -115,12 +111,10 @@ class NHATSData(BaseResource):
 
 
 def _add_func(_class, attr_ref, name: str):
-    @property
     def fn(self) -> attr_ref.get(name):
-        if name not in self._cache:
-            self._cache[name] = _handle(self._data.get(name))
-        return self._cache[name]
-    setattr(_class, name, fn)
+        return _handle(self._data.get(name))
+    fn.__name__ = name
+    setattr(_class, name, lazy_property(fn))
 
 
 for attr in _ATTRS:
@@ -1,8 +1,13 @@
+from __future__ import annotations
+
 from asyncio.events import AbstractEventLoop
-from typing import Generator, Union
+from typing import Union
 
-from .base import BaseResource
+from ..decorators import lazy_property
+from .base import BaseResource, LazySequence
 from .nhat import NHATSData, NHATSignature
+from .nhat.nhatdata import _ATTRS as _NHATS_ATTRS
+from .tables import ArrowExport, from_rows
 
 __all__ = [
     'NHATSResource',
@@ -10,12 +15,11 @@ __all__ = [
 ]
 
 
-class NHATSResource(BaseResource):
+class NHATSResource(BaseResource, ArrowExport):
     __slots__ = [
         '_count',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -30,25 +34,24 @@ class NHATSResource(BaseResource):
     def count(self) -> int:
         return self._count
 
-    @property
+    @lazy_property
     def signature(self) -> NHATSignature:
-        if (sig := f"{self}signature") not in self._cache:
-            self._cache[sig] = NHATSignature(self._data.get("signature"))
-        return self._cache[sig]
+        return NHATSignature(self._data.get("signature"))
 
-    def _process_data(self) -> Union[Generator[NHATSData, None, None], NHATSData, None]:
+    def _process_data(self) -> Union[LazySequence[NHATSData], NHATSData, None]:
         if not (dt := self._data.get("data")):
             return None
         elif len(dt) != 1:
-            return (NHATSData(data, loop=self._loop) for data in dt)
+            return LazySequence(dt, lambda data: NHATSData(data, loop=self._loop))
         else:
             return NHATSData(dt[0], loop=self._loop)
 
-    @property
+    @lazy_property
     def data(self):
-        if (dt := f"{self}data") not in self._cache:
-            self._cache[dt] = self._process_data()
-        return self._cache[dt]
+        return self._process_data()
+
+    def _arrow_table(self) -> "pa.Table":
+        return from_rows(self._data.get("data") or [], _NHATS_ATTRS)
 
     @property
     def to_dict(self) -> dict:
@@ -14,6 +14,7 @@ class NotificationResource(BaseResource):
         '_url',
         '_timestamp',
         '_content',
+        '_data',
     ]
 
     def __init__(self, data: dict,
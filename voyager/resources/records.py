@@ -0,0 +1,108 @@
+from typing import Any, Callable, Dict
+
+
+def _to_int(value: Any) -> Any:
+    # Only exact conversions: "2.7", "1e30" and 2.5 are kept as they are
+    # rather than truncated or rounded through a float
+    if value is None or isinstance(value, int):
+        return value
+    elif isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _to_float(value: Any) -> Any:
+    if value is None or isinstance(value, float):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _to_str(value: Any) -> Any:
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+def coercer(annotation: Any) -> Callable[[Any], Any]:
+    """Returns the function that converts a raw JSON value to the type of an
+    ``_ATTRS`` annotation. Values that can't be converted are returned
+    unchanged, as are values whose annotation has no scalar equivalent
+    """
+    args = [arg for arg in getattr(annotation, "__args__", [annotation])
+            if arg is not type(None)]
+    if len(args) != 1:
+        return None
+    return {
+        int: _to_int,
+        float: _to_float,
+        str: _to_str,
+    }.get(args[0])
+
+
+def field_setter(attrs: Dict[str, Any]) -> Callable[[object, dict], None]:
+    """Compiles a function that stores every field of an ``_ATTRS`` map from
+    a raw dict into the slot of the same name, coercing each value to its
+    declared type. The function is generated once, so constructing a record
+    costs one dict lookup and at most one conversion per field
+    """
+    namespace = {}
+    lines = ["def assign(self, data):", "    get = data.get"]
+    for index, name in enumerate(attrs):
+        if (convert := coercer(attrs[name])) is not None:
+            namespace[f"_c{index}"] = convert
+            lines.append(f"    self.{name} = _c{index}(get({name!r}))")
+        else:
+            lines.append(f"    self.{name} = get({name!r})")
+    if not attrs:
+        lines.append("    pass")
+    exec("\n".join(lines), namespace)
+    return namespace["assign"]
+
+
+def record_class(name: str, attrs: Dict[str, Any], module: str) -> type:
+    """Generates a slotted record class for a row type described by an
+    ``_ATTRS`` map. Each field is stored in its own slot, coerced to its
+    declared type when the record is built. The raw dict is dropped unless
+    the record is built with ``raw=True``
+
+    :param name: the name of the class
+    :type name: str
+    :param attrs: the type annotation of each field
+    :type attrs: Dict[str, Any]
+    :param module: the name of the module the class belongs to
+    :type module: str
+    :rtype: type
+    """
+    assign = field_setter(attrs)
+    fields = tuple(attrs)
+
+    def __init__(self, data: dict, raw: bool = False) -> None:
+        assign(self, data)
+        self._data = data if raw else None
+
+    def __repr__(self) -> str:
+        return f"<{name} {' '.join(f'{f}={getattr(self, f)!r}' for f in fields[:3])}>"
+
+    def to_dict(self) -> dict:
+        if self._data is not None:
+            return self._data
+        return {field: getattr(self, field) for field in fields}
+
+    def from_dict(cls, data: dict) -> Any:
+        return cls(data)
+
+    return type(name, (object,), {
+        '__slots__': fields + ('_data',),
+        '__module__': module,
+        '__init__': __init__,
+        '__repr__': __repr__,
+        '_FIELDS': fields,
+        'to_dict': property(to_dict),
+        'from_dict': classmethod(from_dict),
+    })
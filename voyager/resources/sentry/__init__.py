@@ -1,13 +1,5 @@
 from typing import Union
 
-from .sentrybase import SentryBase
-from .sentryo import SentryDataO
-from .sentryr import SentryDataR
-from .sentrys import SentryDataS
-from .sentrysignatures import SentrySignature
-from .sentrysummary import SentrySummary
-from .sentryv import SentryDataV
-
 
 def _handle(pot_conv: str) -> Union[float, int, str]:
     try:
@@ -18,6 +10,15 @@ def _handle(pot_conv: str) -> Union[float, int, str]:
         return pot_conv
 
 
+from .sentrybase import SentryBase
+from .sentryO import SentryDataO
+from .sentryR import SentryDataR
+from .sentryS import SentryDataS
+from .sentrysignatures import SentrySignature
+from .sentrysummary import SentrySummary
+from .sentryV import SentryDataV
+
+
 __all__ = [
     'SentryBase',
     'SentryDataO',
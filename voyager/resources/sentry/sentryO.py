@@ -1,5 +1,6 @@
 from typing import Union
 
+from ...decorators import lazy_property
 from . import _handle
 from .sentrybase import SentryBase
 
@@ -22,7 +23,6 @@ class SentryDataO(SentryBase):
     __slots__ = [
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._data = data
@@ -37,12 +37,10 @@ class SentryDataO(SentryBase):
 
 
 def _add_func(name: str):
-    @property
     def fn(self) -> _ATTRS.get(name):
-        if name not in self._cache:
-            self._cache[name] = _handle(self._data.get(name))
-        return self._cache[name]
-    setattr(SentryDataO, name, fn)
+        return _handle(self._data.get(name))
+    fn.__name__ = name
+    setattr(SentryDataO, name, lazy_property(fn))
 
 
 for attr in _ATTRS:
@@ -1,5 +1,6 @@
 import datetime
 
+from ...dates import parse_datetime
 from .sentrybase import SentryBase
 
 
@@ -7,7 +8,7 @@ class SentryDataR(SentryBase):
     __slots__ = [
         '_des',
         '_removed',
-        '_data,'
+        '_data',
     ]
 
     def __init__(self, data: dict) -> None:
@@ -25,7 +26,7 @@ class SentryDataR(SentryBase):
 
     @property
     def removed_dt(self) -> datetime.datetime:
-        return datetime.datetime.strptime(self.removed, "%Y-%m-%d %H:%M")
+        return parse_datetime(self.removed)
 
     @property
     def to_dict(self) -> dict:
@@ -1,5 +1,6 @@
 from typing import Union
 
+from ...decorators import lazy_property
 from . import _handle
 from .sentrybase import SentryBase
 
@@ -25,7 +26,6 @@ class SentryDataS(SentryBase):
     __slots__ = [
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._data = data
@@ -40,12 +40,10 @@ class SentryDataS(SentryBase):
 
 
 def _add_func(name: str):
-    @property
     def fn(self) -> _ATTRS.get(name):
-        if name not in self._cache:
-            self._cache[name] = _handle(self._data.get(name))
-        return self._cache[name]
-    setattr(SentryDataS, name, fn)
+        return _handle(self._data.get(name))
+    fn.__name__ = name
+    setattr(SentryDataS, name, lazy_property(fn))
 
 
 for attr in _ATTRS:
@@ -1,2 +1,4 @@
 class SentryBase(object):
-    __slots__ = []
+    __slots__ = [
+        '_lazy',
+    ]
@@ -1,4 +1,6 @@
 from typing import Union
+
+from ...decorators import lazy_property
 from . import _handle
 
 
@@ -32,8 +34,8 @@ _ATTRS = {
 class SentrySummary(object):
     __slots__ = [
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._data = data
@@ -48,12 +50,10 @@ class SentrySummary(object):
 
 
 def _add_func(name: str):
-    @property
     def fn(self) -> _ATTRS.get(name):
-        if name not in self._cache:
-            self._cache[name] = _handle(self._data.get(name))
-        return self._cache[name]
-    setattr(SentrySummary, name, fn)
+        return _handle(self._data.get(name))
+    fn.__name__ = name
+    setattr(SentrySummary, name, lazy_property(fn))
 
 
 for attr in _ATTRS:
@@ -1,10 +1,15 @@
+from __future__ import annotations
+
 import datetime
 from asyncio.events import AbstractEventLoop
-from typing import Any, Generator, Union
+from typing import Any, Union
 
-from .base import BaseResource
+from ..dates import parse_datetime
+from ..decorators import lazy_property
+from .base import BaseResource, LazySequence, _as_sequence
 from .sentry import (SentryBase, SentryDataO, SentryDataR, SentryDataS,
                      SentryDataV, SentrySummary)
+from .tables import ArrowExport, from_rows, type_map
 
 __all__ = [
     'SentryResource',
@@ -29,7 +34,7 @@ def _handle(pot_int: str, default: Any = None) -> Union[Any, None]:
         return pot_int
 
 
-class SentryResource(BaseResource):
+class SentryResource(BaseResource, ArrowExport):
     __slots__ = [
         '_count',
         '_removed',
@@ -37,16 +42,12 @@ class SentryResource(BaseResource):
         '_mode',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
         super(SentryResource, self).__init__(data, loop=loop)
         self._count = _handle(data.get("count"))
-        self._removed = data.get(
-            "removed",
-            lambda s: datetime.datetime.strptime(s, "%Y-%m-%d %H:%M:%S")
-        )
+        self._removed = data.get("removed")
         self._error = data.get("error")
         self._mode = data.get("mode")
         self._data = data
@@ -57,44 +58,45 @@ class SentryResource(BaseResource):
         return self._count
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        for dt in self.data:
-            yield dt
+        return iter(_as_sequence(self.data))
 
     @property
     def count(self) -> Union[int, None]:
         return self._count
 
-    @property
+    @lazy_property
     def summary(self) -> Union[SentrySummary, None]:
-        if (sm := f"{self}summary") not in self._cache:
-            if (smr := self._data.get("summary")):
-                self._cache[sm] = SentrySummary(smr)
-            else:
-                self._cache[sm] = None
-        return self._cache[sm]
-
-    def _process_data(self) -> Union[Generator[SentryBase, None, None], SentryBase, None]:
+        if (smr := self._data.get("summary")):
+            return SentrySummary(smr)
+        return None
+
+    def _process_data(self) -> Union[LazySequence[SentryBase], SentryBase, None]:
         if not (dt := self._data.get("data")):
             return None
         _class = _MAP.get(f"{self._mode}d")
         if len(dt) != 1:
-            return (_class(data) for data in dt)
+            return LazySequence(dt, _class)
         else:
             return _class(dt[0])
 
-    @property
-    def data(self) -> Union[Generator[SentryBase, None, None], SentryBase, None]:
-        if (dt := f"{self}data") not in self._cache:
-            self._cache[dt] = self._process_data()
-        return self._cache[dt]
+    @lazy_property
+    def data(self) -> Union[LazySequence[SentryBase], SentryBase, None]:
+        return self._process_data()
+
+    def _arrow_table(self) -> "pa.Table":
+        return from_rows(self._data.get("data") or [],
+                         type_map(_MAP.get(f"{self._mode}d")))
 
     @property
-    def removed(self) -> Union[datetime.datetime, str, None]:
+    def removed(self) -> Union[str, None]:
         return self._removed
 
+    @property
+    def removed_datetime(self) -> Union[datetime.datetime, None]:
+        if not self._removed:
+            return None
+        return parse_datetime(self._removed)
+
     @property
     def error(self) -> Union[str, None]:
         return self._error
@@ -1,6 +1,7 @@
 from asyncio.events import AbstractEventLoop
 from typing import List, Union
 
+from ..decorators import lazy_property
 from .base import BaseResource
 
 
@@ -72,7 +73,6 @@ class SEPResource(BaseResource):
         '_link',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -102,11 +102,9 @@ class SEPResource(BaseResource):
         else:
             return SEPInstrument(instrs[0])
 
-    @property
+    @lazy_property
     def instruments(self) -> Union[List[SEPInstrument], SEPInstrument, None]:
-        if (instr := f"{self}instr") not in self._cache:
-            self._cache[instr] = self._process_instruments()
-        return self._cache[instr]
+        return self._process_instruments()
 
     def _process_linked_events(self) -> Union[List[SEPLinkedEvent], SEPLinkedEvent, None]:
         if not (le := self._data.get("linkedEvents")):
@@ -116,11 +114,9 @@ class SEPResource(BaseResource):
         else:
             return SEPLinkedEvent(le[0])
 
-    @property
+    @lazy_property
     def linked_events(self) -> Union[List[SEPLinkedEvent], SEPLinkedEvent, None]:
-        if (le := f"{self}le") not in self._cache:
-            self._cache[le] = self._process_linked_events()
-        return self._cache[le]
+        return self._process_linked_events()
 
     @property
     def link(self) -> str:
@@ -0,0 +1,157 @@
+import abc
+import sys
+from typing import Any, Dict, List, Tuple, Union
+
+from ..decorators import check_pyarrow_importable
+from ..exceptions import VoyagerException
+from .columns import _NULLS
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pass
+
+
+__all__ = [
+    'ArrowExport',
+]
+
+
+def type_map(cls: type) -> Union[Dict[str, Any], None]:
+    """Returns the ``_ATTRS`` type map of the module a record class is
+    defined in, or None if it doesn't define one
+    """
+    if cls is None:
+        return None
+    attrs = getattr(sys.modules.get(cls.__module__), "_ATTRS", None)
+    return attrs if isinstance(attrs, dict) else None
+
+
+def arrow_type(annotation: Any) -> Union["pa.DataType", None]:
+    """Converts a type annotation from an ``_ATTRS`` map into an Arrow type.
+    Optional types map to their inner type, since Arrow columns are always
+    nullable, and unions with str map to the numeric type they contain.
+    Returns None for annotations that have no direct equivalent
+    """
+    args = [arg for arg in getattr(annotation, "__args__", [annotation])
+            if arg is not type(None)]
+    if str in args and len(args) > 1:
+        args.remove(str)
+    if len(args) != 1:
+        return None
+    return {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+    }.get(args[0])
+
+
+def cast(array: "pa.Array", target: Union["pa.DataType", None],
+         name: str = None) -> "pa.Array":
+    """Casts an array to the target type. Strings that mean a missing
+    value ("", "None" and "null", as in :func:`~.columns.float_column`)
+    become null first, so a blank cell never changes the type of its
+    column
+
+    :raises VoyagerException: a value can't be converted to the target type
+    """
+    if target is None or array.type == target:
+        return array
+    if pa.types.is_string(array.type):
+        array = pc.if_else(pc.is_in(array, value_set=pa.array(_NULLS)),
+                           pa.scalar(None, pa.string()), array)
+    try:
+        return pc.cast(array, target)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        raise VoyagerException(f"Column {name} can't be converted to {target}: {e}") from e
+
+
+def from_rows(rows: List[dict], types: Dict[str, Any] = None) -> "pa.Table":
+    """Builds a table from a list of JSON objects, casting the columns
+    named in ``types`` to the Arrow equivalent of their annotation
+
+    :raises VoyagerException: a column can't be converted to its type
+    """
+    table = pa.Table.from_pylist(rows)
+    for name, annotation in (types or {}).items():
+        if (index := table.schema.get_field_index(name)) != -1:
+            table = table.set_column(
+                index, name, cast(table.column(index), arrow_type(annotation), name)
+            )
+    return table
+
+
+def from_matrix(fields: List[str], rows: List[list],
+                types: Dict[str, Any] = None,
+                timestamps: Dict[str, str] = None,
+                signed: Dict[str, Tuple[str, str]] = None) -> "pa.Table":
+    """Builds a table from a ``fields`` header and a row matrix, casting the
+    columns named in ``types`` and parsing the columns named in
+    ``timestamps`` with the given strptime format. The columns named in
+    ``signed`` map to a ``(direction field, negative value)`` pair and are
+    negated where their direction column holds that value, like
+    :func:`~.columns.signed_column`. Positions whose field is None are
+    skipped
+
+    :raises VoyagerException: a column can't be converted to its type
+    """
+    try:
+        matrix = pa.array(rows, type=pa.list_(pa.string()))
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        matrix = pa.array([
+            [None if value is None else str(value) for value in row]
+            for row in rows
+        ], type=pa.list_(pa.string()))
+    columns = []
+    for index, name in enumerate(fields):
+        if name is None:
+            continue
+        column = pc.list_element(matrix, index)
+        if name in (timestamps or {}):
+            column = pc.strptime(column, format=timestamps[name],
+                                 unit="s", error_is_null=True)
+        else:
+            column = cast(column, arrow_type((types or {}).get(name)), name)
+        if name in (signed or {}) and signed[name][0] in fields:
+            direction, negative = signed[name]
+            direction = pc.list_element(matrix, fields.index(direction))
+            column = pc.multiply(pc.cast(column, pa.float64()), pc.if_else(
+                pc.fill_null(pc.equal(direction, negative), False), -1.0, 1.0
+            ))
+        columns.append(column)
+    return pa.table(columns, names=[name for name in fields if name is not None])
+
+
+class ArrowExport(abc.ABC):
+    """Mixin for tabular resources that can be exported to Arrow and
+    Parquet straight from their raw payload, without building a record
+    object per row
+    """
+    __slots__ = []
+
+    @abc.abstractmethod
+    def _arrow_table(self) -> "pa.Table":
+        raise NotImplementedError
+
+    @check_pyarrow_importable
+    def to_arrow(self) -> "pa.Table":
+        """Returns the rows of the resource as a typed Arrow table
+
+        :raises VoyagerException: a column can't be converted to its type
+        :return: the table
+        :rtype: pyarrow.Table
+        """
+        return self._arrow_table()
+
+    @check_pyarrow_importable
+    def write_parquet(self, path: str, **kwargs) -> None:
+        """Writes the rows of the resource to a Parquet file. Keyword
+        arguments are passed to :func:`pyarrow.parquet.write_table`
+
+        :param path: the path of the file to write
+        :type path: str
+        """
+        pq.write_table(self.to_arrow(), path, **kwargs)
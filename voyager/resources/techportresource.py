@@ -1,8 +1,12 @@
+from __future__ import annotations
+
 import datetime
 from asyncio.events import AbstractEventLoop
-from typing import Any, Generator, List, Union
+from typing import Any, List, Union
 
-from .base import BaseResource
+from ..dates import parse_datetime
+from ..decorators import lazy_property
+from .base import BaseResource, LazySequence, _as_sequence
 
 
 __all__ = [
@@ -103,9 +107,9 @@ class TechportLibraryItem(object):
         '_external_url',
         '_published_by',
         '_published_date',
-        '_data'
+        '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._id = data.get("id")
@@ -118,11 +122,7 @@ class TechportLibraryItem(object):
         self._data = data
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        for fl in self.files:
-            yield fl
+        return iter(_as_sequence(self.files))
 
     @property
     def id(self) -> int:
@@ -160,22 +160,19 @@ class TechportLibraryItem(object):
     def published_datetime(self) -> Union[datetime.datetime, None]:
         if not self._published_date:
             return None
-        return datetime.datetime.strptime(self._published_date, "")  # TODO: Find formatting
+        return parse_datetime(self._published_date)
 
-    def _process_files(self) -> Union[Generator[TechportFile, None, None], TechportFile, None]:
+    def _process_files(self) -> Union[LazySequence[TechportFile], TechportFile, None]:
         if not (fl := self._data.get("files")):
             return None
         elif len(fl) != 1:
-            for data in fl:
-                yield TechportFile(data)
+            return LazySequence(fl, TechportFile)
         else:
             return TechportFile(fl[0])
 
-    @property
-    def files(self) -> Union[Generator[TechportFile, None, None], TechportFile, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_files()
-        return self._cache[self]
+    @lazy_property
+    def files(self) -> Union[LazySequence[TechportFile], TechportFile, None]:
+        return self._process_files()
 
     @property
     def to_dict(self) -> dict:
@@ -262,7 +259,6 @@ class TechportResource(BaseResource):
         '_closeout_docs',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -298,7 +294,7 @@ class TechportResource(BaseResource):
 
     @property
     def last_updated_datetime(self) -> datetime.datetime:
-        return datetime.datetime.strptime(self._last_updated, "%Y-%m-%d")
+        return parse_datetime(self._last_updated)
 
     @property
     def title(self) -> str:
@@ -314,7 +310,7 @@ class TechportResource(BaseResource):
 
     @property
     def start_datetime(self) -> datetime.datetime:
-        return datetime.datetime.strptime(self._start_date, "%b %Y")
+        return parse_datetime(self._start_date)
 
     @property
     def end_date(self) -> str:
@@ -322,7 +318,7 @@ class TechportResource(BaseResource):
 
     @property
     def end_datetime(self) -> datetime.datetime:
-        return datetime.datetime.strptime(self._end_date, "%b %Y")
+        return parse_datetime(self._end_date)
 
     @property
     def description(self) -> str:
@@ -378,20 +374,17 @@ class TechportResource(BaseResource):
     def principal_investigators(self) -> List[str]:
         return self._prin_investigator
 
-    def _process_library(self) -> Union[Generator[TechportLibraryItem, None, None], TechportLibraryItem, None]:
+    def _process_library(self) -> Union[LazySequence[TechportLibraryItem], TechportLibraryItem, None]:
         if not (li := self._data.get("libraryItems")):
             return None
         elif len(li) != 1:
-            for data in li:
-                yield TechportLibraryItem(data)
+            return LazySequence(li, TechportLibraryItem)
         else:
             return TechportLibraryItem(li[0])
 
-    @property
-    def library_items(self) -> Union[Generator[TechportLibraryItem, None, None], TechportLibraryItem, None]:
-        if (li := f"{self}library") not in self._cache:
-            self._cache[li] = self._process_library()
-        return self._cache[li]
+    @lazy_property
+    def library_items(self) -> Union[LazySequence[TechportLibraryItem], TechportLibraryItem, None]:
+        return self._process_library()
 
     @property
     def closeout_documents(self) -> Union[List[str], None]:
@@ -401,45 +394,37 @@ class TechportResource(BaseResource):
     def closeout_docs(self) -> Union[List[str], None]:
         return self.closeout_docs
 
-    def _process_orgs(self) -> Union[Generator[TechportOrganisation, None, None], TechportOrganisation, None]:
+    def _process_orgs(self) -> Union[LazySequence[TechportOrganisation], TechportOrganisation, None]:
         if not (org := self._data.get("supportingOrganizations")):
             return None
         elif len(org) != 1:
-            for data in org:
-                yield TechportOrganisation(data)
+            return LazySequence(org, TechportOrganisation)
         else:
             return TechportOrganisation(org[0])
 
-    @property
-    def supporting_organisations(self) -> Union[Generator[TechportOrganisation, None, None], TechportOrganisation, None]:
-        if not (org := f"{self}organisation") in self._cache:
-            self._cache[org] = self._process_orgs()
-        return self._cache[org]
+    @lazy_property
+    def supporting_organisations(self) -> Union[LazySequence[TechportOrganisation], TechportOrganisation, None]:
+        return self._process_orgs()
 
     @property
-    def supporting_organizations(self) -> Union[Generator[TechportOrganisation, None, None], TechportOrganisation, None]:
+    def supporting_organizations(self) -> Union[LazySequence[TechportOrganisation], TechportOrganisation, None]:
         return self.supporting_organisations
 
-    def _process_tas(self, ta_type: str) -> Union[Generator[TechportTechnologyArea, None, None], TechportTechnologyArea, None]:
+    def _process_tas(self, ta_type: str) -> Union[LazySequence[TechportTechnologyArea], TechportTechnologyArea, None]:
         if not (ta := self._data.get(ta_type)):
             return None
         elif len(ta) != 1:
-            for data in ta:
-                yield TechportTechnologyArea(data)
+            return LazySequence(ta, TechportTechnologyArea)
         else:
             return TechportTechnologyArea(ta[0])
 
-    @property
-    def primary_tas(self) -> Union[Generator[TechportTechnologyArea, None, None], TechportTechnologyArea, None]:
-        if (ta := f"{self}primarytas") not in self._cache:
-            self._cache[ta] = self._process_tas("primaryTas")
-        return self._cache[ta]
+    @lazy_property
+    def primary_tas(self) -> Union[LazySequence[TechportTechnologyArea], TechportTechnologyArea, None]:
+        return self._process_tas("primaryTas")
 
-    @property
-    def additional_tas(self) -> Union[Generator[TechportTechnologyArea, None, None], TechportTechnologyArea, None]:
-        if (ta := f"{self}additionaltas") not in self._cache:
-            self._cache[ta] = self._process_tas("additionalTas")
-        return self._cache[ta]
+    @lazy_property
+    def additional_tas(self) -> Union[LazySequence[TechportTechnologyArea], TechportTechnologyArea, None]:
+        return self._process_tas("additionalTas")
 
     @property
     def to_dict(self) -> dict:
@@ -1,8 +1,18 @@
+from __future__ import annotations
+
 import re
 from asyncio.events import AbstractEventLoop
-from typing import Any, Generator, List, Union
+from typing import Any, List, Union
+
+from ..decorators import lazy_property
+from .base import BaseResource, LazySequence
+from .tables import ArrowExport, from_matrix
 
-from .base import BaseResource
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pass
 
 _TAG_RX = re.compile(r"<.*?>|&([a-z0-9]+|#[0-9]{1,6}|#x[0-9a-f]{1,6});")
 _agency = {
@@ -28,7 +38,7 @@ __all__ = [
 def _extract(data: List[str], index: int, default: Any = None) -> Union[Any, None]:
     try:
         return data[index]
-    except KeyError:
+    except IndexError:
         return default
 
 
@@ -43,6 +53,7 @@ class TechTransferPatent(object):
         '_image_url',
         '_relevance',
         '_data',
+        '_lazy',
     ]
     _ATTRS = [
         'id',
@@ -54,7 +65,11 @@ class TechTransferPatent(object):
         'image_url',
         'relevance',
     ]
-    _cache = {}
+    # The position of each attribute in a result row
+    _COLUMNS = [
+        'id', 'reference_number', 'title', 'description', None, 'category',
+        None, None, None, 'agency', 'image_url', None, 'relevance',
+    ]
 
     def __init__(self, data: List[str]) -> None:
         self._id = _extract(data, 0)
@@ -99,11 +114,9 @@ class TechTransferPatent(object):
     def relevance(self) -> Union[float, None]:
         return self._relevance
 
-    @property
+    @lazy_property
     def to_dict(self) -> dict:
-        if self not in self._cache:
-            self._cache[self] = {attr: getattr(self, attr) for attr in self._ATTRS}
-        return self._cache[self]
+        return {attr: getattr(self, attr) for attr in self._ATTRS}
 
     @classmethod
     def from_dict(cls, data: dict) -> "TechTransferPatent":
@@ -142,6 +155,7 @@ class TechTransferSoftware(object):
         '_agency',
         '_relevance',
         '_data',
+        '_lazy',
     ]
     _ATTRS = [
         'id',
@@ -155,7 +169,11 @@ class TechTransferSoftware(object):
         'agency',
         'relevance',
     ]
-    _cache = {}
+    # The position of each attribute in a result row
+    _COLUMNS = [
+        'id', 'reference_number', 'title', 'description', None, 'category',
+        'release_type', 'note', 'source_code', 'agency', None, None, 'relevance',
+    ]
 
     def __init__(self, data: List[str]) -> None:
         self._id = _extract(data, 0)
@@ -210,11 +228,9 @@ class TechTransferSoftware(object):
     def relevance(self) -> Union[float, None]:
         return self._relevance
 
-    @property
+    @lazy_property
     def to_dict(self) -> dict:
-        if self not in self._cache:
-            self._cache[self] = {attr: getattr(self, f"_{attr}") for attr in self._ATTRS}
-        return self._cache[self]
+        return {attr: getattr(self, f"_{attr}") for attr in self._ATTRS}
 
     @classmethod
     def from_dict(cls, data: dict) -> "TechTransferSoftware":
@@ -245,6 +261,7 @@ class TechTransferSpinoff(object):
         '_agency',
         '_relevance',
         '_data',
+        '_lazy',
     ]
     _ATTRS = [
         'id',
@@ -255,7 +272,11 @@ class TechTransferSpinoff(object):
         'agency',
         'relevance',
     ]
-    _cache = {}
+    # The position of each attribute in a result row
+    _COLUMNS = [
+        'id', 'reference_number', 'title', 'description', None, 'category',
+        None, None, None, 'agency', None, None, 'relevance',
+    ]
 
     def __init__(self, data: List[str]) -> None:
         self._id = _extract(data, 0)
@@ -295,11 +316,9 @@ class TechTransferSpinoff(object):
     def relevance(self) -> Union[float, None]:
         return self._relevance
 
-    @property
+    @lazy_property
     def to_dict(self) -> dict:
-        if self not in self._cache:
-            self._cache[self] = {attr: getattr(self, attr) for attr in self._ATTRS}
-        return self._cache[self]
+        return {attr: getattr(self, attr) for attr in self._ATTRS}
 
     @classmethod
     def from_dict(cls, data: dict) -> "TechTransferSpinoff":
@@ -320,7 +339,7 @@ class TechTransferSpinoff(object):
         ])
 
 
-class TechTransferResource(BaseResource):
+class TechTransferResource(BaseResource, ArrowExport):
     __slots__ = [
         '_type',
         '_count',
@@ -335,7 +354,6 @@ class TechTransferResource(BaseResource):
         'software': TechTransferSoftware,
         'spinoff': TechTransferSpinoff,
     }
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -349,20 +367,33 @@ class TechTransferResource(BaseResource):
     def __len__(self) -> int:
         return self._count
 
-    def _process_results(self) -> Union[Generator[Any, None, None], Any, None]:
+    def _process_results(self) -> Union[LazySequence[Any], Any, None]:
         if not (rs := self._data.get("results")):
             return None
         elif len(rs) != 1:
-            for data in rs:
-                yield self._mapping.get(self._type)(data)
+            return LazySequence(rs, self._mapping.get(self._type))
         else:
             return self._mapping.get(self._type)(rs[0])
 
-    @property
-    def results(self) -> Union[Generator[Any, None, None], Any, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_results()
-        return self._cache[self]
+    @lazy_property
+    def results(self) -> Union[LazySequence[Any], Any, None]:
+        return self._process_results()
+
+    def _arrow_table(self) -> "pa.Table":
+        table = from_matrix(self._mapping.get(self._type)._COLUMNS,
+                            self._data.get("results") or [],
+                            types={"relevance": float})
+        for index, name in enumerate(table.column_names):
+            column = table.column(index)
+            if name in ["title", "description", "note", "source_code"]:
+                column = pc.replace_substring_regex(column, _TAG_RX.pattern, "")
+            if name in ["note", "source_code", "image_url"]:
+                column = pc.replace_substring(column, "\\", "")
+            if name == "agency":
+                column = pc.take(pa.array(list(_agency.values())),
+                                 pc.index_in(column, pa.array(list(_agency))))
+            table = table.set_column(index, name, column)
+        return table
 
     @property
     def count(self) -> int:
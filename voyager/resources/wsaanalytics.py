@@ -0,0 +1,286 @@
+from typing import Any, Dict, Iterable, List, Tuple
+
+from ..dates import parse_datetimes
+from ..decorators import check_numpy_importable
+from ..exceptions import VoyagerException
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+
+__all__ = [
+    'WSAAnalytics',
+]
+
+
+_SIMULATION_FLOATS = {
+    'au': "au",
+    'estimated_duration': "estimatedDuration",
+    'rmin_re': "rmin_re",
+    'kp_18': "kp_18",
+    'kp_90': "kp_90",
+    'kp_135': "kp_135",
+    'kp_180': "kp_180",
+}
+_SIMULATION_TIMES = {
+    'model_completion_time': "modelCompletionTime",
+    'estimated_shock_arrival_time': "estimatedShockArrivalTime",
+}
+_INPUT_FLOATS = {
+    'latitude': "latitude",
+    'longitude': "longitude",
+    'speed': "speed",
+    'half_angle': "halfAngle",
+    'level_of_data': "levelOfData",
+}
+_INPUT_TIMES = {
+    'start_time': "cmeStartTime",
+    'time21_5': "time21_5",
+}
+_AGGREGATES = [
+    'count',
+    'sum',
+    'mean',
+    'std',
+    'min',
+    'max',
+    'spread',
+]
+
+
+def _floats(values: List[Any]) -> "np.ndarray":
+    column = np.full(len(values), np.nan)
+    for index, value in enumerate(values):
+        try:
+            column[index] = float(value)
+        except (TypeError, ValueError):
+            pass
+    return column
+
+
+def _strings(values: List[Any]) -> "np.ndarray":
+    return np.array(values, dtype=object)
+
+
+def _grouped(inverse: "np.ndarray", size: int, values: "np.ndarray",
+             function: str) -> "np.ndarray":
+    # Datetimes are reduced as floats in their own unit and converted back
+    is_time = values.dtype.kind == "M"
+    if is_time:
+        unit = np.datetime_data(values.dtype)[0]
+        valid = ~np.isnat(values)
+        values = values.astype(np.int64).astype(np.float64)
+    elif values.dtype.kind in "fiub":
+        values = values.astype(np.float64)
+        valid = ~np.isnan(values)
+    else:
+        valid = np.not_equal(values, None)
+        values = np.zeros(len(values))
+        if function != "count":
+            raise VoyagerException(f"{function} needs a numeric or datetime column")
+    inverse, values = inverse[valid], values[valid]
+    count = np.bincount(inverse, minlength=size)
+    if function == "count":
+        return count
+    with np.errstate(invalid="ignore", divide="ignore"):
+        total = np.bincount(inverse, weights=values, minlength=size)
+        if function == "sum":
+            result = total
+        elif function in ["mean", "std"]:
+            mean = total / count
+            if function == "std":
+                # Deviations from the group mean rather than E[x²] - E[x]²,
+                # which cancels catastrophically for large epoch values
+                squares = np.bincount(inverse, weights=(values - mean[inverse]) ** 2,
+                                      minlength=size)
+                result = np.sqrt(squares / count)
+            else:
+                result = mean
+        else:
+            low, high = np.full(size, np.inf), np.full(size, -np.inf)
+            np.minimum.at(low, inverse, values)
+            np.maximum.at(high, inverse, values)
+            result = {'min': low, 'max': high, 'spread': high - low}[function]
+            result[count == 0] = np.nan
+    if is_time and function in ["min", "max", "mean"]:
+        return np.where(np.isnan(result), np.iinfo(np.int64).min,
+                        np.round(result)).astype(np.int64).astype(f"datetime64[{unit}]")
+    elif is_time and function in ["std", "spread"]:
+        return np.where(np.isnan(result), np.iinfo(np.int64).min,
+                        np.round(result)).astype(np.int64).astype(f"timedelta64[{unit}]")
+    return result
+
+
+class WSAAnalytics(object):
+    """Columnar view of a batch of WSA-Enlil simulations, built straight
+    from their payloads without creating the nested ``WSAEnlil`` and
+    ``WSAImpact`` objects. It holds three tables of NumPy arrays:
+
+    * ``simulations``, one row per simulation, with the model completion
+      and estimated shock arrival times as datetime64 and the Kp bands,
+      ``au``, ``rmin_re`` and ``estimated_duration`` as float64
+    * ``cme_inputs``, one row per CME modelled by a simulation, with its
+      speed, half angle and position as float64 and its start time and
+      ``time21_5`` as datetime64
+    * ``impacts``, one row per predicted impact, with its arrival time
+
+    The ``simulation`` column of the last two holds the row of the
+    simulation each row belongs to. Missing values are NaN or NaT
+
+    :param simulations: the simulations, as resources or raw dicts
+    :type simulations: Iterable[Union[WSAResource, dict]]
+    """
+    __slots__ = [
+        '_simulations',
+        '_inputs',
+        '_impacts',
+    ]
+
+    @check_numpy_importable
+    def __init__(self, simulations: Iterable[Any]) -> None:
+        raw = [getattr(sim, "to_dict", sim) for sim in simulations]
+        inputs = [(row, cme) for row, sim in enumerate(raw)
+                  for cme in sim.get("cmeInputs") or []]
+        impacts = [(row, impact) for row, sim in enumerate(raw)
+                   for impact in sim.get("impactList") or []]
+
+        self._simulations = {
+            'simulation_id': _strings([sim.get("simulationID") for sim in raw]),
+            'is_earth_gb': np.array([bool(sim.get("isEarthGB")) for sim in raw], dtype=bool),
+        }
+        for name, key in _SIMULATION_FLOATS.items():
+            self._simulations[name] = _floats([sim.get(key) for sim in raw])
+        for name, key in _SIMULATION_TIMES.items():
+            self._simulations[name] = parse_datetimes(
+                [sim.get(key) for sim in raw], unit="m"
+            )
+
+        self._inputs = {
+            'simulation': np.array([row for row, _ in inputs], dtype=np.int64),
+            'cme_id': _strings([cme.get("cmeid") for _, cme in inputs]),
+            'is_most_accurate': np.array(
+                [bool(cme.get("isMostAccurate")) for _, cme in inputs], dtype=bool
+            ),
+        }
+        for name, key in _INPUT_FLOATS.items():
+            self._inputs[name] = _floats([cme.get(key) for _, cme in inputs])
+        for name, key in _INPUT_TIMES.items():
+            self._inputs[name] = parse_datetimes(
+                [cme.get(key) for _, cme in inputs], unit="m"
+            )
+
+        self._impacts = {
+            'simulation': np.array([row for row, _ in impacts], dtype=np.int64),
+            'location': _strings([impact.get("location") for _, impact in impacts]),
+            'is_glancing_blow': np.array(
+                [bool(impact.get("isGlancingBlow")) for _, impact in impacts], dtype=bool
+            ),
+            'arrival_time': parse_datetimes(
+                [impact.get("arrivalTime") for _, impact in impacts], unit="m"
+            ),
+        }
+
+    def __len__(self) -> int:
+        return len(self._simulations["simulation_id"])
+
+    def __repr__(self) -> str:
+        return (f"<WSAAnalytics simulations={len(self)} "
+                f"cme_inputs={len(self._inputs['cme_id'])}>")
+
+    @property
+    def simulations(self) -> Dict[str, "np.ndarray"]:
+        return self._simulations
+
+    @property
+    def cme_inputs(self) -> Dict[str, "np.ndarray"]:
+        return self._inputs
+
+    @property
+    def impacts(self) -> Dict[str, "np.ndarray"]:
+        return self._impacts
+
+    def _by_cme(self, name: str) -> "np.ndarray":
+        # A column aligned with the CME input rows, joining the simulation
+        # columns through the simulation row of each input
+        if name in self._inputs:
+            return self._inputs[name]
+        elif name in self._simulations:
+            return self._simulations[name][self._inputs["simulation"]]
+        raise VoyagerException(f"{name} is not a column of the simulations or CME inputs")
+
+    def _cme_groups(self) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        ids = self._inputs["cme_id"]
+        rows = np.flatnonzero(np.not_equal(ids, None))
+        groups, inverse = np.unique(ids[rows].astype(str), return_inverse=True)
+        return rows, groups, inverse
+
+    def aggregate_by_cme(self, **aggregates: Tuple[str, str]) -> Dict[str, "np.ndarray"]:
+        """Computes aggregates per CME ID over every simulation that
+        modelled the CME, ignoring missing values. Each keyword names a
+        result and maps to a ``(column, function)`` pair. The column is a
+        column of the simulations or CME inputs and the function is one of
+        "count", "sum", "mean", "std", "min", "max" or "spread" (max minus
+        min). Datetime columns give datetime64 minima, maxima and means and
+        timedelta64 spreads and deviations::
+
+            analytics.aggregate_by_cme(
+                runs=("simulation_id", "count"),
+                spread=("estimated_shock_arrival_time", "spread"),
+                kp=("kp_90", "max"),
+            )
+
+        :raises VoyagerException: a column or function is not supported
+        :return: the ``cme_id`` of each group and one array per aggregate
+        :rtype: Dict[str, np.ndarray]
+        """
+        for name, function in aggregates.values():
+            if function not in _AGGREGATES:
+                raise VoyagerException(f"{function} is not a supported aggregate")
+        rows, groups, inverse = self._cme_groups()
+        result = {'cme_id': groups.astype(object)}
+        for alias, (name, function) in aggregates.items():
+            result[alias] = _grouped(inverse, len(groups), self._by_cme(name)[rows], function)
+        return result
+
+    def latest_per_cme(self) -> Dict[str, "np.ndarray"]:
+        """Returns the most recently completed simulation of each CME
+
+        :return: the ``cme_id`` of each CME with the ``simulation_id``,
+            ``model_completion_time``, ``estimated_shock_arrival_time`` and
+            row of its latest simulation
+        :rtype: Dict[str, np.ndarray]
+        """
+        rows, groups, inverse = self._cme_groups()
+        completed = self._by_cme("model_completion_time")[rows].astype(np.int64)
+        # Sorted by CME then completion time, NaT first, so the last row of
+        # each group is its latest simulation
+        order = np.lexsort([completed, inverse])
+        ends = np.searchsorted(inverse[order], np.arange(len(groups)), side="right") - 1
+        last = order[ends]
+        simulation = self._inputs["simulation"][rows[last]]
+        return {
+            'cme_id': groups.astype(object),
+            'simulation': simulation,
+            'simulation_id': self._simulations["simulation_id"][simulation],
+            'model_completion_time': self._simulations["model_completion_time"][simulation],
+            'estimated_shock_arrival_time':
+                self._simulations["estimated_shock_arrival_time"][simulation],
+        }
+
+    def arrival_spread(self) -> Dict[str, "np.ndarray"]:
+        """Returns how much the estimated shock arrival time of each CME
+        varies across the simulations that modelled it
+
+        :return: the ``cme_id``, the number of ``simulations`` with an
+            estimate, the ``earliest`` and ``latest`` estimates and their
+            ``spread`` as timedelta64
+        :rtype: Dict[str, np.ndarray]
+        """
+        return self.aggregate_by_cme(
+            simulations=("estimated_shock_arrival_time", "count"),
+            earliest=("estimated_shock_arrival_time", "min"),
+            latest=("estimated_shock_arrival_time", "max"),
+            spread=("estimated_shock_arrival_time", "spread"),
+        )
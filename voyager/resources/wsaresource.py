@@ -1,6 +1,7 @@
 from asyncio.events import AbstractEventLoop
 from typing import List, Union
 
+from ..decorators import lazy_property
 from .base import BaseResource
 
 
@@ -46,8 +47,8 @@ class WSAIPList(object):
         '_event_time',
         '_link',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._catalog = data.get("catalog")
@@ -89,11 +90,9 @@ class WSAIPList(object):
         else:
             return WSAInstrument(instrs[0])
 
-    @property
+    @lazy_property
     def instruments(self) -> Union[List[WSAInstrument], WSAInstrument, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_instruments()
-        return self._cache[self]
+        return self._process_instruments()
 
     @property
     def to_dict(self) -> dict:
@@ -116,8 +115,8 @@ class WSAEnlil(object):
         '_level_of_data',
         '_cme_id',
         '_data',
+        '_lazy',
     ]
-    _cache = {}
 
     def __init__(self, data: dict) -> None:
         self._start_time = data.get("cmeStartTime")
@@ -171,11 +170,9 @@ class WSAEnlil(object):
         else:
             return WSAIPList(ips[0])
 
-    @property
+    @lazy_property
     def ips_list(self) -> Union[List[WSAIPList], WSAIPList, None]:
-        if self not in self._cache:
-            self._cache[self] = self._process_ips_list()
-        return self._cache[self]
+        return self._process_ips_list()
 
     @property
     def cme_id(self) -> str:
@@ -249,7 +246,6 @@ class WSAResource(BaseResource):
         '_link',
         '_data',
     ]
-    _cache = {}
 
     def __init__(self, data: dict,
                  loop: AbstractEventLoop = None) -> None:
@@ -292,11 +288,9 @@ class WSAResource(BaseResource):
         else:
             return WSAEnlil(cme[0])
 
-    @property
+    @lazy_property
     def cme_inputs(self) -> Union[List[WSAEnlil], WSAEnlil, None]:
-        if (cme := f"{self}inputs") not in self._cache:
-            self._cache[cme] = self._process_cme_inputs()
-        return self._cache[cme]
+        return self._process_cme_inputs()
 
     @property
     def estimated_shock_arrival_time(self) -> str:  # TODO: Implement datetime.datetime
@@ -327,9 +321,13 @@ class WSAResource(BaseResource):
         return self._kp_90
 
     @property
-    def kp_139(self) -> str:
+    def kp_135(self) -> str:
         return self._kp_135
 
+    @property
+    def kp_139(self) -> str:
+        return self.kp_135
+
     @property
     def kp_180(self) -> str:
         return self._kp_180
@@ -350,11 +348,9 @@ class WSAResource(BaseResource):
         else:
             return WSAImpact(il[0])
 
-    @property
+    @lazy_property
     def impact_list(self) -> Union[List[WSAImpact], WSAImpact, None]:
-        if (il := f"{self}impact") not in self._cache:
-            self._cache[il] = self._process_impact_list()
-        return self._cache[il]
+        return self._process_impact_list()
 
     @property
     def link(self) -> str:
@@ -0,0 +1,158 @@
+import asyncio
+import datetime
+import email.utils
+import random
+from typing import Tuple, Union
+
+import aiohttp
+
+__all__ = [
+    'RetryPolicy',
+]
+
+
+class RetryPolicy(object):
+    """Decides whether and when a failed request is retried
+
+    Delays use full jitter exponential backoff, a random delay between 0 and
+    ``min(cap, base * 2 ** attempt)``, so that many workers on one host do not
+    retry in lockstep. A ``Retry-After`` header sent by the server takes
+    precedence over the computed delay. Retries are also bounded by a total
+    deadline per request and by a retry budget shared by every request made
+    through the policy: each request deposits ``budget_ratio`` tokens and each
+    retry withdraws one, so a failing upstream can't multiply the load.
+
+    :param max_attempts: the maximum number of attempts per request, defaults to 5
+    :type max_attempts: int, optional
+    :param statuses: the response codes that are retried, defaults to 429 and 5xx gateway errors
+    :type statuses: Tuple[int], optional
+    :param exceptions: the exception classes that are retried, defaults to connection errors and timeouts
+    :type exceptions: Tuple[type], optional
+    :param errnos: the OSError errno values that are retried, defaults to connection resets
+    :type errnos: Tuple[int], optional
+    :param base: the base delay in seconds, defaults to 0.5
+    :type base: float, optional
+    :param cap: the maximum delay in seconds, defaults to 30.0
+    :type cap: float, optional
+    :param deadline: the total time in seconds a request may take including retries, None for no limit, defaults to 120.0
+    :type deadline: float, optional
+    :param budget_ratio: the fraction of requests that may be retried, defaults to 0.2
+    :type budget_ratio: float, optional
+    :param budget_min: the number of retries allowed before any budget has been earned, defaults to 10
+    :type budget_min: int, optional
+    :param budget_max: the maximum number of retries that can be banked, defaults to 100
+    :type budget_max: int, optional
+    """
+    __slots__ = [
+        '_max_attempts',
+        '_statuses',
+        '_exceptions',
+        '_errnos',
+        '_base',
+        '_cap',
+        '_deadline',
+        '_budget_ratio',
+        '_budget_max',
+        '_budget',
+    ]
+
+    def __init__(self,
+                 max_attempts: int = 5,
+                 statuses: Tuple[int] = (429, 500, 502, 503, 504),
+                 exceptions: Tuple[type] = (aiohttp.ClientConnectionError,
+                                            aiohttp.ClientPayloadError,
+                                            asyncio.TimeoutError),
+                 errnos: Tuple[int] = (54, 104, 10054),
+                 base: float = 0.5,
+                 cap: float = 30.0,
+                 deadline: float = 120.0,
+                 budget_ratio: float = 0.2,
+                 budget_min: int = 10,
+                 budget_max: int = 100) -> None:
+        self._max_attempts = max_attempts
+        self._statuses = frozenset(statuses)
+        self._exceptions = tuple(exceptions)
+        self._errnos = frozenset(errnos)
+        self._base = base
+        self._cap = cap
+        self._deadline = deadline
+        self._budget_ratio = budget_ratio
+        self._budget_max = float(budget_max)
+        self._budget = float(budget_min)
+
+    @property
+    def max_attempts(self) -> int:
+        return self._max_attempts
+
+    @property
+    def deadline(self) -> Union[float, None]:
+        return self._deadline
+
+    @property
+    def budget(self) -> float:
+        return self._budget
+
+    def retries_status(self, status: int) -> bool:
+        return status in self._statuses
+
+    def retries_exception(self, exc: BaseException) -> bool:
+        if isinstance(exc, self._exceptions):
+            return True
+        return isinstance(exc, OSError) and exc.errno in self._errnos
+
+    @staticmethod
+    def parse_retry_after(value: Union[str, None]) -> Union[float, None]:
+        """Parses a Retry-After header given either in seconds or as an
+        HTTP date
+
+        :param value: the value of the header
+        :type value: Union[str, None]
+        :return: the number of seconds to wait, or None if it can't be parsed
+        :rtype: Union[float, None]
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=datetime.timezone.utc)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return max(0.0, (when - now).total_seconds())
+
+    def record_request(self) -> None:
+        """Earns retry budget for a new request"""
+        self._budget = min(self._budget_max, self._budget + self._budget_ratio)
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self._cap, self._base * 2 ** attempt))
+
+    def next_delay(self, attempt: int, elapsed: float,
+                   retry_after: str = None) -> Union[float, None]:
+        """Returns how long to wait before the next attempt, or None if the
+        request should not be retried
+
+        :param attempt: the number of attempts made so far
+        :type attempt: int
+        :param elapsed: the number of seconds spent on the request so far
+        :type elapsed: float
+        :param retry_after: the Retry-After header of the failed response, defaults to None
+        :type retry_after: str, optional
+        :rtype: Union[float, None]
+        """
+        if attempt >= self._max_attempts:
+            return None
+        delay = self.parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.backoff(attempt)
+        if self._deadline is not None and elapsed + delay > self._deadline:
+            return None
+        if self._budget < 1:
+            return None
+        self._budget -= 1
+        return delay
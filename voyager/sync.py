@@ -0,0 +1,134 @@
+import datetime
+import hashlib
+import json
+import os
+import tempfile
+from typing import Iterable, List, Union
+
+from .dates import parse_datetime
+from .exceptions import VoyagerException
+from .resources import BaseResource
+from .resources.donkigraph import EVENT_KEYS
+
+__all__ = [
+    'DonkiSync',
+]
+
+
+# Keys added to every payload by the client rather than by the API
+_META_KEYS = [
+    'query_url',
+    'code',
+]
+
+
+def _digest(data: dict) -> str:
+    content = {key: value for key, value in data.items() if key not in _META_KEYS}
+    return hashlib.blake2b(
+        json.dumps(content, sort_keys=True, separators=(",", ":")).encode(),
+        digest_size=16,
+    ).hexdigest()
+
+
+class DonkiSync(object):
+    """Sync state for incremental polling of the DONKI routes, stored in a
+    local JSON file. For each route it keeps a high-water mark, the latest
+    event time seen, and a content hash of every event inside the overlap
+    window, so that a poll only asks for the window since the mark and only
+    reports the events that are new or that changed since they were seen
+
+    :param path: the path of the state file, defaults to "voyager.sync.json"
+    :type path: str, optional
+    :param overlap: how far before the mark each poll starts, so that late
+        submissions and revisions are picked up, defaults to 3 days
+    :type overlap: datetime.timedelta, optional
+    """
+    __slots__ = [
+        '_path',
+        '_overlap',
+        '_state',
+    ]
+
+    def __init__(self, path: str = "voyager.sync.json",
+                 overlap: datetime.timedelta = datetime.timedelta(days=3)) -> None:
+        self._path = path
+        self._overlap = overlap
+        try:
+            with open(path) as fp:
+                self._state = json.load(fp)
+        except FileNotFoundError:
+            self._state = {}
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def mark(self, route: str) -> Union[datetime.datetime, None]:
+        """Returns the high-water mark of a route, or None if it was never synced"""
+        return parse_datetime(self._state.get(route, {}).get("mark"))
+
+    def window(self, route: str) -> Union[datetime.date, None]:
+        """Returns the first date the next poll of a route should request,
+        or None if the route was never synced and the default window of
+        the API should be used
+        """
+        if (mark := self.mark(route)) is None:
+            return None
+        return (mark - self._overlap).date()
+
+    def update(self, route: str,
+               resources: Iterable[BaseResource]) -> List[BaseResource]:
+        """Records the events returned by a poll and returns those that are
+        new or whose content changed since the last poll. Call :meth:`save`
+        once the changes have been handled to persist the new state
+
+        :param route: the name of the route, such as "cme" or "gst"
+        :type route: str
+        :param resources: the resources returned by the poll
+        :type resources: Iterable[BaseResource]
+        :raises VoyagerException: the route is not a DONKI event route
+        :rtype: List[BaseResource]
+        """
+        if route not in EVENT_KEYS:
+            raise VoyagerException(f"{route} is not a DONKI event route")
+        key, time_key = EVENT_KEYS[route]
+        state = self._state.setdefault(route, {"mark": None, "events": {}})
+        events, mark = state["events"], self.mark(route)
+        changed = []
+        for resource in resources:
+            data = resource.to_dict
+            if not (activity_id := data.get(key)):
+                continue
+            digest, time = _digest(data), data.get(time_key)
+            if (seen := events.get(activity_id)) is None or seen[1] != digest:
+                changed.append(resource)
+            events[activity_id] = [time, digest]
+            if (when := parse_datetime(time)) is not None and (mark is None or when > mark):
+                mark = when
+        if mark is not None:
+            state["mark"] = mark.isoformat()
+            start = self.window(route)
+            state["events"] = {
+                activity_id: seen for activity_id, seen in events.items()
+                if (when := parse_datetime(seen[0])) is None or when.date() >= start
+            }
+        return changed
+
+    def reset(self, route: str = None) -> None:
+        """Forgets the state of one route, or of every route"""
+        if route is None:
+            self._state.clear()
+        else:
+            self._state.pop(route, None)
+
+    def save(self) -> None:
+        """Writes the state file, replacing the old one atomically"""
+        directory = os.path.dirname(os.path.abspath(self._path))
+        fd, temp = tempfile.mkstemp(dir=directory, suffix=".part")
+        try:
+            with os.fdopen(fd, "w") as fp:
+                json.dump(self._state, fp, separators=(",", ":"))
+            os.replace(temp, self._path)
+        except BaseException:
+            os.unlink(temp)
+            raise
@@ -8,10 +8,14 @@ VALID_KEYS = {
         'end_date',
         'thumbs',
     ],
-    'neo': [
+    'neo-feed': [
         'start_date',
         'end_date',
-        'asteroid_id',
+    ],
+    'neo-lookup': [],
+    'neo-browse': [
+        'page',
+        'size',
     ],
     'cme': [
         'startDate',
@@ -61,11 +65,20 @@ VALID_KEYS = {
         'startDate',
         'endDate',
     ],
+    'notifications': [
+        'startDate',
+        'endDate',
+        'type',
+    ],
+    'epic': [],
+    'epic-date': [],
 }
 
 ROUTES = {
     'apod': '/planetary/apod',
-    'neo': '/neo/rest/v1',
+    'neo-feed': '/neo/rest/v1/feed',
+    'neo-lookup': '/neo/rest/v1/neo/{asteroid_id}',
+    'neo-browse': '/neo/rest/v1/neo/browse',
     'cme': '/DONKI/CME',
     'cme-a': '/DONKI/CMEAnalysis',
     'gst': '/DONKI/GST',
@@ -75,7 +88,10 @@ ROUTES = {
     'mpc': '/DONKI/MPC',
     'rbe': '/DONKI/RBE',
     'hss': '/DONKI/HSS',
-    'wsa-enlil': '/DONKI/WASEnlilSimulations',
+    'wsa-enlil': '/DONKI/WSAEnlilSimulations',
+    'notifications': '/DONKI/notifications',
+    'epic': '/EPIC/api/{collection}',
+    'epic-date': '/EPIC/api/{collection}/date/{date}',
 }
 
 
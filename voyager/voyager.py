@@ -1,17 +1,66 @@
 import asyncio
+import collections
 import datetime
 import re
-from typing import List, Union
+from typing import (Any, AsyncIterator, Callable, Dict, Iterable, List,
+                    Tuple, Union)
 
 import aiohttp
 
-from .exceptions import VoyagerException
+from .cache import BaseCache, FileStore
+from .exceptions import HTTPException, RateLimitException, VoyagerException
 from .http import HTTPClient
-from .resources import (APODResource, CMEAnalysisResource, CMEResource,
-                        GSTResource, NEOResource)
-from .utils import BASE_URL
+from .resources import (APODResource, CMEAnalysisIndex, CMEAnalysisResource,
+                        CMEResource, DonkiGraph, EPICResource, FLRResource,
+                        GSTResource, HSSResource, IPSResource, MPCResource,
+                        NEOResource, NotificationResource, RBEResource,
+                        SEPResource, WSAResource)
+from .resources.donkigraph import EVENT_KEYS
+from .resources.epicresource import FORMATS, MODES
+from .resources.neoresource import NEOObject
+from .retry import RetryPolicy
+from .sync import DonkiSync
 
 _DATE_RX = re.compile(r'[1|2][0|9][0-9]{2}')
+_NEO_FEED_DAYS = 7
+_NOTIFICATION_TYPES = [
+    'all',
+    'FLR',
+    'SEP',
+    'CME',
+    'IPS',
+    'MPC',
+    'GST',
+    'RBE',
+    'report',
+]
+
+
+def _to_date(date: Union[datetime.datetime, datetime.date, str]) -> datetime.date:
+    if isinstance(date, datetime.datetime):
+        return date.date()
+    elif isinstance(date, datetime.date):
+        return date
+    return datetime.date.fromisoformat(date[:10])
+
+
+def _checked(resource: Any) -> Any:
+    # Single resource routes build a resource from an error response
+    # instead of raising, which would silently drop a page or window
+    if resource.code != 200:
+        raise HTTPException(resource.code)
+    return resource
+
+
+async def _gather_or_cancel(tasks: List[asyncio.Task]) -> List[Any]:
+    # When a task fails the others are cancelled and awaited, so none of
+    # them is still running, or spending rate limit, once the error is raised
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
 
 class Client(object):
@@ -24,7 +73,52 @@ class Client(object):
     def __init__(self,
                  session: aiohttp.ClientSession = None,
                  api_key: str = "DEMO_KEY",
+                 cache: BaseCache = None,
+                 cache_size: int = 128,
+                 retry_policy: RetryPolicy = None,
+                 max_concurrency: int = 64,
+                 json_loads: Callable[[bytes], Any] = None,
+                 connections: int = 100,
+                 connections_per_host: int = 10,
+                 dns_ttl: int = 300,
+                 keepalive_timeout: float = 30.0,
+                 timeout: float = 60.0,
+                 connect_timeout: float = 10.0,
                  loop: asyncio.AbstractEventLoop = None) -> None:
+        """Client for the NASA Open APIs
+
+        :param session: the session to make requests with, defaults to a session
+            owned by the client, configured with the connection options below
+        :type session: aiohttp.ClientSession, optional
+        :param api_key: the api.nasa.gov API key, defaults to "DEMO_KEY"
+        :type api_key: str, optional
+        :param cache: the response cache backend, defaults to a MemoryCache of cache_size entries
+        :type cache: BaseCache, optional
+        :param cache_size: the size of the default response cache, 0 disables caching, defaults to 128
+        :type cache_size: int, optional
+        :param retry_policy: decides which failed requests are retried and when, defaults to RetryPolicy()
+        :type retry_policy: RetryPolicy, optional
+        :param max_concurrency: the most requests sent to one host at once, the actual limit
+            adapts to the host's latency and error rate below this, defaults to 64
+        :type max_concurrency: int, optional
+        :param json_loads: decodes a response body from bytes, defaults to orjson.loads when
+            orjson is installed and json.loads otherwise
+        :type json_loads: Callable[[bytes], Any], optional
+        :param connections: the total number of simultaneous connections, defaults to 100
+        :type connections: int, optional
+        :param connections_per_host: the number of simultaneous connections to one host, defaults to 10
+        :type connections_per_host: int, optional
+        :param dns_ttl: the number of seconds DNS lookups are cached for, defaults to 300
+        :type dns_ttl: int, optional
+        :param keepalive_timeout: the number of seconds idle connections are kept open, defaults to 30.0
+        :type keepalive_timeout: float, optional
+        :param timeout: the total timeout of a request in seconds, defaults to 60.0
+        :type timeout: float, optional
+        :param connect_timeout: the timeout for acquiring a connection in seconds, defaults to 10.0
+        :type connect_timeout: float, optional
+        :param loop: the event loop to use, defaults to the running loop
+        :type loop: asyncio.AbstractEventLoop, optional
+        """
         self._key = api_key
         try:
             self._loop = loop or asyncio.get_running_loop()
@@ -32,13 +126,37 @@ class Client(object):
             self._loop = asyncio.get_event_loop()
         self._http_client = HTTPClient(session=session,
                                        api_key=self._key,
-                                       cache_size=self._cache_size,
+                                       cache=cache,
+                                       cache_size=cache_size,
+                                       retry_policy=retry_policy,
+                                       max_concurrency=max_concurrency,
+                                       json_loads=json_loads,
+                                       connections=connections,
+                                       connections_per_host=connections_per_host,
+                                       dns_ttl=dns_ttl,
+                                       keepalive_timeout=keepalive_timeout,
+                                       timeout=timeout,
+                                       connect_timeout=connect_timeout,
                                        loop=self._loop)
 
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the client's session and its pooled connections"""
+        await self._http_client.close()
+
     @property
     def key(self) -> str:
         return self._key
 
+    @property
+    def cache(self) -> Union[BaseCache, None]:
+        return self._http_client.cache
+
     @key.setter
     def key(self, new_key: str) -> None:
         self._key = new_key
@@ -53,6 +171,8 @@ class Client(object):
                 raise ValueError("Date of type str must be formatted in "
                                  "YYYY-MM-DD form")
         else:
+            if isinstance(dates, dict):
+                dates = dates.values()
             for date in dates:
                 if isinstance(date, str) and not re.match(_DATE_RX, date):
                     raise ValueError("Dates of type str must be formatted in "
@@ -73,66 +193,281 @@ class Client(object):
         }
         return await self._http_client.request(route='apod', method="GET", **options)
 
+    def _neo_windows(self, start_date: Union[datetime.datetime, str],
+                     end_date: Union[datetime.datetime, str]) -> List[Tuple[datetime.date, datetime.date]]:
+        start, end = _to_date(start_date), _to_date(end_date)
+        if end < start:
+            raise VoyagerException("The end date must not be before the start date")
+        windows = []
+        while start <= end:
+            stop = min(end, start + datetime.timedelta(days=_NEO_FEED_DAYS - 1))
+            windows.append((start, stop))
+            start = stop + datetime.timedelta(days=1)
+        return windows
+
     async def neo_feed(self, start_date: Union[datetime.datetime, str, None] = None,
                        end_date: Union[datetime.datetime, str, None] = None) -> NEOResource:
-        if not (start_date or end_date):
-            ret = await self._http_client.request(
-                route="neo",
-                method="GET",
-                search_type="feed-none"
-            )
-        else:
-            dates = {}
-            if start_date:
-                dates['start_date'] = start_date
-            if end_date:
-                dates['end_date'] = end_date
-            self._validate_dates(dates)
-            ret = await self._http_client.request(
-                route="neo",
+        """Returns the near earth objects with a close approach between two dates.
+        Ranges longer than the 7 days the API allows are split into 7 day windows
+        that are fetched concurrently and merged into one resource. A merged
+        resource has no ``query_url`` or ``links``, as no single request
+        covers the whole range
+
+        :param start_date: the first date of the range, defaults to the current date
+        :type start_date: Union[datetime.datetime, str, None], optional
+        :param end_date: the last date of the range, defaults to 7 days after start_date
+        :type end_date: Union[datetime.datetime, str, None], optional
+        :raises HTTPException: a window of a split range was answered with an
+            error, in which case the other windows are cancelled
+        """
+        dates = {}
+        if start_date:
+            dates['start_date'] = start_date
+        if end_date:
+            dates['end_date'] = end_date
+        self._validate_dates(dates)
+        if not (start_date and end_date) or len(windows := self._neo_windows(start_date, end_date)) == 1:
+            return await self._http_client.request(
+                route="neo-feed",
                 method="GET",
-                search_type="feed-query",
                 **dates,
             )
-        return ret
+        async def fetch(start: datetime.date, end: datetime.date) -> NEOResource:
+            return _checked(await self._http_client.request(
+                route="neo-feed", method="GET", start_date=start, end_date=end,
+            ))
+
+        results = await _gather_or_cancel([
+            asyncio.create_task(fetch(start, end)) for start, end in windows
+        ])
+        merged = {
+            key: value for key, value in results[0].to_dict.items()
+            if key not in ["query_url", "links"]
+        }
+        merged['element_count'] = sum(res.element_count or 0 for res in results)
+        merged['near_earth_objects'] = {
+            date: objects for res in results
+            for date, objects in res.to_dict.get("near_earth_objects", {}).items()
+        }
+        return NEOResource(merged, loop=self._loop)
+
+    async def neo_feed_iter(self, start_date: Union[datetime.datetime, str],
+                            end_date: Union[datetime.datetime, str]) -> AsyncIterator[NEOResource]:
+        """Fetches the near earth object feed between two dates in concurrent
+        7 day windows and yields each window as soon as it arrives
+
+        :param start_date: the first date of the range
+        :type start_date: Union[datetime.datetime, str]
+        :param end_date: the last date of the range
+        :type end_date: Union[datetime.datetime, str]
+        :raises HTTPException: a window was answered with an error
+        """
+        self._validate_dates([start_date, end_date])
+        tasks = [
+            asyncio.create_task(self._http_client.request(
+                route="neo-feed", method="GET", start_date=start, end_date=end,
+            ))
+            for start, end in self._neo_windows(start_date, end_date)
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield _checked(await task)
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def neo_lookup(self, asteroid_id) -> NEOResource:
         return await self._http_client.request(
-            route="neo",
+            route="neo-lookup",
             method="GET",
-            search_type="lookup",
-            url=f"{BASE_URL}/neo/rest/v1/neo/{asteroid_id}?api_key={self._key}"
+            asteroid_id=asteroid_id,
         )
 
-    async def neo_browse(self) -> NEOResource:
+    async def neo_browse(self, page: int = None, size: int = None) -> NEOResource:
+        """Returns one page of the near earth object catalogue
+
+        :param page: the zero-based number of the page, defaults to the first page
+        :type page: int, optional
+        :param size: the number of objects per page, defaults to 20
+        :type size: int, optional
+        """
         return await self._http_client.request(
-            route="neo",
+            route="neo-browse",
             method="GET",
-            search_type="browse",
-            url=f"{BASE_URL}/neo/rest/v1/neo/browse?api_key={self._key}"
+            page=page,
+            size=size,
+        )
+
+    async def _neo_browse_page(self, page: int, size: int = None) -> NEOResource:
+        return _checked(await self.neo_browse(page=page, size=size))
+
+    async def neo_browse_all(self, concurrency: int = 4,
+                             size: int = None) -> AsyncIterator[NEOObject]:
+        """Walks the whole near earth object catalogue. The first page gives
+        the number of pages, the rest are fetched ``concurrency`` at a time
+        and their objects are yielded as soon as each page arrives, so pages
+        may complete out of order. If a page fails, the pages that finished
+        with it are yielded before its exception is raised
+
+        :param concurrency: the number of pages fetched at once, defaults to 4
+        :type concurrency: int, optional
+        :param size: the number of objects per page, defaults to 20
+        :type size: int, optional
+        :raises HTTPException: a page was answered with an error
+        """
+        if concurrency < 1:
+            raise VoyagerException("The concurrency must be at least 1")
+        first = await self._neo_browse_page(0, size=size)
+        for neo in first:
+            yield neo
+        pages = iter(range(1, first.page.total_pages or 1))
+        pending = set()
+        try:
+            while True:
+                for page in pages:
+                    pending.add(asyncio.create_task(self._neo_browse_page(page, size=size)))
+                    if len(pending) >= concurrency:
+                        break
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Every finished page is collected before any is yielded, so
+                # one failed page neither drops the others nor leaves their
+                # exceptions unretrieved
+                results, error = [], None
+                for task in done:
+                    if (exc := task.exception()) is not None:
+                        error = error or exc
+                    else:
+                        results.append(task.result())
+                for result in results:
+                    for neo in result:
+                        yield neo
+                if error is not None:
+                    raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def epic(self, date: Union[datetime.datetime, str] = None,
+                   collection: str = "natural") -> List[EPICResource]:
+        """Returns the metadata of the EPIC images taken on a date
+
+        :param date: the date the images were taken, defaults to the most recent date
+        :type date: Union[datetime.datetime, str], optional
+        :param collection: one of "natural" or "enhanced", defaults to "natural"
+        :type collection: str, optional
+        """
+        if collection not in MODES:
+            raise VoyagerException(f"{collection} is not a valid collection")
+        if date is None:
+            return await self._http_client.request(
+                route="epic", method="GET", collection=collection,
+            )
+        self._validate_dates([date])
+        return await self._http_client.request(
+            route="epic-date", method="GET", collection=collection,
+            date=_to_date(date).isoformat(),
+        )
+
+    def _validate_epic_options(self, formats: Iterable[str],
+                               modes: Iterable[str]) -> Tuple[List[str], List[str]]:
+        formats, modes = [fmt.lower() for fmt in formats], [md.lower() for md in modes]
+        for fmt in formats:
+            if fmt not in FORMATS:
+                raise VoyagerException(f"{fmt} is not a supported image format")
+        for md in modes:
+            if md not in MODES:
+                raise VoyagerException(f"{md} is not a valid mode")
+        return formats, modes
+
+    async def epic_download(self, images: Union[datetime.datetime, str, Iterable[EPICResource]],
+                            store: Union[FileStore, str] = "voyager.files",
+                            formats: Iterable[str] = ("png",),
+                            modes: Iterable[str] = ("natural",),
+                            concurrency: int = 8,
+                            memoryviews: bool = False) -> Dict[Tuple[str, str, str], Union[str, memoryview]]:
+        """Downloads EPIC images to a content-addressed store on disk. Files
+        are streamed to disk as they arrive and images already in the store
+        are not downloaded again, so an interrupted download can be resumed
+        by calling this again
+
+        :param images: a date to download every image of, or the images to download
+        :type images: Union[datetime.datetime, str, Iterable[EPICResource]]
+        :param store: the store or the directory of the store, defaults to "voyager.files"
+        :type store: Union[FileStore, str], optional
+        :param formats: any of "png", "jpg" and "thumb", defaults to ("png",)
+        :type formats: Iterable[str], optional
+        :param modes: any of "natural" and "enhanced", defaults to ("natural",)
+        :type modes: Iterable[str], optional
+        :param concurrency: the number of images downloaded at once, defaults to 8
+        :type concurrency: int, optional
+        :param memoryviews: whether to return read-only memory maps of the
+            files instead of their paths, defaults to False
+        :type memoryviews: bool, optional
+        :return: the path or memoryview of each image, keyed by its
+            ``(identifier, mode, format)``
+        :raises VoyagerException: a format or mode is not supported
+        :raises HTTPException: an image couldn't be downloaded, in which case
+            the other downloads are cancelled
+        :rtype: Dict[Tuple[str, str, str], Union[str, memoryview]]
+        """
+        formats, modes = self._validate_epic_options(formats, modes)
+        if concurrency < 1:
+            raise VoyagerException("The concurrency must be at least 1")
+        if not isinstance(store, FileStore):
+            store = FileStore(store)
+        if isinstance(images, (datetime.date, str)):
+            listings = await asyncio.gather(*[
+                self.epic(images, collection=mode) for mode in modes
+            ])
+            requests = [
+                (resource, mode) for mode, listing in zip(modes, listings)
+                for resource in listing
+            ]
+        else:
+            requests = [(resource, mode) for resource in images for mode in modes]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(url: str) -> str:
+            if (path := store.lookup(url)) is not None:
+                return path
+            async with semaphore:
+                return await store.store(url, self._http_client.stream(url))
+
+        keys, urls = [], []
+        for resource, mode in requests:
+            for fmt in formats:
+                keys.append((resource.identifier, mode, fmt))
+                urls.append(resource.image.url(format=fmt, mode=mode))
+        # Nothing is still writing to the store once an error is raised
+        paths = await _gather_or_cancel([asyncio.create_task(fetch(url)) for url in urls])
+        return {
+            key: store.open(path) if memoryviews else path
+            for key, path in zip(keys, paths)
+        }
+
+    async def _donki(self, route: str,
+                     start_date: Union[datetime.datetime, str] = None,
+                     end_date: Union[datetime.datetime, str] = None,
+                     **options) -> List[Any]:
+        dates = {}
+        if start_date:
+            dates['startDate'] = start_date
+        if end_date:
+            dates['endDate'] = end_date
+        self._validate_dates(dates)
+        return await self._http_client.request(
+            route=route,
+            method="GET",
+            **dates,
+            **options,
         )
 
     async def cme(self,
                   start_date: Union[datetime.datetime, str] = None,
                   end_date: Union[datetime.datetime, str] = None) -> List[CMEResource]:
-        if not (start_date or end_date):
-            ret = await self._http_client.request(
-                route="cme",
-                method="GET",
-            )
-        else:
-            dates = {}
-            if start_date:
-                dates['startDate'] = start_date
-            if end_date:
-                dates['endDate'] = end_date
-            self._validate_dates(dates)
-            ret = await self._http_client.request(
-                route="cme",
-                method="GET",
-                **dates,
-            )
-        return ret
+        return await self._donki("cme", start_date, end_date)
 
     def _validate_cme_catalog(self, catalog: str) -> None:
         if not catalog.upper() in ["ALL", "SWRC_CATALOG", "JANG_ET_AL_CATALOG"]:
@@ -148,55 +483,206 @@ class Client(object):
                            catalog: str = "ALL",
                            keyword: str = "NONE") -> List[CMEAnalysisResource]:
         self._validate_cme_catalog(catalog)
-        if not (start_date or end_date):
-            ret = await self._http_client.request(
-                route="cme-a",
-                method="GET",
-                mostAccuraetOnly=most_accurate_only,
-                completeEntryOnly=complete_entry_only,
-                speed=speed,
-                halfAngle=half_angle,
-                catalog=catalog,
-                keyword=keyword,
-            )
-        else:
-            dates = {}
-            if start_date:
-                dates['startDate'] = start_date
-            if end_date:
-                dates['endDate'] = end_date
-            self._validate_dates(dates)
-            ret = await self._http_client.request(
-                route="cme-a",
-                method="GET",
-                **dates,
-                mostAccuraetOnly=most_accurate_only,
-                completeEntryOnly=complete_entry_only,
-                speed=speed,
-                halfAngle=half_angle,
-                catalog=catalog,
-                keyword=keyword,
-            )
-        return ret
+        return await self._donki(
+            "cme-a",
+            start_date,
+            end_date,
+            mostAccurateOnly=most_accurate_only,
+            completeEntryOnly=complete_entry_only,
+            speed=speed,
+            halfAngle=half_angle,
+            catalog=catalog,
+            keyword=keyword,
+        )
+
+    async def cme_analysis_index(self,
+                                 start_date: Union[datetime.datetime, str] = None,
+                                 end_date: Union[datetime.datetime, str] = None,
+                                 **filters) -> CMEAnalysisIndex:
+        """Fetches CME analyses with :meth:`cme_analysis`, passing the
+        filters on to the server, and indexes them for range queries on
+        speed, half angle and time21_5
+        """
+        return CMEAnalysisIndex(await self.cme_analysis(start_date, end_date, **filters))
 
     async def gst(self,
                   start_date: Union[datetime.datetime, str] = None,
                   end_date: Union[datetime.datetime, str] = None) -> List[GSTResource]:
-        if not (start_date or end_date):
-            ret = await self._http_client.request(
-                route="gst",
-                method="GET",
-            )
-        else:
-            dates = {}
-            if start_date:
-                dates['startDate'] = start_date
-            if end_date:
-                dates['endDate'] = end_date
-            self._validate_dates(dates)
-            ret = await self._http_client.request(
-                route="gst",
-                method="GET",
-                **dates,
-            )
-        return ret
+        return await self._donki("gst", start_date, end_date)
+
+    async def ips(self,
+                  start_date: Union[datetime.datetime, str] = None,
+                  end_date: Union[datetime.datetime, str] = None,
+                  location: str = "ALL",
+                  catalog: str = "ALL") -> List[IPSResource]:
+        return await self._donki("ips", start_date, end_date,
+                                 location=location, catalog=catalog)
+
+    async def flr(self,
+                  start_date: Union[datetime.datetime, str] = None,
+                  end_date: Union[datetime.datetime, str] = None) -> List[FLRResource]:
+        return await self._donki("flr", start_date, end_date)
+
+    async def sep(self,
+                  start_date: Union[datetime.datetime, str] = None,
+                  end_date: Union[datetime.datetime, str] = None) -> List[SEPResource]:
+        return await self._donki("sep", start_date, end_date)
+
+    async def mpc(self,
+                  start_date: Union[datetime.datetime, str] = None,
+                  end_date: Union[datetime.datetime, str] = None) -> List[MPCResource]:
+        return await self._donki("mpc", start_date, end_date)
+
+    async def rbe(self,
+                  start_date: Union[datetime.datetime, str] = None,
+                  end_date: Union[datetime.datetime, str] = None) -> List[RBEResource]:
+        return await self._donki("rbe", start_date, end_date)
+
+    async def hss(self,
+                  start_date: Union[datetime.datetime, str] = None,
+                  end_date: Union[datetime.datetime, str] = None) -> List[HSSResource]:
+        return await self._donki("hss", start_date, end_date)
+
+    async def wsa_enlil(self,
+                        start_date: Union[datetime.datetime, str] = None,
+                        end_date: Union[datetime.datetime, str] = None) -> List[WSAResource]:
+        return await self._donki("wsa-enlil", start_date, end_date)
+
+    async def donki_graph(self,
+                          start_date: Union[datetime.datetime, str] = None,
+                          end_date: Union[datetime.datetime, str] = None,
+                          types: Iterable[str] = None) -> DonkiGraph:
+        """Fetches the events of every DONKI route for one date window
+        concurrently and links them into a graph
+
+        :param start_date: the first date of the window, defaults to 30 days before end_date
+        :type start_date: Union[datetime.datetime, str], optional
+        :param end_date: the last date of the window, defaults to the current date
+        :type end_date: Union[datetime.datetime, str], optional
+        :param types: the routes to fetch, such as "cme" or "gst", defaults to every event route
+        :type types: Iterable[str], optional
+        :rtype: DonkiGraph
+        """
+        types = list(types if types is not None else EVENT_KEYS)
+        for route in types:
+            if route not in EVENT_KEYS:
+                raise VoyagerException(f"{route} is not a DONKI event route")
+        results = await asyncio.gather(*[
+            self._donki(route, start_date, end_date) for route in types
+        ])
+        return DonkiGraph(dict(zip(types, results)))
+
+    async def donki_sync(self, sync: Union[DonkiSync, str] = "voyager.sync.json",
+                         routes: Iterable[str] = ("cme", "gst", "flr", "wsa-enlil")) -> Dict[str, list]:
+        """Polls DONKI routes incrementally. Each route is requested from
+        shortly before its high-water mark only, and only the events that
+        are new or that changed since the last poll are returned. The
+        routes are polled concurrently, bypassing fresh cache entries, and
+        the state is saved afterwards
+
+        :param sync: the sync state or the path of its file, defaults to "voyager.sync.json"
+        :type sync: Union[DonkiSync, str], optional
+        :param routes: the routes to poll, defaults to ("cme", "gst", "flr", "wsa-enlil")
+        :type routes: Iterable[str], optional
+        :return: the new or changed events of each route
+        :rtype: Dict[str, list]
+        """
+        if not isinstance(sync, DonkiSync):
+            sync = DonkiSync(sync)
+        routes = list(routes)
+        for route in routes:
+            if route not in EVENT_KEYS:
+                raise VoyagerException(f"{route} is not a DONKI event route")
+        results = await asyncio.gather(*[
+            self._donki(route, sync.window(route), revalidate=True) for route in routes
+        ])
+        changes = {
+            route: sync.update(route, resources)
+            for route, resources in zip(routes, results)
+        }
+        sync.save()
+        return changes
+
+    async def notifications(self,
+                            start_date: Union[datetime.datetime, str] = None,
+                            end_date: Union[datetime.datetime, str] = None,
+                            type: str = "all") -> List[NotificationResource]:
+        if type not in _NOTIFICATION_TYPES:
+            raise VoyagerException(f"{type} is not a valid notification type")
+        return await self._donki("notifications", start_date, end_date, type=type)
+
+    async def watch_notifications(self, types: Union[str, Iterable[str]] = "all",
+                                  interval: float = 30.0,
+                                  max_interval: float = 300.0,
+                                  backlog: bool = False,
+                                  seen_size: int = 1024) -> AsyncIterator[NotificationResource]:
+        """Follows the DONKI notifications and yields each new notification,
+        oldest first, as soon as a poll finds it. Polls are conditional
+        requests when a response cache is configured, so unchanged polls
+        cost a 304. The delay between polls starts at ``interval``, grows
+        while nothing new is published and drops back to ``interval`` when
+        a notification arrives. Polls that fail with an error the client's
+        retry policy considers transient back off the same way
+
+        :param types: one or more notification types, such as "CME" or "GST",
+            defaults to "all"
+        :type types: Union[str, Iterable[str]], optional
+        :param interval: the shortest number of seconds between polls, defaults to 30.0
+        :type interval: float, optional
+        :param max_interval: the longest number of seconds between polls, defaults to 300.0
+        :type max_interval: float, optional
+        :param backlog: whether to yield the notifications of the past day
+            found by the first poll, defaults to False
+        :type backlog: bool, optional
+        :param seen_size: the number of notification IDs remembered to drop
+            duplicates besides those of the last poll, which are always kept,
+            defaults to 1024
+        :type seen_size: int, optional
+        """
+        types = [types] if isinstance(types, str) else list(types)
+        known = {kind.casefold(): kind for kind in _NOTIFICATION_TYPES}
+        for kind in types:
+            if kind.casefold() not in known:
+                raise VoyagerException(f"{kind} is not a valid notification type")
+        # The API reports types such as "Report", so filters ignore case
+        types = [known[kind.casefold()] for kind in types]
+        query = types[0] if len(types) == 1 else "all"
+        wanted = None if "all" in types else {kind.casefold() for kind in types}
+        seen = collections.OrderedDict()
+        delay, first = interval, True
+        policy = self._http_client.retry_policy
+        while True:
+            start = datetime.datetime.now(datetime.timezone.utc).date() - datetime.timedelta(days=1)
+            found = []
+            try:
+                polled = await self.notifications(start_date=start, type=query)
+            except Exception as e:
+                # A poll that fails once its retries are spent is treated
+                # like a quiet poll, so an outage only slows the watcher down
+                if not (isinstance(e, RateLimitException)
+                        or (isinstance(e, HTTPException) and policy.retries_status(e.code))
+                        or policy.retries_exception(e)):
+                    raise
+                delay = min(max_interval, delay * 1.5)
+                await asyncio.sleep(delay)
+                continue
+            for notification in polled:
+                if notification.id in seen:
+                    seen.move_to_end(notification.id)
+                    continue
+                seen[notification.id] = None
+                if wanted is None or (notification.type or "").casefold() in wanted:
+                    found.append(notification)
+            # IDs of this poll can come back in the next one, so they sit at
+            # the newest end and only older IDs are evicted
+            while len(seen) > max(seen_size, len(polled)):
+                seen.popitem(last=False)
+            if found and (backlog or not first):
+                found.sort(key=lambda notification: notification.timestamp or "")
+                for notification in found:
+                    yield notification
+                delay = interval
+            elif not first:
+                delay = min(max_interval, delay * 1.5)
+            first = False
+            await asyncio.sleep(delay)